@@ -1,5 +1,36 @@
 import re
 import pandas as pd
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from .dedup import duplicate_mask, fuzzy_duplicate_mask
+from .missing import fill_missing
+
+TRUE_VALUES = ('true', 't', 'yes', 'y', '1')
+FALSE_VALUES = ('false', 'f', 'no', 'n', '0')
+
+
+def _to_boolean(values):
+    normalized = values.astype('string').str.strip().str.lower()
+    result = pd.Series(pd.NA, index=values.index, dtype='boolean')
+    result[normalized.isin(TRUE_VALUES).fillna(False)] = True
+    result[normalized.isin(FALSE_VALUES).fillna(False)] = False
+    return result
+
+
+def _to_numeric(values):
+    if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+        return values
+    return pd.to_numeric(values.astype('string').str.strip(), errors='coerce')
+
+
+COERCE_TYPES = ('numeric', 'boolean', 'datetime', 'category')
+
+SPLIT_TYPES = {
+    'int': lambda values: pd.to_numeric(values, errors='coerce').pipe(lambda v: v.where(v % 1 == 0)).astype('Int64'),
+    'float': lambda values: pd.to_numeric(values, errors='coerce').astype(float),
+    'str': lambda values: values.astype(object),
+    'category': lambda values: values.astype('category'),
+    'datetime': lambda values: pd.to_datetime(values, errors='coerce'),
+}
 
 class Standardizer:
     """
@@ -36,6 +67,53 @@ class Standardizer:
         self.data[column] = self.data[column].replace('[\\$,]', '', regex=True).astype(float)
         return self
 
+    def coerce_types(self, types, date_format=None, sample_size=20):
+        """
+        Coerce columns to numeric, boolean, datetime or category dtypes with vectorized parsers.
+
+        Values that cannot be parsed become missing instead of raising. Their count per column is
+        stored in `self.coercion_summary` and up to `sample_size` of them per column, with their row
+        labels, in `self.coercion_errors`.
+
+        Args:
+            types (dict): Column name to 'numeric', 'boolean', 'datetime' or 'category'.
+            date_format (str, optional): Explicit format for datetime columns; inferred if omitted.
+            sample_size (int, optional): Invalid values to keep per column. Defaults to 20.
+
+        Returns:
+            self: Data with the coerced columns.
+
+        Raises:
+            ColumnNotFoundError: If a column does not exist.
+            DataValidationError: If a type is not supported.
+        """
+        coercers = {
+            'numeric': _to_numeric,
+            'boolean': _to_boolean,
+            'datetime': lambda values: pd.to_datetime(values, errors='coerce', format=date_format),
+            'category': lambda values: values.astype('category'),
+        }
+        self.coercion_summary = {}
+        samples = []
+        for column, type_name in types.items():
+            if column not in self.data.columns:
+                raise ColumnNotFoundError(column)
+            if type_name not in coercers:
+                raise DataValidationError(f"Unsupported type '{type_name}'. Choose from: {', '.join(COERCE_TYPES)}.")
+
+            original = self.data[column]
+            converted = coercers[type_name](original)
+            invalid = original.notna().to_numpy() & converted.isna().to_numpy()
+            self.coercion_summary[column] = int(invalid.sum())
+            if invalid.any():
+                sample = original[invalid].head(sample_size)
+                samples.append(pd.DataFrame({'column': column, 'type': type_name, 'row': sample.index, 'value': sample.to_numpy()}))
+            self.data[column] = converted
+
+        self.coercion_errors = (pd.concat(samples, ignore_index=True) if samples
+                                else pd.DataFrame(columns=['column', 'type', 'row', 'value']))
+        return self
+
 
 class Basic_Cleaner:
     """
@@ -51,26 +129,52 @@ class Basic_Cleaner:
         Returns:
             self: Data with trimmed string values.
         """
-        self.data = self.data.apply(lambda col: col.str.strip() if col.dtype == 'object' else col)
+        # Arrow-backed inputs (e.g. Feather files) have 'string' columns rather than 'object' ones.
+        columns = self.data.select_dtypes(include=['object', 'string']).columns
+        self.data[columns] = self.data[columns].apply(lambda col: col.str.strip())
         return self
 
-    def handle_missing_values(self, method='drop', fill_value=None):
+    def handle_missing_values(self, method='drop', fill_value=None, strategies=None, subset=None, thresh=None,
+                              group_by=None, statistics=None):
         """
         Handle missing values in the data.
 
         Args:
             method (str, optional): The method to handle missing values ('drop' or 'fill'). Defaults to 'drop'.
-            fill_value (any, optional): The value to fill missing data with if 'fill' is chosen.
+            fill_value (any, optional): The value to fill missing data with if 'fill' is chosen. It is converted
+                to each column's dtype, so filling a numeric column with '0' keeps it numeric.
+            strategies (dict, optional): Per-column fill strategy for 'fill': 'mean', 'median', 'mode',
+                'ffill', 'bfill' or a constant value. Columns not listed are filled with `fill_value`.
+            subset (list, optional): For 'drop', only consider these columns; for 'fill', only fill these columns.
+            thresh (int, optional): For 'drop', keep rows with at least this many non-missing values.
+            group_by (list, optional): For 'fill', compute statistics and forward/backward fills within groups.
+            statistics (dict, optional): Precomputed fill values, e.g. from `scan_fill_statistics` in streaming mode.
 
         Returns:
             self: Data with missing values handled.
+
+        Raises:
+            ColumnNotFoundError: If a column does not exist.
+            DataValidationError: If a mean or median is requested for a non-numeric column.
         """
         if method == 'drop':
-            self.data = self.data.dropna()
-        elif method == 'fill' and fill_value is not None:
-            self.data = self.data.fillna(fill_value)
+            self._check_columns(subset or [])
+            options = {'thresh': thresh} if thresh else {}
+            self.data = self.data.dropna(subset=subset or None, **options)
+        elif method == 'fill':
+            strategies = dict(strategies or {})
+            if fill_value is not None:
+                for column in subset or self.data.columns:
+                    strategies.setdefault(column, fill_value)
+            if strategies:
+                self.data = fill_missing(self.data, strategies, group_by=group_by, statistics=statistics)
         return self
 
+    def _check_columns(self, columns):
+        for column in columns:
+            if column not in self.data.columns:
+                raise ColumnNotFoundError(column)
+
     def apply_regex_cleaning(self, column, pattern, replacement):
         """
         Apply regex cleaning to a specified column.
@@ -86,6 +190,42 @@ class Basic_Cleaner:
         self.data[column] = self.data[column].replace(pattern, replacement, regex=True)
         return self
 
+    def remove_duplicates(self, subset=None, keep='first'):
+        """
+        Remove exact duplicate rows, comparing vectorized row hashes.
+
+        Args:
+            subset (list, optional): Columns that identify a duplicate. Defaults to all columns.
+            keep (str or bool, optional): Which copy to keep: 'first', 'last' or False for none. Defaults to 'first'.
+
+        Returns:
+            self: Data without duplicate rows.
+        """
+        self.data = self.data[~duplicate_mask(self.data, subset=subset, keep=keep)]
+        return self
+
+    def remove_fuzzy_duplicates(self, columns, threshold=0.8, ngram=3, block_prefix=2, window=5):
+        """
+        Remove near-duplicate rows whose text in `columns` is similar, keeping the first of each group.
+
+        Candidate pairs come from blocking keys and a sorted-neighbourhood window, so rows are never
+        compared all-pairs. See `fuzzy_duplicate_mask` for the details.
+
+        Args:
+            columns (list): Columns whose combined text is compared.
+            threshold (float, optional): Minimum Jaccard similarity of character n-grams. Defaults to 0.8.
+            ngram (int, optional): Character n-gram length. Defaults to 3.
+            block_prefix (int, optional): Length of the prefix blocking key. Defaults to 2.
+            window (int, optional): How many sorted neighbours each row is compared with. Defaults to 5.
+
+        Returns:
+            self: Data without fuzzy duplicate rows.
+        """
+        mask = fuzzy_duplicate_mask(self.data, columns, threshold=threshold, ngram=ngram,
+                                    block_prefix=block_prefix, window=window)
+        self.data = self.data[~mask]
+        return self
+
 
 class TextOperations:
     """
@@ -107,7 +247,7 @@ class TextOperations:
             self: Data with transformed text.
         """
         if columns is None:
-            columns = self.data.select_dtypes(include=['object']).columns
+            columns = self.data.select_dtypes(include=['object', 'string']).columns
 
         operations = {
             'lower': str.lower,
@@ -119,7 +259,75 @@ class TextOperations:
         func = operations.get(operation)
         if func:
             for col in columns:
-                self.data[col] = self.data[col].astype(str).apply(func)
+                values = self.data[col]
+                if values.dtype != object and pd.api.types.is_string_dtype(values.dtype):
+                    # String-dtype columns keep their dtype and missing values.
+                    self.data[col] = getattr(values.str, operation)()
+                else:
+                    self.data[col] = values.astype(str).apply(func)
+        return self
+
+    def split_column(self, column, into=None, names=None, delimiters=',;', pattern=None, types=None, drop=False):
+        """
+        Split a delimited text column (e.g. an address) into several columns with vectorized string operations.
+
+        All `delimiters` are normalized to one separator and surrounding whitespace is removed before
+        splitting, so '456; Elm St; Los Angeles, CA' becomes ['456', 'Elm St', 'Los Angeles', 'CA'].
+        Alternatively a regex `pattern` with named groups extracts the parts. The output always has
+        the same columns for the same arguments, so chunks of a large file split consistently.
+
+        Args:
+            column (str): The column to split.
+            into (int, optional): Number of output columns; extra parts stay joined in the last one.
+                Defaults to len(names), or to the most parts found in the data.
+            names (list, optional): Names of the output columns. Defaults to '<column>_1', '<column>_2', ...
+            delimiters (str, optional): Characters treated as delimiters. Defaults to ',;'.
+            pattern (str, optional): Regex with named groups to extract instead of splitting.
+            types (dict, optional): Output column name to 'int', 'float', 'str', 'category' or 'datetime'.
+            drop (bool, optional): Remove the original column. Defaults to False.
+
+        Returns:
+            self: Data with the split columns inserted after the original column.
+
+        Raises:
+            ColumnNotFoundError: If the column does not exist, or a `types` key is not an output column.
+            DataValidationError: If the number of names and columns disagree or a type is unknown.
+        """
+        if column not in self.data.columns:
+            raise ColumnNotFoundError(column)
+        text = self.data[column].astype('string').str.strip()
+
+        if pattern:
+            parts = text.str.extract(pattern, expand=True)
+            if names:
+                if len(names) != parts.shape[1]:
+                    raise DataValidationError(f"Expected {parts.shape[1]} column names, got {len(names)}.")
+                parts.columns = names
+        else:
+            separator = delimiters[0]
+            normalized = text.str.replace(f"\\s*[{re.escape(delimiters)}]\\s*", separator, regex=True)
+            into = into or (len(names) if names else None)
+            parts = normalized.str.split(separator, n=into - 1 if into else -1, expand=True)
+            width = into or parts.shape[1]
+            parts = parts.reindex(columns=range(width))
+            if names and len(names) != width:
+                raise DataValidationError(f"Expected {width} column names, got {len(names)}.")
+            parts.columns = names or [f"{column}_{i}" for i in range(1, width + 1)]
+            parts = parts.apply(lambda part: part.str.strip().replace('', pd.NA))
+        if self.data[column].dtype == object:
+            parts = parts.astype(object).where(parts.notna(), None)
+
+        for name, type_name in (types or {}).items():
+            if name not in parts.columns:
+                raise ColumnNotFoundError(name, f"Column '{name}' is not one of the split columns: {', '.join(map(str, parts.columns))}.")
+            if type_name not in SPLIT_TYPES:
+                raise DataValidationError(f"Unsupported type '{type_name}'. Choose from: {', '.join(SPLIT_TYPES)}.")
+            parts[name] = SPLIT_TYPES[type_name](parts[name])
+
+        position = self.data.columns.get_loc(column) + 1
+        self.data = pd.concat([self.data.iloc[:, :position], parts.set_axis(self.data.index), self.data.iloc[:, position:]], axis=1)
+        if drop:
+            self.data = self.data.drop(columns=[column])
         return self
 
 
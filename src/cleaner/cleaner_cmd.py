@@ -1,6 +1,12 @@
 import click
+from io import StringIO
 import pandas as pd
+from src.utils.loader import load_data
+from src.utils.streaming import run_chunked
+from src.utils.writers import write_csv
 from .cleaner import Standardizer, Basic_Cleaner, TextOperations
+from .dedup import dedupe_file
+from .missing import STATISTIC_STRATEGIES, scan_fill_statistics
 
 @click.group(
     help="""
@@ -8,12 +14,15 @@ from .cleaner import Standardizer, Basic_Cleaner, TextOperations
 
     This group provides commands for performing various data cleaning tasks, such as:
 
-    - **Handling Missing Values**: Remove or fill missing values in the dataset.\n
+    - **Handling Missing Values**: Drop rows by subset/threshold, or fill per column with mean, median, mode, forward/backward fill or constants.\n
     - **Trimming Whitespace**: Remove extra spaces from text columns.\n
     - **Applying Regex Patterns**: Search and replace text based on regular expressions.\n
     - **Changing Text Case**: Convert text columns to lower, upper, title, or capitalized case.\n
     - **Standardizing Currency**: Remove currency symbols and convert values to numeric format.\n
     - **Standardizing Date Formats**: Convert date columns to a specified format.\n
+    - **Coercing Types**: Convert columns to numeric, boolean, datetime or category, reporting unparsable values.\n
+    - **Splitting Columns**: Split delimited text such as addresses into several typed columns.\n
+    - **Removing Duplicates**: Drop exact duplicate rows (out-of-core for large files) or fuzzy near-duplicates.\n
 
     ### Examples:
 
@@ -24,72 +33,153 @@ from .cleaner import Standardizer, Basic_Cleaner, TextOperations
     2. **Handle Missing Values by Filling**:
     \b
     python cmd.py clean handle-missing-values input.csv --method 'fill' --fill_value 'N/A' --output 'filled_data.csv'
+
+    3. **Clean a Large File in Resumable Chunks**:
+    \b
+    python cmd.py clean standardize-date big.csv --column 'Join Date' --output 'clean.csv' --chunksize 500000
+    python cmd.py clean standardize-date big.csv --column 'Join Date' --output 'clean.csv' --chunksize 500000 --resume
     """
 )
 def cli():
     """A command-line interface for data cleaning using Standardizer, Basic_Cleaner, and TextOperations."""
     pass
 
+def chunk_options(command):
+    """Add the --chunksize and --resume options shared by the row-wise cleaning commands."""
+    command = click.option('--resume', is_flag=True, default=False,
+                           help='Continue a chunked run from its last checkpoint, or process only rows appended since it completed.')(command)
+    command = click.option('--chunksize', default=None, type=int,
+                           help='Process the input in chunks of this many rows, checkpointing after each chunk (requires --output).')(command)
+    return command
+
+def parse_mapping(text):
+    """
+    Parse a 'key:value,key:value' option into a dict.
+
+    Args:
+        text (str, optional): The option value.
+
+    Returns:
+        dict: The parsed mapping, empty if `text` is empty.
+    """
+    mapping = {}
+    for item in filter(None, (text or '').split(',')):
+        key, separator, value = item.rpartition(':')
+        if not separator:
+            raise click.BadParameter(f"Expected 'name:value', got '{item}'.")
+        mapping[key.strip()] = value.strip()
+    return mapping
+
+def run_cleaning(input_file, output, clean, step_spec, chunksize=None, resume=False, state=None):
+    """
+    Run a cleaning function over the whole input, or chunk by chunk with checkpoints.
+
+    Args:
+        input_file (str): The input file path.
+        output (str, optional): Path to save the cleaned data. The head is printed if omitted.
+        clean (callable): Function taking and returning a DataFrame.
+        step_spec (dict): Description of the cleaning step, used to validate resumed runs.
+        chunksize (int, optional): Rows per chunk for the resumable chunked path.
+        resume (bool, optional): Resume the chunked path from its checkpoint.
+        state (dict, optional): Values `clean` carries between chunks, saved in the checkpoint and restored on resume.
+    """
+    if chunksize:
+        if not output:
+            raise click.UsageError("--chunksize requires --output.")
+        stats = run_chunked(input_file, output, clean, step_spec, chunksize=chunksize, resume=resume, state=state)
+        print(f"Cleaned {stats['rows_this_run']} rows ({stats['rows_processed']} in total) and saved to {output}")
+        return
+    if resume:
+        raise click.UsageError("--resume requires --chunksize.")
+
+    cleaned_data = clean(load_data(input_file))
+    if output:
+        write_csv(cleaned_data, output)
+    else:
+        print(cleaned_data.head())
+
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
 @click.option('--column', help='The name of the date column to standardize.')
 @click.option('--date_format', default='%Y-%m-%d', help='The desired date format (default is %Y-%m-%d).')
 @click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
-def standardize_date(input_file, column, date_format, output):
+@chunk_options
+def standardize_date(input_file, column, date_format, output, chunksize, resume):
     """Standardize the format of a date column."""
-    data = pd.read_csv(input_file)
-    standardizer = Standardizer(data)
-    cleaned_data = standardizer.standardize_date(column=column, date_format=date_format).data
+    def clean(data):
+        return Standardizer(data).standardize_date(column=column, date_format=date_format).data
 
-    if output:
-        cleaned_data.to_csv(output, index=False)
-    else:
-        print(cleaned_data.head())
+    step_spec = {'step': 'standardize_date', 'column': column, 'date_format': date_format}
+    run_cleaning(input_file, output, clean, step_spec, chunksize, resume)
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
 @click.option('--column', help='The name of the currency column to standardize.')
 @click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
-def standardize_currency(input_file, column, output):
+@chunk_options
+def standardize_currency(input_file, column, output, chunksize, resume):
     """Standardize currency format by removing symbols and converting to float."""
-    data = pd.read_csv(input_file)
-    standardizer = Standardizer(data)
-    cleaned_data = standardizer.standardize_currency(column=column).data
+    def clean(data):
+        return Standardizer(data).standardize_currency(column=column).data
 
-    if output:
-        cleaned_data.to_csv(output, index=False)
-    else:
-        print(cleaned_data.head())
+    run_cleaning(input_file, output, clean, {'step': 'standardize_currency', 'column': column}, chunksize, resume)
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
 @click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
-def trim_spaces(input_file, output):
+@chunk_options
+def trim_spaces(input_file, output, chunksize, resume):
     """Trim extra spaces in all string columns."""
-    data = pd.read_csv(input_file)
-    cleaner = Basic_Cleaner(data)
-    cleaned_data = cleaner.trim_spaces().data
+    def clean(data):
+        return Basic_Cleaner(data).trim_spaces().data
 
-    if output:
-        cleaned_data.to_csv(output, index=False)
-    else:
-        print(cleaned_data.head())
+    run_cleaning(input_file, output, clean, {'step': 'trim_spaces'}, chunksize, resume)
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
 @click.option('--method', default='drop', type=click.Choice(['drop', 'fill']), help='Method to handle missing values (drop or fill).')
-@click.option('--fill_value', default=None, help='Value to fill missing values with if "fill" method is chosen.')
+@click.option('--fill_value', default=None, help='Value to fill missing values with if "fill" method is chosen, converted to each column\'s type.')
+@click.option('--strategies', default=None, help="Per-column fill strategies, e.g. 'Age:median,City:mode,Score:ffill,Status:Unknown' (mean, median, mode, ffill, bfill or a constant).")
+@click.option('--subset', default=None, help='Comma-separated columns: only these are checked when dropping, or filled with --fill_value.')
+@click.option('--thresh', default=None, type=int, help='When dropping, keep rows with at least this many non-missing values.')
+@click.option('--group_by', default=None, help='Comma-separated key columns: fill statistics and ffill/bfill are computed within each group.')
 @click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
-def handle_missing_values(input_file, method, fill_value, output):
-    """Handle missing values in the data."""
-    data = pd.read_csv(input_file)
-    cleaner = Basic_Cleaner(data)
-    cleaned_data = cleaner.handle_missing_values(method=method, fill_value=fill_value).data
+@chunk_options
+def handle_missing_values(input_file, method, fill_value, strategies, subset, thresh, group_by, output, chunksize, resume):
+    """Handle missing values in the data.
 
-    if output:
-        cleaned_data.to_csv(output, index=False)
-    else:
-        print(cleaned_data.head())
+    With --chunksize, means, medians and modes are computed by a first pass over the whole file
+    (medians from a quantile sketch) and forward fills carry the last value across chunks.
+    """
+    strategies_map = parse_mapping(strategies)
+    subset_columns = subset.split(',') if subset else None
+    group_columns = group_by.split(',') if group_by else None
+
+    statistics = None
+    # The rows carried into the next chunk's forward fill, as CSV text so they survive in the checkpoint.
+    state = {'carry': None}
+    if chunksize and method == 'fill':
+        if 'bfill' in strategies_map.values():
+            raise click.UsageError("The 'bfill' strategy needs the whole file and cannot be used with --chunksize.")
+        if any(strategy in STATISTIC_STRATEGIES for strategy in strategies_map.values()):
+            statistics = scan_fill_statistics(input_file, strategies_map, group_columns, chunksize)
+
+    def clean(data):
+        carried = pd.read_csv(StringIO(state['carry'])) if state['carry'] else data.iloc[:0]
+        if len(carried):
+            data = pd.concat([carried, data])
+        cleaned = Basic_Cleaner(data).handle_missing_values(
+            method=method, fill_value=fill_value, strategies=strategies_map, subset=subset_columns,
+            thresh=thresh, group_by=group_columns, statistics=statistics).data
+        if chunksize and 'ffill' in strategies_map.values():
+            # Keep the last row of each group so the next chunk's forward fill starts from it.
+            tail = cleaned.groupby(group_columns, sort=False, dropna=False).tail(1) if group_columns else cleaned.tail(1)
+            state['carry'] = tail.to_csv(index=False) if len(tail) else None
+        return cleaned.iloc[len(carried):]
+
+    step_spec = {'step': 'handle_missing_values', 'method': method, 'fill_value': fill_value, 'strategies': strategies_map,
+                 'subset': subset_columns, 'thresh': thresh, 'group_by': group_columns}
+    run_cleaning(input_file, output, clean, step_spec, chunksize, resume, state=state)
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
@@ -97,31 +187,134 @@ def handle_missing_values(input_file, method, fill_value, output):
 @click.option('--pattern', help='The regex pattern to search for.')
 @click.option('--replacement', help='The string to replace the pattern with.')
 @click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
-def apply_regex_cleaning(input_file, column, pattern, replacement, output):
+@chunk_options
+def apply_regex_cleaning(input_file, column, pattern, replacement, output, chunksize, resume):
     """Apply regex cleaning to a specified column."""
-    data = pd.read_csv(input_file)
-    cleaner = Basic_Cleaner(data)
-    cleaned_data = cleaner.apply_regex_cleaning(column=column, pattern=pattern, replacement=replacement).data
+    def clean(data):
+        return Basic_Cleaner(data).apply_regex_cleaning(column=column, pattern=pattern, replacement=replacement).data
 
-    if output:
-        cleaned_data.to_csv(output, index=False)
-    else:
-        print(cleaned_data.head())
+    step_spec = {'step': 'apply_regex_cleaning', 'column': column, 'pattern': pattern, 'replacement': replacement}
+    run_cleaning(input_file, output, clean, step_spec, chunksize, resume)
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
 @click.option('--columns', default=None, help='Comma-separated list of columns to apply the transformation. If None, all text columns are used.')
 @click.option('--operation', default='lower', type=click.Choice(['lower', 'upper', 'title', 'capitalize']), help='Case transformation operation.')
 @click.option('--output', default=None, type=click.Path(), help='Path to save the transformed data (optional).')
-def change_case(input_file, columns, operation, output):
+@chunk_options
+def change_case(input_file, columns, operation, output, chunksize, resume):
     """Change the case of text in specified columns."""
-    data = pd.read_csv(input_file)
     columns_list = columns.split(',') if columns else None
-    text_ops = TextOperations(data)
-    cleaned_data = text_ops.change_case(operation=operation, columns=columns_list).data
 
+    def clean(data):
+        return TextOperations(data).change_case(operation=operation, columns=columns_list).data
+
+    step_spec = {'step': 'change_case', 'operation': operation, 'columns': columns_list}
+    run_cleaning(input_file, output, clean, step_spec, chunksize, resume)
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--types', required=True, help="Column types, e.g. 'Age:numeric,Active:boolean,Joined:datetime,Region:category'.")
+@click.option('--date_format', default=None, help='Explicit format for datetime columns (inferred if omitted).')
+@click.option('--errors_output', default=None, type=click.Path(), help='Path to save a sample of unparsable values as CSV (optional).')
+@click.option('--sample_size', default=20, type=int, help='Unparsable values sampled per column (default 20).')
+@click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
+@chunk_options
+def coerce_types(input_file, types, date_format, errors_output, sample_size, output, chunksize, resume):
+    """Coerce columns to numeric, boolean, datetime or category types."""
+    types_map = parse_mapping(types)
+    # Failure counts and the sampled invalid values (as CSV text) are kept in the checkpoint, so a
+    # resumed run reports the same totals as an uninterrupted one.
+    state = {'summary': dict.fromkeys(types_map, 0), 'errors': None}
+
+    def sampled_errors():
+        return pd.read_csv(StringIO(state['errors']), dtype=str, keep_default_na=False) if state['errors'] else None
+
+    def clean(data):
+        standardizer = Standardizer(data).coerce_types(types_map, date_format=date_format, sample_size=sample_size)
+        for column, count in standardizer.coercion_summary.items():
+            state['summary'][column] += count
+        errors = pd.concat([sampled_errors(), standardizer.coercion_errors], ignore_index=True)
+        state['errors'] = errors.groupby('column', sort=False).head(sample_size).to_csv(index=False)
+        return standardizer.data
+
+    step_spec = {'step': 'coerce_types', 'types': types_map, 'date_format': date_format}
+    run_cleaning(input_file, output, clean, step_spec, chunksize, resume, state=state)
+
+    for column, count in state['summary'].items():
+        print(f"{column}: {count} invalid {types_map[column]} values")
+    if errors_output:
+        errors = sampled_errors()
+        write_csv(errors if errors is not None else pd.DataFrame(columns=['column', 'type', 'row', 'value']), errors_output)
+        print(f"Sample of invalid values saved to {errors_output}")
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--column', required=True, help='The delimited text column to split.')
+@click.option('--into', default=None, type=int, help='Number of output columns (extra parts stay in the last one).')
+@click.option('--names', default=None, help='Comma-separated names for the output columns.')
+@click.option('--delimiters', default=',;', help='Characters treated as delimiters (default ",;").')
+@click.option('--pattern', default=None, help='Regex with named groups to extract instead of splitting on delimiters.')
+@click.option('--types', default=None, help="Output column types, e.g. 'number:int,zip:str' (int, float, str, category, datetime).")
+@click.option('--drop', is_flag=True, default=False, help='Drop the original column.')
+@click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
+@chunk_options
+def split_column(input_file, column, into, names, delimiters, pattern, types, drop, output, chunksize, resume):
+    """Split a delimited text column into several columns."""
+    names_list = names.split(',') if names else None
+    types_map = parse_mapping(types)
+    if chunksize and not (into or names_list or pattern):
+        raise click.UsageError("--chunksize requires --into, --names or --pattern so every chunk has the same columns.")
+
+    def clean(data):
+        return TextOperations(data).split_column(column=column, into=into, names=names_list, delimiters=delimiters,
+                                                 pattern=pattern, types=types_map, drop=drop).data
+
+    step_spec = {'step': 'split_column', 'column': column, 'into': into, 'names': names_list, 'delimiters': delimiters,
+                 'pattern': pattern, 'types': types_map, 'drop': drop}
+    run_cleaning(input_file, output, clean, step_spec, chunksize, resume)
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--subset', default=None, help='Comma-separated list of columns that identify a duplicate (default: all columns).')
+@click.option('--keep', default='first', type=click.Choice(['first', 'last', 'none']), help='Which copy of a duplicate to keep.')
+@click.option('--output', default=None, type=click.Path(), help='Path to save the deduplicated data (optional).')
+@click.option('--chunksize', default=None, type=int, help='Deduplicate out-of-core in chunks of this many rows (requires --output).')
+@click.option('--partitions', default=64, type=int, help='Number of on-disk hash partitions used with --chunksize.')
+def remove_duplicates(input_file, subset, keep, output, chunksize, partitions):
+    """Remove exact duplicate rows using vectorized row hashing."""
+    subset_list = subset.split(',') if subset else None
+    keep_option = False if keep == 'none' else keep
+
+    if chunksize:
+        if not output:
+            raise click.UsageError("--chunksize requires --output.")
+        stats = dedupe_file(input_file, output, subset=subset_list, keep=keep_option,
+                            chunksize=chunksize, partitions=partitions)
+        print(f"Removed {stats['duplicates']} duplicate rows out of {stats['rows']} and saved to {output}")
+        return
+
+    cleaned_data = Basic_Cleaner(load_data(input_file)).remove_duplicates(subset=subset_list, keep=keep_option).data
+    if output:
+        write_csv(cleaned_data, output)
+    else:
+        print(cleaned_data.head())
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--columns', required=True, help='Comma-separated list of text columns to compare.')
+@click.option('--threshold', default=0.8, type=float, help='Minimum n-gram Jaccard similarity for two rows to match (default 0.8).')
+@click.option('--ngram', default=3, type=int, help='Character n-gram length (default 3).')
+@click.option('--block_prefix', default=2, type=int, help='Length of the prefix blocking key (default 2).')
+@click.option('--window', default=5, type=int, help='Number of sorted neighbours compared within a block (default 5).')
+@click.option('--output', default=None, type=click.Path(), help='Path to save the deduplicated data (optional).')
+def fuzzy_dedupe(input_file, columns, threshold, ngram, block_prefix, window, output):
+    """Remove near-duplicate rows based on text similarity in the chosen columns."""
+    cleaner = Basic_Cleaner(load_data(input_file))
+    cleaned_data = cleaner.remove_fuzzy_duplicates(columns=columns.split(','), threshold=threshold, ngram=ngram,
+                                                   block_prefix=block_prefix, window=window).data
     if output:
-        cleaned_data.to_csv(output, index=False)
+        write_csv(cleaned_data, output)
     else:
         print(cleaned_data.head())
 
@@ -134,6 +327,10 @@ cli.add_command(trim_spaces)
 cli.add_command(handle_missing_values)
 cli.add_command(apply_regex_cleaning)
 cli.add_command(change_case)
+cli.add_command(coerce_types)
+cli.add_command(split_column)
+cli.add_command(remove_duplicates)
+cli.add_command(fuzzy_dedupe)
 
 if __name__ == '__main__':
     cli()
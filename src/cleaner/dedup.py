@@ -0,0 +1,258 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from src.utils.writers import open_output
+
+# Two independent 64-bit hashes per row make accidental collisions negligible even for billions of rows.
+# pandas only applies its hash key to text columns, so the second hash does not come from a second
+# key alone: it chains keyed per-column hashes through a splitmix64 mixer with a salt per column.
+HASH_KEYS = ('0123456789123456', 'tidydata-dedup-2')
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX_MULTIPLIERS = (np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB))
+HASH_RECORD = np.dtype([('h1', '<u8'), ('h2', '<u8'), ('row', '<i8')])
+KEEP_OPTIONS = ('first', 'last', False)
+
+
+def _check_columns(data, columns):
+    for column in columns or []:
+        if column not in data.columns:
+            raise ColumnNotFoundError(column)
+
+
+def hash_rows(data: pd.DataFrame, subset=None) -> pd.DataFrame:
+    """
+    Hash every row of a DataFrame into two independent vectorized 64-bit row hashes.
+
+    'h1' is pandas' row hash. 'h2' combines per-column hashes in a different way, so two rows that
+    collide in one hash are not expected to collide in the other, whatever the column types.
+
+    Args:
+        data (pd.DataFrame): The rows to hash.
+        subset (list, optional): Only hash these columns. Defaults to all columns.
+
+    Returns:
+        pd.DataFrame: Two uint64 columns, 'h1' and 'h2', aligned with `data`.
+
+    Raises:
+        ColumnNotFoundError: If a subset column does not exist.
+    """
+    _check_columns(data, subset)
+    frame = data[subset] if subset else data
+    h1 = pd.util.hash_pandas_object(frame, index=False, hash_key=HASH_KEYS[0]).to_numpy()
+    h2 = np.zeros(len(frame), dtype=np.uint64)
+    salts = np.arange(1, frame.shape[1] + 1, dtype=np.uint64) * _GOLDEN_GAMMA
+    for position, salt in enumerate(salts):
+        column_hash = pd.util.hash_pandas_object(frame.iloc[:, position], index=False, hash_key=HASH_KEYS[1]).to_numpy()
+        h2 = _mix(h2 ^ (column_hash + salt))
+    return pd.DataFrame({'h1': h1, 'h2': h2}, index=data.index)
+
+
+def _mix(values):
+    """The splitmix64 finalizer, a bijective mixer of 64-bit values."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * _MIX_MULTIPLIERS[0]
+    values = values ^ (values >> np.uint64(27))
+    values = values * _MIX_MULTIPLIERS[1]
+    return values ^ (values >> np.uint64(31))
+
+
+def duplicate_mask(data: pd.DataFrame, subset=None, keep='first') -> pd.Series:
+    """
+    Flag duplicate rows using row hashes instead of comparing column values.
+
+    Args:
+        data (pd.DataFrame): The rows to check.
+        subset (list, optional): Columns that identify a duplicate. Defaults to all columns.
+        keep (str or bool, optional): 'first', 'last' or False, as in `DataFrame.duplicated`.
+
+    Returns:
+        pd.Series: True for rows that are duplicates to be dropped.
+    """
+    if keep not in KEEP_OPTIONS:
+        raise DataValidationError("Parameter 'keep' must be 'first', 'last' or False.")
+    return hash_rows(data, subset).duplicated(keep=keep)
+
+
+def _mark_partition_duplicates(records, keep, drop):
+    if len(records) == 0:
+        return
+    row_order = records['row'] if keep != 'last' else -records['row']
+    records = records[np.lexsort((row_order, records['h2'], records['h1']))]
+    same_as_previous = np.zeros(len(records), dtype=bool)
+    same_as_previous[1:] = (records['h1'][1:] == records['h1'][:-1]) & (records['h2'][1:] == records['h2'][:-1])
+    if keep is False:
+        same_as_next = np.zeros(len(records), dtype=bool)
+        same_as_next[:-1] = same_as_previous[1:]
+        drop[records['row'][same_as_previous | same_as_next]] = True
+    else:
+        drop[records['row'][same_as_previous]] = True
+
+
+def dedupe_file(input_file, output, subset=None, keep='first', chunksize=100000, partitions=64, temp_dir=None):
+    """
+    Remove exact duplicate rows from a CSV file that may not fit in memory.
+
+    The file is read three times in chunks: row hashes are spilled to `partitions` files by hash
+    value, each partition is sorted to find duplicates (marking them in a one-byte-per-row memory
+    map), and the rows that survive are streamed to the output. Values are compared as the text
+    in the file and written back unchanged.
+
+    Args:
+        input_file (str): The CSV file to deduplicate.
+        output (str): The CSV file to write.
+        subset (list, optional): Columns that identify a duplicate. Defaults to all columns.
+        keep (str or bool, optional): 'first', 'last' or False (drop every copy). Defaults to 'first'.
+        chunksize (int, optional): Rows per chunk. Defaults to 100000.
+        partitions (int, optional): Number of hash partitions spilled to disk. Defaults to 64.
+        temp_dir (str, optional): Where to put the spill files. Defaults to the system temp directory.
+
+    Returns:
+        dict: 'rows' read and 'duplicates' removed.
+    """
+    if keep not in KEEP_OPTIONS:
+        raise DataValidationError("Parameter 'keep' must be 'first', 'last' or False.")
+    read_options = {'dtype': str, 'keep_default_na': False, 'chunksize': chunksize}
+    work_dir = tempfile.mkdtemp(prefix='tidydata-dedup-', dir=temp_dir)
+    try:
+        spill_files = [open(os.path.join(work_dir, f'part-{i}.bin'), 'wb') for i in range(partitions)]
+        rows = 0
+        try:
+            for chunk in pd.read_csv(input_file, **read_options):
+                hashes = hash_rows(chunk, subset)
+                records = np.empty(len(chunk), dtype=HASH_RECORD)
+                records['h1'], records['h2'] = hashes['h1'].to_numpy(), hashes['h2'].to_numpy()
+                records['row'] = np.arange(rows, rows + len(chunk))
+                partition_ids = records['h1'] % np.uint64(partitions)
+                for partition in np.unique(partition_ids):
+                    records[partition_ids == partition].tofile(spill_files[int(partition)])
+                rows += len(chunk)
+        finally:
+            for spill_file in spill_files:
+                spill_file.close()
+
+        drop = np.memmap(os.path.join(work_dir, 'drop.bin'), dtype=bool, mode='w+', shape=max(rows, 1))
+        for i in range(partitions):
+            _mark_partition_duplicates(np.fromfile(os.path.join(work_dir, f'part-{i}.bin'), dtype=HASH_RECORD), keep, drop)
+
+        start = 0
+        header = True
+        with open_output(output) as out:
+            for chunk in pd.read_csv(input_file, **read_options):
+                keep_rows = ~drop[start:start + len(chunk)]
+                chunk[keep_rows].to_csv(out, index=False, header=header)
+                header = False
+                start += len(chunk)
+            if header:
+                pd.read_csv(input_file, nrows=0).to_csv(out, index=False)
+        duplicates = int(drop[:rows].sum())
+        del drop
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return {'rows': rows, 'duplicates': duplicates}
+
+
+def normalize_text(values: pd.Series) -> pd.Series:
+    """
+    Normalize text for fuzzy matching: lowercase, punctuation removed, whitespace collapsed.
+
+    Args:
+        values (pd.Series): The text to normalize.
+
+    Returns:
+        pd.Series: The normalized strings, with missing values as empty strings.
+    """
+    return (values.fillna('').astype(str).str.lower()
+            .str.replace(r'[^\w\s]', ' ', regex=True)
+            .str.replace(r'\s+', ' ', regex=True)
+            .str.strip())
+
+
+def _ngrams(text, n):
+    padded = f" {text} "
+    return frozenset(padded[i:i + n] for i in range(max(len(padded) - n + 1, 1)))
+
+
+class _DisjointSet:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, item):
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, left, right):
+        left, right = self.find(left), self.find(right)
+        if left != right:
+            self.parent[max(left, right)] = min(left, right)
+
+
+def fuzzy_duplicate_mask(data: pd.DataFrame, columns, threshold=0.8, ngram=3, block_prefix=2, window=5) -> pd.Series:
+    """
+    Flag near-duplicate rows by character n-gram similarity without comparing all pairs.
+
+    Rows are blocked twice, on the first `block_prefix` characters of the normalized text and on
+    its alphabetically first token, and within each block only rows that are within `window`
+    positions of each other in sorted order are compared (sorted neighbourhood). Matches are
+    clustered transitively and the first row of every cluster is kept.
+
+    Args:
+        data (pd.DataFrame): The rows to check.
+        columns (list): Columns whose combined text is compared.
+        threshold (float, optional): Minimum Jaccard similarity of n-gram sets. Defaults to 0.8.
+        ngram (int, optional): Character n-gram length. Defaults to 3.
+        block_prefix (int, optional): Length of the prefix blocking key. Defaults to 2.
+        window (int, optional): How many sorted neighbours each row is compared with. Defaults to 5.
+
+    Returns:
+        pd.Series: True for rows that are fuzzy duplicates of an earlier row.
+
+    Raises:
+        ColumnNotFoundError: If a column does not exist.
+        DataValidationError: If no columns are given or the threshold is outside (0, 1].
+    """
+    if not columns:
+        raise DataValidationError("At least one column is required for fuzzy deduplication.")
+    if not 0 < threshold <= 1:
+        raise DataValidationError("Parameter 'threshold' must be in (0, 1].")
+    _check_columns(data, columns)
+
+    text = normalize_text(data[columns[0]])
+    for column in columns[1:]:
+        text = text + ' ' + normalize_text(data[column])
+    text = text.str.strip()
+    first_tokens = text.str.split().map(lambda tokens: min(tokens) if tokens else '')
+    blocking_keys = [text.str[:block_prefix].to_numpy(), first_tokens.to_numpy()]
+    sort_text = text.to_numpy()
+    text = text.tolist()
+
+    grams = [None] * len(text)
+    clusters = _DisjointSet(len(text))
+    for keys in blocking_keys:
+        order = np.lexsort((sort_text, keys))
+        sorted_keys = keys[order]
+        for distance in range(1, window + 1):
+            same_block = sorted_keys[distance:] == sorted_keys[:-distance]
+            left_rows, right_rows = order[:-distance][same_block].tolist(), order[distance:][same_block].tolist()
+            for left, right in zip(left_rows, right_rows):
+                if not text[left] or not text[right]:
+                    continue
+                if clusters.find(left) == clusters.find(right):
+                    continue
+                if grams[left] is None:
+                    grams[left] = _ngrams(text[left], ngram)
+                if grams[right] is None:
+                    grams[right] = _ngrams(text[right], ngram)
+                union = len(grams[left] | grams[right])
+                if union and len(grams[left] & grams[right]) / union >= threshold:
+                    clusters.union(left, right)
+
+    roots = np.array([clusters.find(i) for i in range(len(text))], dtype=np.int64)
+    return pd.Series(roots != np.arange(len(text)), index=data.index)
@@ -0,0 +1,234 @@
+import numpy as np
+import pandas as pd
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from src.utils.sketches import QuantileSketch
+
+STATISTIC_STRATEGIES = ('mean', 'median', 'mode')
+FILL_STRATEGIES = STATISTIC_STRATEGIES + ('ffill', 'bfill')
+
+
+def _check_columns(data, columns):
+    for column in columns or []:
+        if column not in data.columns:
+            raise ColumnNotFoundError(column)
+
+
+def _check_numeric(data, column, strategy):
+    if not pd.api.types.is_numeric_dtype(data[column].dtype) or pd.api.types.is_bool_dtype(data[column].dtype):
+        raise DataValidationError(f"Column '{column}' must be numeric to fill with its {strategy}.")
+
+
+def typed_fill_value(series: pd.Series, value):
+    """
+    Convert a fill value (usually a string from the command line) to the dtype of `series`.
+
+    Values that cannot be converted are returned unchanged, so filling still works but upcasts
+    the column as before.
+
+    Args:
+        series (pd.Series): The column to be filled.
+        value: The fill value.
+
+    Returns:
+        The converted fill value.
+    """
+    if not isinstance(value, str):
+        return value
+    dtype = series.dtype
+    try:
+        if pd.api.types.is_bool_dtype(dtype):
+            return {'true': True, 'false': False}.get(value.strip().lower(), value)
+        if pd.api.types.is_integer_dtype(dtype):
+            number = float(value)
+            return int(number) if number.is_integer() else number
+        if pd.api.types.is_numeric_dtype(dtype):
+            return float(value)
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return pd.Timestamp(value)
+    except ValueError:
+        pass
+    return value
+
+
+def _has_fraction(value):
+    try:
+        numbers = np.asarray(value, dtype=float).ravel()
+    except (TypeError, ValueError):
+        return False
+    numbers = numbers[~np.isnan(numbers)]
+    return bool(np.any(numbers % 1 != 0))
+
+
+def _group_index(data, group_by):
+    if len(group_by) == 1:
+        return pd.Index(data[group_by[0]])
+    return pd.MultiIndex.from_frame(data[group_by])
+
+
+def _group_modes(data, column, group_by):
+    counts = data.groupby(group_by + [column], observed=True).size()
+    return _top_counts(counts, column, group_by)
+
+
+def _top_counts(counts, column, group_by):
+    # Counts are sorted by value within each group, so a stable sort breaks ties towards the smallest value, like `mode`.
+    ranked = counts.rename('count').reset_index().sort_values('count', ascending=False, kind='stable')
+    return ranked.drop_duplicates(group_by).set_index(group_by)[column]
+
+
+def fill_statistics(data: pd.DataFrame, strategies: dict, group_by=None) -> dict:
+    """
+    Compute the mean, median and mode fill values needed by `strategies` in one pass per strategy.
+
+    Args:
+        data (pd.DataFrame): The data to compute statistics from.
+        strategies (dict): Column name to fill strategy. Only 'mean', 'median' and 'mode' need statistics.
+        group_by (list, optional): Key columns; statistics are then computed per group.
+
+    Returns:
+        dict: Column name to fill value, or to a Series of fill values indexed by group key.
+
+    Raises:
+        ColumnNotFoundError: If a column does not exist.
+        DataValidationError: If a mean or median is requested for a non-numeric column.
+    """
+    columns = {strategy: [column for column, name in strategies.items() if name == strategy]
+               for strategy in STATISTIC_STRATEGIES}
+    _check_columns(data, sum(columns.values(), []) + list(group_by or []))
+    for strategy in ('mean', 'median'):
+        for column in columns[strategy]:
+            _check_numeric(data, column, strategy)
+
+    statistics = {}
+    if group_by:
+        grouped = data.groupby(group_by, observed=True)
+        for strategy in ('mean', 'median'):
+            if columns[strategy]:
+                values = grouped[columns[strategy]].agg(strategy)
+                statistics.update({column: values[column] for column in columns[strategy]})
+        for column in columns['mode']:
+            statistics[column] = _group_modes(data, column, list(group_by))
+    else:
+        if columns['mean']:
+            statistics.update(data[columns['mean']].mean().to_dict())
+        if columns['median']:
+            statistics.update(data[columns['median']].median().to_dict())
+        if columns['mode']:
+            modes = data[columns['mode']].mode()
+            statistics.update({column: modes[column].iloc[0] if len(modes) else np.nan for column in columns['mode']})
+    return statistics
+
+
+def scan_fill_statistics(input_file, strategies: dict, group_by=None, chunksize=100000) -> dict:
+    """
+    Compute fill statistics for a CSV file that may not fit in memory, reading it once in chunks.
+
+    Means and modes are exact (sums, counts and value frequencies are merged across chunks);
+    medians are estimated with a mergeable quantile sketch and are exact for up to a few thousand
+    values per column or group.
+
+    Args:
+        input_file (str): The CSV file to scan.
+        strategies (dict): Column name to fill strategy.
+        group_by (list, optional): Key columns; statistics are then computed per group.
+        chunksize (int, optional): Rows per chunk. Defaults to 100000.
+
+    Returns:
+        dict: Column name to fill value, or to a Series of fill values indexed by group key,
+        in the same form as `fill_statistics`.
+    """
+    group_by = list(group_by or [])
+    columns = {strategy: [column for column, name in strategies.items() if name == strategy]
+               for strategy in STATISTIC_STRATEGIES}
+    sums, counts, frequencies, sketches = {}, {}, {}, {}
+
+    def accumulate(total, part):
+        return part if total is None else total.add(part, fill_value=0)
+
+    for chunk in pd.read_csv(input_file, chunksize=chunksize):
+        _check_columns(chunk, sum(columns.values(), []) + group_by)
+        for column in columns['mean'] + columns['median']:
+            chunk[column] = pd.to_numeric(chunk[column], errors='coerce')
+        keys = [chunk[key] for key in group_by] or [np.zeros(len(chunk), dtype=np.int8)]
+
+        if columns['mean']:
+            grouped = chunk[columns['mean']].groupby(keys, observed=True)
+            sums = {column: accumulate(sums.get(column), part) for column, part in grouped.sum().items()}
+            counts = {column: accumulate(counts.get(column), part) for column, part in grouped.count().items()}
+        for column in columns['mode']:
+            part = chunk[column].groupby(keys + [chunk[column]], observed=True).size()
+            frequencies[column] = accumulate(frequencies.get(column), part)
+        for column in columns['median']:
+            column_sketches = sketches.setdefault(column, {})
+            for key, values in chunk[column].groupby(keys, observed=True):
+                key = key[0] if len(keys) == 1 else key
+                column_sketches.setdefault(key, QuantileSketch()).update(values.to_numpy())
+
+    statistics = {}
+    for column in columns['mean']:
+        if column not in sums:
+            statistics[column] = pd.Series(dtype=float)
+            continue
+        statistics[column] = sums[column] / counts[column].replace(0, np.nan)
+    for column in columns['median']:
+        medians = sketches.get(column, {})
+        statistics[column] = pd.Series({key: sketch.quantile(0.5) for key, sketch in medians.items()}, dtype=float)
+    for column in columns['mode']:
+        if column not in frequencies:
+            statistics[column] = pd.Series(dtype=object)
+            continue
+        level_names = group_by or ['_all']
+        frequencies[column].index.names = level_names + [column]
+        statistics[column] = _top_counts(frequencies[column], column, level_names)
+
+    if not group_by:
+        return {column: values.iloc[0] if len(values) else np.nan for column, values in statistics.items()}
+    for column, values in statistics.items():
+        if len(group_by) > 1 and not isinstance(values.index, pd.MultiIndex):
+            values.index = pd.MultiIndex.from_tuples(values.index)
+        values.index.names = group_by
+    return statistics
+
+
+def fill_missing(data: pd.DataFrame, strategies: dict, group_by=None, statistics=None) -> pd.DataFrame:
+    """
+    Fill missing values column by column with typed fill values.
+
+    Args:
+        data (pd.DataFrame): The data to fill.
+        strategies (dict): Column name to 'mean', 'median', 'mode', 'ffill', 'bfill' or a constant value.
+        group_by (list, optional): Key columns; statistics and forward/backward fills then stay within each group.
+        statistics (dict, optional): Precomputed fill values, as returned by `fill_statistics` or
+            `scan_fill_statistics`. Computed from `data` if omitted.
+
+    Returns:
+        pd.DataFrame: The filled data.
+    """
+    group_by = list(group_by or [])
+    _check_columns(data, list(strategies) + group_by)
+    if statistics is None:
+        statistics = fill_statistics(data, strategies, group_by)
+
+    values = {}
+    for column, strategy in strategies.items():
+        if strategy in STATISTIC_STRATEGIES:
+            value = statistics[column]
+            if isinstance(value, pd.Series):
+                value = pd.Series(value.reindex(_group_index(data, group_by)).to_numpy(), index=data.index)
+            values[column] = value
+        elif strategy not in ('ffill', 'bfill'):
+            values[column] = typed_fill_value(data[column], strategy)
+
+    data = data.copy()
+    for column, value in values.items():
+        if pd.api.types.is_integer_dtype(data[column].dtype) and _has_fraction(value):
+            # A fractional mean or median does not fit a nullable integer column; widen it to floats.
+            data[column] = data[column].astype('Float64')
+        data[column] = data[column].fillna(value)
+
+    for method in ('ffill', 'bfill'):
+        columns = [column for column, strategy in strategies.items() if strategy == method]
+        if columns:
+            source = data.groupby(group_by, observed=True, sort=False, dropna=False)[columns] if group_by else data[columns]
+            data[columns] = getattr(source, method)()
+    return data
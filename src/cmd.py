@@ -3,6 +3,7 @@ from src.visualiser.visualiser_cmd import cli as visualizer_cli
 from src.cleaner.cleaner_cmd import cli as cleaner_cli
 from src.reporter.reporter_cmd import cli as report_cli
 from src.transformer.transformer_cmd import cli as transform_cli
+from src.server.server_cmd import serve, client
 
 
 @click.group(
@@ -16,11 +17,15 @@ from src.transformer.transformer_cmd import cli as transform_cli
     - **visualize**: Use this group for creating data visualizations such as bar charts, line charts, scatter plots, and word clouds.
     - **clean**: Use this group for performing data cleaning tasks, such as trimming spaces, handling missing values, and applying regex patterns.
     - **report**: Use this group for generating detailed data reports in PDF or TXT format, summarizing descriptive statistics, missing values, and correlations.
+    - **serve** / **client**: Keep a warm server process with cached datasets and send it commands, avoiding per-call startup.
 
     ### Usage:
 
     Use the `--help` flag with any command group or subcommand to get detailed usage information and options.
 
+    Output files are written atomically and compressed by extension (`.gz` for gzip, `.zst` for zstd).
+    Set `TIDYDATA_CSV_ENGINE=pyarrow` to encode large CSV outputs on several threads.
+
     \b
     python cmd.py visualize --help   # View commands for data visualization
     python cmd.py clean --help       # View commands for data cleaning
@@ -65,6 +70,8 @@ cli.add_command(visualizer_cli, name='visualize')
 cli.add_command(cleaner_cli, name='clean')
 cli.add_command(report_cli, name='report')
 cli.add_command(transform_cli, name='transform')
+cli.add_command(serve, name='serve')
+cli.add_command(client, name='client')
 
 if __name__ == '__main__':
     cli()
@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+
+PSI_EPSILON = 1e-4
+# Conventional PSI thresholds: below 0.1 the distribution is stable, above 0.25 it has shifted.
+PSI_MODERATE = 0.1
+PSI_MAJOR = 0.25
+
+
+def population_stability_index(expected, actual) -> float:
+    """
+    Population Stability Index between two binned distributions.
+
+    Args:
+        expected (array-like): Baseline proportion (or count) per bin.
+        actual (array-like): Current proportion (or count) per bin, for the same bins.
+
+    Returns:
+        float: sum((actual - expected) * ln(actual / expected)), with empty bins floored at 1e-4.
+    """
+    expected, actual = _proportions(expected), _proportions(actual)
+    expected, actual = np.maximum(expected, PSI_EPSILON), np.maximum(actual, PSI_EPSILON)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def ks_statistic(expected, actual) -> float:
+    """
+    Kolmogorov-Smirnov statistic between two binned distributions over ordered bins.
+
+    The statistic is evaluated at the bin edges, so it is a lower bound of the exact statistic.
+
+    Args:
+        expected (array-like): Baseline proportion (or count) per bin.
+        actual (array-like): Current proportion (or count) per bin, for the same bins.
+
+    Returns:
+        float: The largest gap between the two cumulative distributions.
+    """
+    return float(np.max(np.abs(np.cumsum(_proportions(expected)) - np.cumsum(_proportions(actual))), initial=0.0))
+
+
+def _proportions(counts):
+    counts = np.asarray(counts, dtype=np.float64)
+    total = counts.sum()
+    return counts / total if total else counts
+
+
+def shift_level(psi) -> str:
+    """Describe a PSI value as 'stable', 'moderate' or 'major'."""
+    if psi < PSI_MODERATE:
+        return 'stable'
+    return 'moderate' if psi < PSI_MAJOR else 'major'
+
+
+def numeric_bins(baseline, current, bins=10):
+    """
+    Bin two numeric columns on the baseline's quantiles.
+
+    The bins are equal-count for the baseline, with open outer bins so every current value falls
+    in one. Counts come from the columns' quantile sketches (uniform samples), so they are exact
+    for columns smaller than the sketch capacity and unbiased estimates beyond it.
+
+    Args:
+        baseline (ColumnAccumulator): The baseline column statistics.
+        current (ColumnAccumulator): The current column statistics.
+        bins (int, optional): The number of bins (default is 10).
+
+    Returns:
+        tuple: (baseline_counts, current_counts) per bin.
+    """
+    inner = np.unique(baseline.quantiles.quantile(np.linspace(0, 1, bins + 1)[1:-1]))
+    edges = np.concatenate([[-np.inf], inner, [np.inf]])
+    return (np.histogram(baseline.quantiles.values, bins=edges)[0],
+            np.histogram(current.quantiles.values, bins=edges)[0])
+
+
+def category_bins(baseline, current):
+    """
+    Frequencies of the most common categories of two columns, with the rest as one "other" bin.
+
+    Args:
+        baseline (ColumnAccumulator): The baseline column statistics.
+        current (ColumnAccumulator): The current column statistics.
+
+    Returns:
+        tuple: (baseline_counts, current_counts) per category.
+    """
+    baseline_counts, current_counts = dict(baseline.top_values.most_common()), dict(current.top_values.most_common())
+    categories = list(dict.fromkeys(list(baseline_counts) + list(current_counts)))
+    expected = [baseline_counts.get(category, 0) for category in categories]
+    actual = [current_counts.get(category, 0) for category in categories]
+    expected.append(max(baseline.count - sum(expected), 0))
+    actual.append(max(current.count - sum(actual), 0))
+    return np.asarray(expected), np.asarray(actual)
+
+
+def comparison_sections(baseline, current, bins=10) -> dict:
+    """
+    Build side-by-side report tables comparing two snapshots of a dataset.
+
+    'Summary Comparison' puts the value count, mean (and its change), standard deviation and
+    missing share of each column next to each other. 'Distribution Shift' gives each column's PSI,
+    and for numeric columns the KS statistic, from binned counts of the two snapshots.
+
+    Args:
+        baseline (ReportState): The statistics of the baseline snapshot.
+        current (ReportState): The statistics of the current snapshot.
+        bins (int, optional): Quantile bins for numeric columns (default is 10).
+
+    Returns:
+        dict: Section name to DataFrame.
+    """
+    summary, shift = [], []
+    for column in list(dict.fromkeys(list(baseline.columns) + list(current.columns))):
+        before, after = baseline.columns.get(column), current.columns.get(column)
+        if before is None or after is None:
+            summary.append([column, before.count if before else None, after.count if after else None] + [np.nan] * 7)
+            shift.append([column, None, np.nan, np.nan, 'only in baseline' if after is None else 'only in current'])
+            continue
+
+        numeric = before.numeric and after.numeric
+        both = numeric and before.count and after.count
+        summary.append([column, before.count, after.count,
+                        before.mean if both else np.nan, after.mean if both else np.nan,
+                        after.mean - before.mean if both else np.nan,
+                        before.std if numeric else np.nan, after.std if numeric else np.nan,
+                        before.missing / baseline.rows * 100 if baseline.rows else 0.0,
+                        after.missing / current.rows * 100 if current.rows else 0.0])
+
+        if not (before.count and after.count):
+            shift.append([column, 'numeric' if numeric else 'categorical', np.nan, np.nan, 'no values'])
+        elif numeric:
+            expected, actual = numeric_bins(before, after, bins)
+            psi = population_stability_index(expected, actual)
+            shift.append([column, 'numeric', psi, ks_statistic(expected, actual), shift_level(psi)])
+        elif not before.numeric and not after.numeric:
+            psi = population_stability_index(*category_bins(before, after))
+            shift.append([column, 'categorical', psi, np.nan, shift_level(psi)])
+        else:
+            shift.append([column, 'mixed', np.nan, np.nan, 'type changed'])
+
+    summary = pd.DataFrame(summary, columns=['Field', 'Baseline Count', 'Current Count', 'Baseline Mean', 'Current Mean',
+                                             'Mean Change', 'Baseline Std', 'Current Std', 'Baseline Missing %',
+                                             'Current Missing %'])
+    summary[['Baseline Count', 'Current Count']] = summary[['Baseline Count', 'Current Count']].astype('Int64')
+    return {'Summary Comparison': summary,
+            'Distribution Shift': pd.DataFrame(shift, columns=['Field', 'Type', 'PSI', 'KS', 'Shift'])}
@@ -0,0 +1,276 @@
+import hashlib
+import json
+import os
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from src.utils.exceptions import DataValidationError
+from src.utils.loader import load_data
+from src.utils.sketches import ColumnAccumulator, CorrelationAccumulator
+from .reporter import DESCRIPTIVE_COLUMNS, format_sections
+
+BLOCK_SIZE = 64 * 1024 * 1024
+TAIL_HASH_BYTES = 1024
+
+
+def _tail_hash(file, offset):
+    start = max(0, offset - TAIL_HASH_BYTES)
+    file.seek(start)
+    return hashlib.sha1(file.read(offset - start)).hexdigest()
+
+
+class ReportState:
+    """
+    Persisted, mergeable statistics behind an incremental summary report.
+
+    The state remembers how far into each input it has read, so appending rows to a CSV (or adding
+    new partition files to a directory) only costs a pass over the new data on the next run.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.columns = {}
+        self.correlation = None
+        self.sources = {}
+
+    def update(self, data: pd.DataFrame):
+        """
+        Add a batch of rows to the statistics.
+
+        Args:
+            data (pd.DataFrame): The new rows.
+        """
+        for column in data.columns:
+            if column not in self.columns:
+                accumulator = ColumnAccumulator.for_series(data[column])
+                accumulator.missing = self.rows
+                self.columns[column] = accumulator
+        for column, accumulator in self.columns.items():
+            if column in data.columns:
+                accumulator.update(data[column])
+            else:
+                accumulator.missing += len(data)
+
+        if self.correlation is None:
+            numeric = [column for column, accumulator in self.columns.items() if accumulator.numeric]
+            if numeric:
+                self.correlation = CorrelationAccumulator(numeric)
+        if self.correlation is not None:
+            self.correlation.update(data.reindex(columns=self.correlation.columns))
+        self.rows += len(data)
+
+    def merge(self, other):
+        """
+        Fold the statistics of another state into this one.
+
+        Args:
+            other (ReportState): Statistics over rows disjoint from this state's rows.
+
+        Returns:
+            ReportState: self.
+        """
+        for column, accumulator in other.columns.items():
+            if column in self.columns:
+                self.columns[column].merge(accumulator)
+            else:
+                accumulator.missing += self.rows
+                self.columns[column] = accumulator
+        for column, accumulator in self.columns.items():
+            if column not in other.columns:
+                accumulator.missing += other.rows
+
+        if self.correlation is None:
+            self.correlation = other.correlation
+        elif other.correlation is not None and other.correlation.columns == self.correlation.columns:
+            self.correlation.merge(other.correlation)
+        self.sources.update(other.sources)
+        self.rows += other.rows
+        return self
+
+    def ingest(self, input_path, block_size=BLOCK_SIZE):
+        """
+        Read the data in `input_path` that this state has not seen yet.
+
+        Args:
+            input_path (str): A CSV file, another supported data file, or a directory of partition files.
+            block_size (int, optional): How many bytes of new CSV rows to parse at a time.
+
+        Returns:
+            int: The number of new rows added.
+        """
+        if os.path.isdir(input_path):
+            return sum(self.ingest(os.path.join(input_path, name), block_size)
+                       for name in sorted(os.listdir(input_path)) if not name.startswith('.'))
+        if os.path.splitext(input_path)[1].lower() in ('.csv', '.txt', ''):
+            return self._ingest_csv(input_path, block_size)
+        return self._ingest_partition(input_path)
+
+    def _ingest_partition(self, file_path):
+        key = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        source = self.sources.get(key)
+        if source is not None:
+            if source['signature'] != signature:
+                raise DataValidationError(f"'{file_path}' changed since it was reported; delete the state file to rebuild.")
+            return 0
+
+        data = load_data(file_path)
+        self.update(data)
+        self.sources[key] = {'signature': signature}
+        return len(data)
+
+    def _ingest_csv(self, file_path, block_size):
+        key = os.path.abspath(file_path)
+        source = self.sources.get(key)
+        rows_before = self.rows
+
+        with open(file_path, 'rb') as file:
+            header = file.readline()
+            size = os.fstat(file.fileno()).st_size
+            if source is None:
+                offset = len(header)
+            else:
+                offset = source['offset']
+                if (source['header'] != header.decode('utf-8') or size < offset
+                        or _tail_hash(file, offset) != source['tail_hash']):
+                    raise DataValidationError(f"'{file_path}' was rewritten, not appended to; delete the state file to rebuild.")
+
+            dtypes = {column: str for column, accumulator in self.columns.items() if not accumulator.numeric}
+            file.seek(offset)
+            pending = b''
+            while True:
+                block = file.read(block_size)
+                data = pending + block
+                cut = len(data) if not block else data.rfind(b'\n') + 1
+                complete, pending = data[:cut], data[cut:]
+                if complete.strip():
+                    self.update(pd.read_csv(BytesIO(header + complete), dtype=dtypes))
+                offset += len(complete)
+                if not block:
+                    break
+
+            self.sources[key] = {'header': header.decode('utf-8'), 'offset': offset,
+                                 'tail_hash': _tail_hash(file, offset)}
+        return self.rows - rows_before
+
+    def tables(self) -> dict:
+        """
+        Build typed report tables in the layout produced by `summary_tables`.
+
+        Quantiles, distinct counts, value counts and outlier counts are estimated from sketches;
+        they are exact for small columns.
+
+        Returns:
+            dict: Section name to DataFrame.
+        """
+        tables = {}
+
+        descriptive = []
+        for column, acc in self.columns.items():
+            if acc.numeric and acc.count:
+                q1, median, q3 = acc.quantiles.quantile([0.25, 0.5, 0.75])
+                stats = [acc.mean, acc.std, acc.minimum, q1, median, q3, acc.maximum]
+            else:
+                stats = [np.nan] * 7
+            descriptive.append([column, acc.count] + [float(value) for value in stats] + [acc.dtype, acc.distinct.estimate()])
+        tables['Descriptive Statistics'] = pd.DataFrame(descriptive, columns=DESCRIPTIVE_COLUMNS)
+
+        if self.correlation is not None:
+            tables['Correlation Matrix'] = self.correlation.correlation().rename_axis('Field').reset_index()
+        else:
+            tables['Correlation Matrix'] = pd.DataFrame(columns=['Field'])
+
+        missing = [acc.missing for acc in self.columns.values()]
+        tables['Missing Values Summary'] = pd.DataFrame({
+            'Field': list(self.columns), 'Missing Values': pd.Series(missing, dtype='int64'), 'Total Values': self.rows,
+            'Missing Percentage': [value / self.rows * 100 if self.rows else 0.0 for value in missing]})
+
+        value_counts = [(column, value, count) for column, acc in self.columns.items() if not acc.numeric
+                        for value, count in acc.top_values.most_common()]
+        tables['Value Counts Summary'] = pd.DataFrame(value_counts, columns=['Field', 'Value', 'Count'])
+
+        outliers = []
+        for column, acc in self.columns.items():
+            if acc.numeric and acc.count:
+                q1, q3 = acc.quantiles.quantile([0.25, 0.75])
+                iqr = q3 - q1
+                count = int(round(acc.quantiles.fraction_outside(q1 - 1.5 * iqr, q3 + 1.5 * iqr) * acc.count))
+                outliers.append([column, count, count / self.rows * 100])
+        tables['Outliers Summary'] = pd.DataFrame(outliers, columns=['Field', 'Outliers Count', 'Outliers Percentage'])
+
+        return tables
+
+    def sections(self) -> dict:
+        """
+        Build printable report sections in the layout produced by `create_combined_summary_report`.
+
+        Returns:
+            dict: The report sections.
+        """
+        return format_sections(self.tables())
+
+    def to_dict(self):
+        return {
+            'rows': self.rows,
+            'columns': {column: acc.to_dict() for column, acc in self.columns.items()},
+            'correlation': self.correlation.to_dict() if self.correlation is not None else None,
+            'sources': self.sources,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        report_state = cls()
+        report_state.rows = state['rows']
+        report_state.columns = {column: ColumnAccumulator.from_dict(acc) for column, acc in state['columns'].items()}
+        if state['correlation'] is not None:
+            report_state.correlation = CorrelationAccumulator.from_dict(state['correlation'])
+        report_state.sources = state['sources']
+        return report_state
+
+    def save(self, state_file):
+        """
+        Write the state to a JSON file, replacing it atomically.
+
+        Args:
+            state_file (str): The path of the state file.
+        """
+        temp_file = f"{state_file}.tmp"
+        with open(temp_file, 'w') as file:
+            json.dump(self.to_dict(), file)
+        os.replace(temp_file, state_file)
+
+    @classmethod
+    def load(cls, state_file):
+        """
+        Read a state file, returning an empty state if it does not exist yet.
+
+        Args:
+            state_file (str): The path of the state file.
+
+        Returns:
+            ReportState: The loaded state.
+        """
+        if not os.path.exists(state_file):
+            return cls()
+        with open(state_file) as file:
+            return cls.from_dict(json.load(file))
+
+
+def update_report_state(input_path, state_file) -> ReportState:
+    """
+    Bring a persisted report state up to date with `input_path` and save it.
+
+    Args:
+        input_path (str or list): The input file or partition directory, or several of them.
+        state_file (str): The state file to read and update.
+
+    Returns:
+        ReportState: The updated state.
+    """
+    state = ReportState.load(state_file)
+    for path in [input_path] if isinstance(input_path, (str, os.PathLike)) else input_path:
+        state.ingest(path)
+    state.save(state_file)
+    return state
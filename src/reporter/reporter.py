@@ -1,78 +1,172 @@
+import json
 import os
+import re
+from html import escape
+
+import numpy as np
 import pandas as pd
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, KeepTogether
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER
+from src.utils.exceptions import DataValidationError, UnsupportedFormatError
+from src.utils.writers import compression_for, open_output, strip_compression, write_csv
 
 
-def create_combined_summary_report(data_frame: pd.DataFrame) -> dict:
-    report_sections = {}
+REPORT_FORMATS = ('pdf', 'txt', 'json', 'html', 'parquet', 'csv')
+# Single-file text reports may be gzip or zstd compressed by extension, e.g. 'summary.json.gz'.
+COMPRESSIBLE_FORMATS = ('txt', 'json', 'html')
+DESCRIPTIVE_COLUMNS = ['Field', 'Count', 'Mean', 'Std', 'Min', '25%', '50%', '75%', 'Max', 'Data Type', 'Unique Values']
+_DESCRIBE_COLUMNS = {'Mean': 'mean', 'Std': 'std', 'Min': 'min', '25%': '25%', '50%': '50%', '75%': '75%', 'Max': 'max'}
+
+
+def summary_tables(data_frame: pd.DataFrame) -> dict:
+    """
+    Compute the summary report as typed tables, one DataFrame per section.
+
+    Values are kept as numbers (unrounded, percentages from 0 to 100) so they can be exported or
+    ingested as they are; `format_sections` turns them into the printable report layout.
+
+    Args:
+        data_frame (pd.DataFrame): The data to summarise.
+
+    Returns:
+        dict: Section name to DataFrame, for 'Descriptive Statistics', 'Correlation Matrix',
+            'Missing Values Summary', 'Value Counts Summary' and 'Outliers Summary'.
+    """
+    tables = {}
+    numeric_cols = data_frame.select_dtypes(include=[float, int])
+    rows = len(data_frame)
 
     # Descriptive statistics
-    desc_stats = data_frame.describe(include='all').T.round(2)
-    desc_stats['Data Type'] = data_frame.dtypes
-    desc_stats['Unique Values'] = data_frame.nunique()
-    report_sections['Descriptive Statistics'] = desc_stats.reset_index().values.tolist()
+    described = numeric_cols.describe().T if not numeric_cols.empty else pd.DataFrame()
+    descriptive = pd.DataFrame({'Field': data_frame.columns, 'Count': data_frame.count().to_numpy()})
+    for name, statistic in _DESCRIBE_COLUMNS.items():
+        values = described[statistic] if statistic in described else pd.Series(dtype=float)
+        descriptive[name] = values.reindex(data_frame.columns).to_numpy(dtype=float)
+    descriptive['Data Type'] = data_frame.dtypes.astype(str).to_numpy()
+    descriptive['Unique Values'] = data_frame.nunique().to_numpy()
+    tables['Descriptive Statistics'] = descriptive
 
     # Correlation matrix - Only apply to numeric columns
-    numeric_cols = data_frame.select_dtypes(include=[float, int])
-    if not numeric_cols.empty:
-        correlation_matrix = numeric_cols.corr().round(2)
-        report_sections['Correlation Matrix'] = correlation_matrix.reset_index().values.tolist()
-    else:
-        report_sections['Correlation Matrix'] = [["No numeric columns available for correlation."]]
+    tables['Correlation Matrix'] = numeric_cols.corr().rename_axis('Field').reset_index()
 
     # Missing values
     missing_values = data_frame.isnull().sum()
-    total_cells = data_frame.size
-    total_missing = missing_values.sum()
-    missing_summary = [[f"Total Missing Values: {total_missing}"],
-                       [f"Percentage of Missing Values: {total_missing / total_cells * 100:.2f}%"]]
-
-    for column, value in missing_values.items():
-        if value > 0:
-            missing_summary.append([f"Column: {column}", f"Missing Values: {value}", f"Percentage: {value / len(data_frame) * 100:.2f}%"])
-
-    report_sections['Missing Values Summary'] = missing_summary if len(missing_summary) > 1 else [["No missing values"]]
+    tables['Missing Values Summary'] = pd.DataFrame({
+        'Field': missing_values.index, 'Missing Values': missing_values.to_numpy(), 'Total Values': rows,
+        'Missing Percentage': missing_values.to_numpy() / rows * 100 if rows else 0.0})
 
     # Value counts for categorical columns
-    categorical_cols = data_frame.select_dtypes(include=['object', 'category']).columns
-    value_counts_summary = []
-    for column in categorical_cols:
-        value_counts_summary.append([f"Column: {column}"])
-        value_counts = data_frame[column].value_counts().reset_index().values.tolist()
-        value_counts_summary.extend(value_counts)
-
-    report_sections['Value Counts Summary'] = value_counts_summary if value_counts_summary else [["No categorical columns"]]
+    categorical_cols = data_frame.select_dtypes(include=['object', 'category', 'string']).columns
+    counts = [data_frame[column].value_counts() for column in categorical_cols]
+    tables['Value Counts Summary'] = pd.DataFrame({
+        'Field': [column for column, values in zip(categorical_cols, counts) for _ in range(len(values))],
+        'Value': [str(value) for values in counts for value in values.index],
+        'Count': [int(count) for values in counts for count in values.to_numpy()]})
 
     # Outliers summary
-    outliers_summary = [['Column', 'Outliers Count', 'Outliers Percentage']]
-    for column in data_frame.select_dtypes(include=[float, int]).columns:
-        q1 = data_frame[column].quantile(0.25)
-        q3 = data_frame[column].quantile(0.75)
+    outliers = []
+    for column in numeric_cols.columns:
+        q1, q3 = data_frame[column].quantile(0.25), data_frame[column].quantile(0.75)
         iqr = q3 - q1
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
-        outliers = data_frame[(data_frame[column] < lower_bound) | (data_frame[column] > upper_bound)]
-        outliers_summary.append([column, len(outliers), f"{len(outliers) / len(data_frame) * 100:.2f}%"])
+        outliers.append(int(((data_frame[column] < q1 - 1.5 * iqr) | (data_frame[column] > q3 + 1.5 * iqr)).sum()))
+    tables['Outliers Summary'] = pd.DataFrame({
+        'Field': numeric_cols.columns, 'Outliers Count': outliers,
+        'Outliers Percentage': [count / rows * 100 if rows else 0.0 for count in outliers]})
+
+    return tables
+
+
+def _cell(value, percentage=False):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    if percentage:
+        return f"{value:.2f}%"
+    if isinstance(value, (float, np.floating)):
+        return round(float(value), 4)
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def format_sections(tables: dict) -> dict:
+    """
+    Render typed report tables into printable rows, as written by the PDF and TXT reports.
 
-    report_sections['Outliers Summary'] = outliers_summary if len(outliers_summary) > 1 else [["No outliers found"]]
+    Known sections keep their traditional layout (rounded statistics, "Column: ..." headings and
+    percentage strings). Other tables become a header row followed by their rows. Sections that
+    are already lists of rows are passed through.
 
+    Args:
+        tables (dict): Section name to DataFrame (or list of rows).
+
+    Returns:
+        dict: Section name to a list of rows.
+    """
+    report_sections = {}
+    for section, table in tables.items():
+        if not isinstance(table, pd.DataFrame):
+            report_sections[section] = table
+        elif section == 'Descriptive Statistics':
+            report_sections[section] = [
+                [row[0]] + [round(float(value), 2) for value in row[1:9]] + [row[9], _cell(row[10])]
+                for row in table[DESCRIPTIVE_COLUMNS].itertuples(index=False)]
+        elif section == 'Correlation Matrix':
+            report_sections[section] = (table.round(2).values.tolist() if len(table)
+                                        else [["No numeric columns available for correlation."]])
+        elif section == 'Missing Values Summary':
+            total_missing, total_cells = int(table['Missing Values'].sum()), int(table['Total Values'].sum())
+            missing_summary = [[f"Total Missing Values: {total_missing}"],
+                               [f"Percentage of Missing Values: {total_missing / total_cells * 100 if total_cells else 0:.2f}%"]]
+            for row in table[table['Missing Values'] > 0].itertuples(index=False):
+                missing_summary.append([f"Column: {row[0]}", f"Missing Values: {row[1]}", f"Percentage: {row[3]:.2f}%"])
+            report_sections[section] = missing_summary
+        elif section == 'Value Counts Summary':
+            value_counts_summary = []
+            for column, group in table.groupby('Field', sort=False):
+                value_counts_summary.append([f"Column: {column}"])
+                value_counts_summary.extend([value, int(count)] for value, count in zip(group['Value'], group['Count']))
+            report_sections[section] = value_counts_summary if value_counts_summary else [["No categorical columns"]]
+        elif section == 'Outliers Summary':
+            outliers_summary = [['Column', 'Outliers Count', 'Outliers Percentage']]
+            outliers_summary.extend([row[0], int(row[1]), f"{row[2]:.2f}%"] for row in table.itertuples(index=False))
+            report_sections[section] = outliers_summary if len(outliers_summary) > 1 else [["No outliers found"]]
+        else:
+            percentages = [str(column).endswith('%') for column in table.columns]
+            report_sections[section] = [list(table.columns)] + [
+                [_cell(value, percentage) for value, percentage in zip(row, percentages)]
+                for row in table.itertuples(index=False)]
     return report_sections
 
 
-def generate_pdf_report(report_sections: dict, pdf_file: str, data_frame: pd.DataFrame):
+def create_combined_summary_report(data_frame: pd.DataFrame) -> dict:
+    """
+    Summarise a DataFrame into printable report sections.
+
+    Args:
+        data_frame (pd.DataFrame): The data to summarise.
+
+    Returns:
+        dict: Section name to a list of rows; see `summary_tables` for the typed version.
+    """
+    return format_sections(summary_tables(data_frame))
+
+
+def generate_pdf_report(report_sections: dict, pdf_file: str, data_frame: pd.DataFrame = None):
     """
     Generates a PDF report from the given report sections.
 
     Args:
-        report_sections (dict): The content to be included in the PDF report, organized by section.
+        report_sections (dict): The content to be included in the PDF report, organized by section,
+            as typed tables (see `summary_tables`) or already formatted rows.
         pdf_file (str): The path where the PDF report will be saved.
-        data_frame (pd.DataFrame): The DataFrame used for adding column headers dynamically.
+        data_frame (pd.DataFrame, optional): The DataFrame used for adding column headers dynamically.
+            If omitted, the correlation headers are taken from the matrix.
     """
     try:
+        correlation = report_sections.get('Correlation Matrix')
+        correlation_columns = correlation.columns[1:].tolist() if isinstance(correlation, pd.DataFrame) else None
+        report_sections = format_sections(report_sections)
         doc = SimpleDocTemplate(pdf_file, pagesize=letter)
         styles = getSampleStyleSheet()
         content = []
@@ -97,7 +191,9 @@ def generate_pdf_report(report_sections: dict, pdf_file: str, data_frame: pd.Dat
                 headers = ['Field', 'Count', 'Mean', 'Std', 'Min', '25%', '50%', '75%', 'Max', 'Data Type', 'Unique Values']
                 table_data.insert(0, headers)
             elif section_title == 'Correlation Matrix':
-                headers = ['Field'] + data_frame.columns.tolist()
+                columns = correlation_columns or (data_frame.columns.tolist() if data_frame is not None
+                                                  else [row[0] for row in table_data])
+                headers = ['Field'] + columns
                 table_data.insert(0, headers)
 
             table = Table(table_data, repeatRows=1)
@@ -124,16 +220,160 @@ def generate_txt_report(report_sections: dict, txt_file: str):
     """
     Generates a TXT report from the given report sections.
 
+    Each section is joined into one block of text and written with a single buffered write; the
+    file is replaced atomically, and compressed when `txt_file` ends in '.gz' or '.zst'.
+
     Args:
-        report_sections (dict): The content to be included in the TXT report.
+        report_sections (dict): The content to be included in the TXT report, as typed tables or formatted rows.
         txt_file (str): The path where the TXT report will be saved.
     """
     try:
-        with open(txt_file, 'w') as file:
+        report_sections = format_sections(report_sections)
+        with open_output(txt_file) as file:
             for section, content in report_sections.items():
-                file.write(f"Section: {section}\n")
-                for row in content:
-                    file.write(" | ".join(map(str, row)) + "\n")
-                file.write("\n")
+                lines = [f"Section: {section}"]
+                lines.extend(" | ".join(map(str, row)) for row in content)
+                file.write("\n".join(lines) + "\n\n")
     except Exception as e:
         raise RuntimeError(f"Failed to generate TXT report: {e}")
+
+
+def _require_tables(report_tables):
+    for section, table in report_tables.items():
+        if not isinstance(table, pd.DataFrame):
+            raise DataValidationError(f"Section '{section}' is not a typed table; build the report with `summary_tables`.")
+
+
+def generate_json_report(report_tables: dict, json_file):
+    """
+    Writes typed report tables as one JSON object of records, e.g. {"Outliers Summary": [{"Field": ...}, ...]}.
+
+    Missing values become null and numbers are written unrounded, ready for ingestion.
+
+    Args:
+        report_tables (dict): Section name to DataFrame, from `summary_tables` or `ReportState.tables`.
+        json_file (str or file-like): Where to write the JSON.
+    """
+    _require_tables(report_tables)
+    # Each table is serialised by pandas' JSON encoder and the sections are only joined here.
+    text = '{' + ', '.join(f"{json.dumps(section)}: {table.to_json(orient='records', date_format='iso', double_precision=15)}"
+                           for section, table in report_tables.items()) + '}'
+    try:
+        if hasattr(json_file, 'write'):
+            json_file.write(text)
+        else:
+            with open_output(json_file) as file:
+                file.write(text)
+    except Exception as e:
+        raise RuntimeError(f"Failed to generate JSON report: {e}")
+
+
+def generate_html_report(report_tables: dict, html_file):
+    """
+    Writes typed report tables as one HTML page with a table per section, numbers formatted to two decimals.
+
+    Args:
+        report_tables (dict): Section name to DataFrame.
+        html_file (str or file-like): Where to write the page.
+    """
+    _require_tables(report_tables)
+    body = ''.join(f"<h2>{escape(section)}</h2>\n{table.to_html(index=False, na_rep='', float_format='{:.2f}'.format, border=0)}\n"
+                   for section, table in report_tables.items())
+    html = f"<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\"><title>Summary Report</title></head>\n<body>\n<h1>Summary Report</h1>\n{body}</body>\n</html>\n"
+    try:
+        if hasattr(html_file, 'write'):
+            html_file.write(html)
+        else:
+            with open_output(html_file) as file:
+                file.write(html)
+    except Exception as e:
+        raise RuntimeError(f"Failed to generate HTML report: {e}")
+
+
+def section_file_name(section: str) -> str:
+    """The file name stem for a section, e.g. 'Missing Values Summary' -> 'missing_values_summary'."""
+    return re.sub(r'[^0-9a-z]+', '_', section.lower()).strip('_')
+
+
+def _write_section_files(report_tables, output_dir, file_format):
+    _require_tables(report_tables)
+    os.makedirs(output_dir, exist_ok=True)
+    for section, table in report_tables.items():
+        path = os.path.join(output_dir, f"{section_file_name(section)}.{file_format}")
+        # Parquet columns need one type, so mixed object columns are stored as text.
+        table = table.astype({column: str for column in table.columns
+                              if table[column].dtype == object and table[column].map(type).nunique() > 1})
+        table.columns = [str(column) for column in table.columns]
+        if file_format == 'parquet':
+            table.to_parquet(path, index=False)
+        else:
+            write_csv(table, path)
+
+
+def generate_parquet_report(report_tables: dict, output_dir: str):
+    """
+    Writes each typed report table to its own Parquet file in `output_dir`, e.g. 'outliers_summary.parquet'.
+
+    Args:
+        report_tables (dict): Section name to DataFrame.
+        output_dir (str): The directory to write to, created if needed.
+    """
+    try:
+        _write_section_files(report_tables, output_dir, 'parquet')
+    except DataValidationError:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Failed to generate Parquet report: {e}")
+
+
+def generate_csv_report(report_tables: dict, output_dir: str):
+    """
+    Writes each typed report table to its own CSV file in `output_dir`, e.g. 'outliers_summary.csv'.
+
+    Args:
+        report_tables (dict): Section name to DataFrame.
+        output_dir (str): The directory to write to, created if needed.
+    """
+    try:
+        _write_section_files(report_tables, output_dir, 'csv')
+    except DataValidationError:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Failed to generate CSV report: {e}")
+
+
+def report_format(path: str) -> str:
+    """
+    The report format for an output path, from its extension.
+
+    Args:
+        path (str): The output path, e.g. 'summary.json', 'summary.txt.gz' or 'summary.parquet' (a directory).
+
+    Returns:
+        str: One of REPORT_FORMATS.
+
+    Raises:
+        UnsupportedFormatError: If the extension is not a report format.
+    """
+    path = path.rstrip('/\\')
+    extension = os.path.splitext(strip_compression(path))[1].lower().lstrip('.')
+    extension = {'htm': 'html'}.get(extension, extension)
+    if extension not in REPORT_FORMATS:
+        raise UnsupportedFormatError(extension or path, REPORT_FORMATS)
+    if compression_for(path) and extension not in COMPRESSIBLE_FORMATS:
+        raise UnsupportedFormatError(extension, COMPRESSIBLE_FORMATS, f"'{extension}' reports cannot be compressed.")
+    return extension
+
+
+def write_report(report_tables: dict, path: str, output_format: str = None):
+    """
+    Writes typed report tables in the format given by `output_format` or the extension of `path`.
+
+    Args:
+        report_tables (dict): Section name to DataFrame.
+        path (str): The output file, or directory for 'parquet' and 'csv'.
+        output_format (str, optional): One of REPORT_FORMATS.
+    """
+    writers = {'pdf': generate_pdf_report, 'txt': generate_txt_report, 'json': generate_json_report,
+               'html': generate_html_report, 'parquet': generate_parquet_report, 'csv': generate_csv_report}
+    writers[output_format or report_format(path)](report_tables, path)
@@ -1,6 +1,12 @@
+import os
+
 import click
-import pandas as pd
-from .reporter import create_combined_summary_report, generate_pdf_report, generate_txt_report
+from src.utils.filtering import WHERE_HELP
+from src.utils.loader import load_data
+from .reporter import REPORT_FORMATS, format_sections, generate_pdf_report, generate_txt_report, summary_tables, write_report
+from .incremental import update_report_state
+from .drift import comparison_sections
+from .rollup import rollup_states
 
 @click.group(
     help="""
@@ -12,6 +18,11 @@ from .reporter import create_combined_summary_report, generate_pdf_report, gener
 
     - **PDF Report**: A comprehensive PDF report with sections like Descriptive Statistics, Correlation Matrices, Missing Values, and Outlier Analysis.
     - **TXT Report**: A simple text-based summary report with similar sections as the PDF.
+    - **Summary Tables**: `create-summary --output_summary` saves the typed tables as JSON, HTML, Parquet or CSV for monitoring tools.
+
+    Both reports accept several inputs (files or directories of partition files), summarised in
+    parallel and merged, and `--baseline` to add a side-by-side comparison with an earlier snapshot,
+    including each column's distribution shift (PSI and KS).
 
     ### Examples:
 
@@ -22,68 +33,137 @@ from .reporter import create_combined_summary_report, generate_pdf_report, gener
     2. **Create a TXT Report**:
     \b
     python cmd.py report generate-txt data.csv --output_txt summary_report.txt
+
+    3. **Refresh a Report Over Append-Only Data**, reading only rows added since the last run:
+    \b
+    python cmd.py report generate-pdf data.csv --output_pdf summary_report.pdf --state data.report-state.json
+
+    4. **Export the Summary as JSON, or as One Parquet File per Section**:
+    \b
+    python cmd.py report create-summary data.csv --output_summary summary.json
+    python cmd.py report create-summary data.csv --output_summary summary.parquet
+
+    5. **Report Over Daily Partitions, Compared with Last Month's Snapshot**:
+    \b
+    python cmd.py report generate-pdf daily/ --baseline snapshots/2024-05/ --workers 8 --output_pdf drift_report.pdf
     """
 )
 def cli():
     """A command-line interface for generating summary reports and PDF/TXT files."""
     pass
 
+def check_where(where, state_file):
+    """Reject --where with --state: the persisted statistics cover every row of the input."""
+    if where and state_file:
+        raise click.UsageError("--where cannot be combined with --state.")
+
+def report_options(command):
+    """Add the --baseline and --workers options shared by the report commands."""
+    command = click.option('--workers', default=None, type=click.IntRange(min=1),
+                           help='Partitions summarised in parallel (default: one per CPU).')(command)
+    command = click.option('--baseline', 'baseline_files', multiple=True, type=click.Path(exists=True),
+                           help='A baseline snapshot (file or partition directory) to compare against. Repeat for several.')(command)
+    return command
+
+def build_report(input_files, state_file, where, baseline_files, workers):
+    """
+    Compute the typed report tables for one or more inputs.
+
+    A single input without a baseline is summarised exactly in memory. Several inputs, or a
+    comparison, are summarised per partition in parallel and merged.
+
+    Returns:
+        tuple: (report_tables, data_frame), the data frame only for the in-memory summary.
+    """
+    if state_file:
+        state = update_report_state(list(input_files), state_file)
+    elif len(input_files) > 1 or baseline_files or os.path.isdir(input_files[0]):
+        state = rollup_states(input_files, where=where, max_workers=workers)
+    else:
+        data = load_data(input_files[0], where=where)
+        return summary_tables(data), data
+
+    report_tables = state.tables()
+    if baseline_files:
+        baseline = rollup_states(baseline_files, where=where, max_workers=workers)
+        report_tables.update(comparison_sections(baseline, state))
+    return report_tables, None
+
 @click.command()
-@click.argument('input_file', type=click.Path(exists=True))
-@click.option('--output_summary', default=None, type=click.Path(), help='Path to save the summary CSV file (optional).')
-def create_summary(input_file, output_summary):
+@click.argument('input_files', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('--output_summary', default=None, type=click.Path(),
+              help=f"Path to save the summary tables; the format follows the extension ({', '.join(REPORT_FORMATS)}). "
+                   "'.parquet' and '.csv' paths are directories with one file per section.")
+@click.option('--where', default=None, help=WHERE_HELP)
+@report_options
+def create_summary(input_files, output_summary, where, baseline_files, workers):
     """
     Create a combined summary report and display the results.
 
     Args:
-        input_file (str): The input CSV file path.
-        output_summary (str, optional): The output path for saving the summary CSV.
+        input_files (tuple): The input files, or directories of partition files.
+        output_summary (str, optional): The output path for saving the summary tables.
+        where (str, optional): Only summarise rows matching this filter expression.
+        baseline_files (tuple): Baseline snapshot inputs to compare against (optional).
+        workers (int, optional): Partitions summarised in parallel.
     """
-    data = pd.read_csv(input_file)
-    report_sections = create_combined_summary_report(data)
+    report_tables, _ = build_report(input_files, None, where, baseline_files, workers)
 
     # Display the generated summary
-    for section, content in report_sections.items():
+    for section, content in format_sections(report_tables).items():
         print(f"Section: {section}")
         for row in content:
             print(" | ".join(map(str, row)))
         print("\n")
 
-    # Save summary as CSV if specified
+    # Save the typed tables if specified
     if output_summary:
-        summary_df = pd.DataFrame({section: pd.Series(content) for section, content in report_sections.items()})
-        summary_df.to_csv(output_summary, index=False)
+        write_report(report_tables, output_summary)
         print(f"Summary saved to {output_summary}")
 
 @click.command()
-@click.argument('input_file', type=click.Path(exists=True))
+@click.argument('input_files', nargs=-1, required=True, type=click.Path(exists=True))
 @click.option('--output_pdf', default='report.pdf', type=click.Path(), help='Path to save the PDF report.')
-def generate_pdf(input_file, output_pdf):
+@click.option('--state', 'state_file', default=None, type=click.Path(), help='Incremental state file; only data added since the last run is read.')
+@click.option('--where', default=None, help=WHERE_HELP)
+@report_options
+def generate_pdf(input_files, output_pdf, state_file, where, baseline_files, workers):
     """
-    Generate a PDF report from the input CSV file.
+    Generate a PDF report from one or more input files.
 
     Args:
-        input_file (str): The input CSV file path.
+        input_files (tuple): The input files, or directories of partition files.
         output_pdf (str): The output path for saving the PDF report.
+        state_file (str, optional): The incremental state file to update and report from.
+        where (str, optional): Only report on rows matching this filter expression.
+        baseline_files (tuple): Baseline snapshot inputs to compare against (optional).
+        workers (int, optional): Partitions summarised in parallel.
     """
-    data = pd.read_csv(input_file)
-    report_sections = create_combined_summary_report(data)
+    check_where(where, state_file)
+    report_sections, data = build_report(input_files, state_file, where, baseline_files, workers)
     generate_pdf_report(report_sections, pdf_file=output_pdf, data_frame=data)
     print(f"PDF report generated and saved to {output_pdf}")
 
 @click.command()
-@click.argument('input_file', type=click.Path(exists=True))
+@click.argument('input_files', nargs=-1, required=True, type=click.Path(exists=True))
 @click.option('--output_txt', default='report.txt', type=click.Path(), help='Path to save the TXT report.')
-def generate_txt(input_file, output_txt):
+@click.option('--state', 'state_file', default=None, type=click.Path(), help='Incremental state file; only data added since the last run is read.')
+@click.option('--where', default=None, help=WHERE_HELP)
+@report_options
+def generate_txt(input_files, output_txt, state_file, where, baseline_files, workers):
     """
-    Generate a TXT report from the input CSV file.
+    Generate a TXT report from one or more input files.
 
     Args:
-        input_file (str): The input CSV file path.
+        input_files (tuple): The input files, or directories of partition files.
         output_txt (str): The output path for saving the TXT report.
+        state_file (str, optional): The incremental state file to update and report from.
+        where (str, optional): Only report on rows matching this filter expression.
+        baseline_files (tuple): Baseline snapshot inputs to compare against (optional).
+        workers (int, optional): Partitions summarised in parallel.
     """
-    data = pd.read_csv(input_file)
-    report_sections = create_combined_summary_report(data)
+    check_where(where, state_file)
+    report_sections, _ = build_report(input_files, state_file, where, baseline_files, workers)
     generate_txt_report(report_sections, txt_file=output_txt)
     print(f"TXT report generated and saved to {output_txt}")
 
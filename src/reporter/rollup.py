@@ -0,0 +1,71 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.utils.loader import load_data
+from .incremental import ReportState
+
+EXECUTORS = ('process', 'thread')
+
+
+def expand_inputs(input_paths) -> list:
+    """
+    List the files behind a set of inputs, expanding directories of partition files.
+
+    Args:
+        input_paths (list): Files and/or directories.
+
+    Returns:
+        list: The files, directories expanded in name order and hidden files skipped.
+    """
+    files = []
+    for path in input_paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if not name.startswith('.'))
+        else:
+            files.append(path)
+    return files
+
+
+def partition_state(file_path, where=None) -> ReportState:
+    """
+    Compute the mergeable report statistics of one partition file.
+
+    Args:
+        file_path (str): The partition file.
+        where (str, optional): Only use rows matching this filter expression.
+
+    Returns:
+        ReportState: The statistics of the partition.
+    """
+    state = ReportState()
+    state.update(load_data(file_path, where=where))
+    return state
+
+
+def rollup_states(input_paths, where=None, max_workers=None, executor='process') -> ReportState:
+    """
+    Compute report statistics for many partitions in parallel and merge them.
+
+    Each partition is summarised on its own worker into counts, moments, extremes and sketches,
+    which merge exactly (moments) or as mergeable estimates (quantiles, distinct and top values).
+    The partitions are merged in input order, so the result does not depend on scheduling.
+
+    Args:
+        input_paths (list): Partition files and/or directories of partition files.
+        where (str, optional): Only use rows matching this filter expression.
+        max_workers (int, optional): Partitions summarised at once. Defaults to the executor's default.
+        executor (str, optional): 'process' (default) to parse partitions on separate cores, or 'thread'.
+
+    Returns:
+        ReportState: The merged statistics.
+    """
+    files = expand_inputs(input_paths)
+    state = ReportState()
+    if len(files) == 1:
+        return state.merge(partition_state(files[0], where))
+
+    pool_class = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+    with pool_class(max_workers=max_workers) as pool:
+        for partition in pool.map(partition_state, files, [where] * len(files)):
+            state.merge(partition)
+    return state
@@ -0,0 +1,286 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+
+import pandas as pd
+from src.cleaner.cleaner import Standardizer, Basic_Cleaner, TextOperations
+from src.reporter.reporter import generate_pdf_report, generate_txt_report, summary_tables
+from src.transformer.expressions import derive_columns
+from src.utils.exceptions import DataValidationError
+from src.utils.loader import load_data
+from src.utils.writers import open_output, write_csv
+
+CLEANERS = {
+    'Standardizer': Standardizer,
+    'Basic_Cleaner': Basic_Cleaner,
+    'TextOperations': TextOperations,
+}
+
+_DONE = object()
+
+
+def _run_cleaning(data, class_name, method, kwargs):
+    cleaner = CLEANERS[class_name](data)
+    return getattr(cleaner, method)(**kwargs).data
+
+
+def _run_report(data, output_format):
+    report_sections = summary_tables(data)
+    if output_format == 'pdf':
+        buffer = BytesIO()
+        generate_pdf_report(report_sections, pdf_file=buffer, data_frame=data)
+        return buffer.getvalue()
+    return report_sections
+
+
+def _run_chart(data, chart, kwargs):
+    # Imported here so process-pool workers only pay for matplotlib when they render charts.
+    import matplotlib
+    matplotlib.use('Agg')
+    from src.visualiser.visualiser import DataVisualizer
+
+    buffer = BytesIO()
+    getattr(DataVisualizer(data), chart)(output_path=buffer, **kwargs)
+    return buffer.getvalue()
+
+
+def clean_step(operation, **kwargs):
+    """
+    Build a processing step that runs a cleaner method.
+
+    Args:
+        operation (str): The cleaner method as 'Class.method', e.g. 'Basic_Cleaner.trim_spaces'.
+        **kwargs: Keyword arguments passed to the method.
+
+    Returns:
+        callable: A picklable function taking and returning a DataFrame.
+
+    Raises:
+        DataValidationError: If the operation does not name a known cleaner method.
+    """
+    class_name, _, method = operation.partition('.')
+    if class_name not in CLEANERS or not hasattr(CLEANERS[class_name], method):
+        raise DataValidationError(f"Unknown cleaning operation '{operation}'.")
+    return partial(_run_cleaning, class_name=class_name, method=method, kwargs=kwargs)
+
+
+def derive_step(*expressions):
+    """
+    Build a processing step that adds columns computed from expressions.
+
+    Args:
+        *expressions (str): Definitions such as 'total = price * qty', applied in order.
+
+    Returns:
+        callable: A picklable function taking and returning a DataFrame.
+    """
+    return partial(derive_columns, expressions=list(expressions))
+
+
+def report_step(output_format='txt'):
+    """
+    Build a processing step that creates a summary report.
+
+    Args:
+        output_format (str, optional): 'txt' returns the typed report tables, 'pdf' the rendered PDF bytes.
+
+    Returns:
+        callable: A picklable function taking a DataFrame.
+    """
+    if output_format not in ('txt', 'pdf'):
+        raise DataValidationError(f"Unsupported report format '{output_format}'.")
+    return partial(_run_report, output_format=output_format)
+
+
+def chart_step(chart, **kwargs):
+    """
+    Build a processing step that renders a DataVisualizer chart to image bytes.
+
+    Args:
+        chart (str): The DataVisualizer method name, e.g. 'histogram'.
+        **kwargs: Keyword arguments passed to the method (other than `output_path`).
+
+    Returns:
+        callable: A picklable function taking a DataFrame and returning PNG bytes.
+    """
+    return partial(_run_chart, chart=chart, kwargs=kwargs)
+
+
+def write_result(result, output):
+    """
+    Write a processing result to disk based on its type.
+
+    Args:
+        result: A DataFrame (written as CSV), report tables (written as TXT) or bytes (written as-is).
+            Every output is written atomically and compressed by extension.
+        output (str): The output path.
+    """
+    if isinstance(result, pd.DataFrame):
+        write_csv(result, output)
+    elif isinstance(result, dict):
+        generate_txt_report(result, txt_file=output)
+    elif isinstance(result, (bytes, bytearray)):
+        with open_output(output, 'wb') as file:
+            file.write(result)
+    else:
+        raise DataValidationError(f"Cannot write result of type '{type(result).__name__}'.")
+
+
+class Job:
+    """A unit of work: read an input file, run processing steps on it and write the result."""
+
+    def __init__(self, input_file, steps, output=None):
+        """
+        Initialize the job.
+
+        Args:
+            input_file (str): The dataset to read.
+            steps (callable or list): Processing steps applied in order. Each receives the previous result.
+            output (str, optional): Where to write the final result. Nothing is written if omitted.
+        """
+        self.input_file = input_file
+        self.steps = list(steps) if isinstance(steps, (list, tuple)) else [steps]
+        self.output = output
+
+    def process(self, data):
+        """Apply every step to `data` and return the final result."""
+        for step in self.steps:
+            data = step(data)
+        return data
+
+
+class JobResult:
+    """The outcome of a job, with per-stage timings in seconds."""
+
+    def __init__(self, job):
+        self.job = job
+        self.data = None
+        self.result = None
+        self.error = None
+        self.timings = {}
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = 'ok' if self.ok else f'error={self.error!r}'
+        return f"JobResult({self.job.input_file!r}, {status})"
+
+
+def _process_job(job, data):
+    return job.process(data)
+
+
+class JobRunner:
+    """
+    Runs jobs through a read -> process -> write pipeline so the stages overlap.
+
+    Reads and writes run on asyncio's default thread pool, CPU-bound processing runs on a thread or
+    process executor. Bounded queues between the stages apply backpressure, so a fast reader never
+    holds more than `queue_size` datasets waiting for the processing stage.
+    """
+
+    def __init__(self, read_concurrency=1, process_concurrency=None, write_concurrency=1,
+                 queue_size=2, executor='process'):
+        """
+        Initialize the runner.
+
+        Args:
+            read_concurrency (int, optional): Number of inputs read at the same time. Defaults to 1.
+            process_concurrency (int, optional): Number of jobs processed at the same time. Defaults to the CPU count.
+            write_concurrency (int, optional): Number of outputs written at the same time. Defaults to 1.
+            queue_size (int, optional): Capacity of the queues between stages. Defaults to 2.
+            executor (str, optional): 'process' or 'thread' for the processing stage. Defaults to 'process'.
+
+        Raises:
+            DataValidationError: If a concurrency limit or the queue size is not positive, or the executor is unknown.
+        """
+        process_concurrency = process_concurrency or os.cpu_count() or 1
+        for name, value in (('read_concurrency', read_concurrency), ('process_concurrency', process_concurrency),
+                            ('write_concurrency', write_concurrency), ('queue_size', queue_size)):
+            if not isinstance(value, int) or value <= 0:
+                raise DataValidationError(f"Parameter '{name}' must be a positive integer.")
+        if executor not in ('process', 'thread'):
+            raise DataValidationError("Parameter 'executor' must be 'process' or 'thread'.")
+
+        self.read_concurrency = read_concurrency
+        self.process_concurrency = process_concurrency
+        self.write_concurrency = write_concurrency
+        self.queue_size = queue_size
+        self.executor = executor
+
+    def run(self, jobs):
+        """
+        Run the jobs to completion.
+
+        Args:
+            jobs (iterable): The Job objects to run.
+
+        Returns:
+            list: A JobResult per job, in the order the jobs were given.
+        """
+        return asyncio.run(self.run_async(jobs))
+
+    async def run_async(self, jobs):
+        """Coroutine version of `run`, for callers that already have an event loop."""
+        results = [JobResult(job) for job in jobs]
+        pool_class = ProcessPoolExecutor if self.executor == 'process' else ThreadPoolExecutor
+
+        read_queue = asyncio.Queue(maxsize=self.queue_size)
+        process_queue = asyncio.Queue(maxsize=self.queue_size)
+        write_queue = asyncio.Queue(maxsize=self.queue_size)
+
+        with pool_class(max_workers=self.process_concurrency) as pool:
+            loop = asyncio.get_running_loop()
+
+            async def read(item):
+                item.data = await asyncio.to_thread(load_data, item.job.input_file)
+
+            async def process(item):
+                data, item.data = item.data, None
+                item.result = await loop.run_in_executor(pool, _process_job, item.job, data)
+
+            async def write(item):
+                if item.job.output is not None:
+                    await asyncio.to_thread(write_result, item.result, item.job.output)
+
+            await asyncio.gather(
+                self._feed(results, read_queue),
+                self._stage('read', read, read_queue, process_queue, self.read_concurrency, self.process_concurrency),
+                self._stage('process', process, process_queue, write_queue, self.process_concurrency, self.write_concurrency),
+                self._stage('write', write, write_queue, None, self.write_concurrency, 0),
+            )
+
+        return results
+
+    async def _feed(self, results, queue):
+        for item in results:
+            await queue.put(item)
+        for _ in range(self.read_concurrency):
+            await queue.put(_DONE)
+
+    @staticmethod
+    async def _stage(name, handler, inbox, outbox, workers, next_workers):
+        async def worker():
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    return
+                if item.ok:
+                    started = time.perf_counter()
+                    try:
+                        await handler(item)
+                    except Exception as e:
+                        item.error = e
+                    item.timings[name] = time.perf_counter() - started
+                if outbox is not None:
+                    await outbox.put(item)
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        if outbox is not None:
+            for _ in range(next_workers):
+                await outbox.put(_DONE)
@@ -0,0 +1,255 @@
+import io
+import ipaddress
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+
+import click
+from src.utils.exceptions import DataValidationError, render_error_message
+from src.utils.loader import DatasetRegistry, enable_registry, load_data
+
+DEFAULT_SOCKET_PATH = os.environ.get('TIDYDATA_SOCKET', os.path.join(tempfile.gettempdir(), 'tidydata.sock'))
+
+
+def execute_command(args, cwd=None):
+    """
+    Run a `tidydata` command in the current process and capture its output.
+
+    Args:
+        args (list): The command line arguments, e.g. ['clean', 'trim-spaces', 'data.csv'].
+        cwd (str, optional): The directory relative paths in `args` are resolved against.
+
+    Returns:
+        tuple: The exit code and the captured stdout/stderr text.
+    """
+    # Imported lazily because src.cmd registers the serve/client commands defined alongside this module.
+    from src.cmd import cli
+
+    output = io.StringIO()
+    previous_cwd = os.getcwd()
+    exit_code = 0
+    try:
+        if cwd:
+            os.chdir(cwd)
+        with redirect_stdout(output), redirect_stderr(output):
+            try:
+                cli.main(args=list(args), prog_name='tidydata', standalone_mode=False)
+            except click.exceptions.Exit as e:
+                exit_code = e.exit_code
+            except click.exceptions.Abort:
+                output.write("Aborted!\n")
+                exit_code = 1
+            except click.ClickException as e:
+                e.show(file=output)
+                exit_code = e.exit_code
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                output.write(render_error_message(e) + "\n")
+                exit_code = 1
+    finally:
+        os.chdir(previous_cwd)
+    return exit_code, output.getvalue()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handles one newline-delimited JSON request per connection."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line.decode('utf-8'))
+        except ValueError:
+            response = {'exit_code': 1, 'output': "Error: malformed request.\n"}
+        else:
+            response = self.server.data_server.handle_request(request)
+        self.wfile.write(json.dumps(response).encode('utf-8') + b"\n")
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _is_loopback(host):
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _remove_stale_socket(socket_path):
+    """
+    Remove a Unix socket left behind by a server that is no longer running.
+
+    Args:
+        socket_path (str): The socket path the server is about to bind.
+
+    Raises:
+        FileExistsError: If the path is not a socket, or a server is still listening on it.
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"'{socket_path}' exists and is not a socket.")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.remove(socket_path)
+            return
+    raise FileExistsError(f"A server is already listening on '{socket_path}'.")
+
+
+class DataServer:
+    """
+    A long-running `tidydata` process that keeps libraries imported and datasets cached in memory.
+
+    Clients send commands over a local Unix socket (or a localhost TCP port) and receive the
+    command output back. Commands run one at a time, since matplotlib and the working-directory
+    switch are process-wide state.
+    """
+
+    def __init__(self, socket_path=None, host='127.0.0.1', port=None, registry=None):
+        """
+        Initialize the server.
+
+        Args:
+            socket_path (str, optional): The Unix socket to listen on. Defaults to DEFAULT_SOCKET_PATH.
+            host (str, optional): The loopback interface to bind when `port` is given. Defaults to '127.0.0.1'.
+            port (int, optional): Listen on this TCP port instead of a Unix socket.
+            registry (DatasetRegistry, optional): The dataset registry shared by all commands.
+
+        Raises:
+            DataValidationError: If `host` is not a loopback address; requests run commands and write
+                files without authentication, so the server must not be reachable from the network.
+        """
+        if port is not None and not _is_loopback(host):
+            raise DataValidationError(f"The server only listens on loopback addresses, not '{host}'.")
+        self.socket_path = None if port is not None else (socket_path or DEFAULT_SOCKET_PATH)
+        self.host = host
+        self.port = port
+        self.registry = registry if registry is not None else DatasetRegistry()
+        self._command_lock = threading.Lock()
+        self._server = None
+
+    @property
+    def address(self):
+        """The address clients should connect to."""
+        if self._server is None:
+            return self.socket_path if self.port is None else (self.host, self.port)
+        return self._server.server_address
+
+    def preload(self, file_paths):
+        """
+        Load datasets into the registry ahead of the first request.
+
+        Args:
+            file_paths (iterable): Paths of the datasets to load.
+        """
+        for file_path in file_paths:
+            load_data(file_path)
+
+    def handle_request(self, request):
+        """
+        Dispatch a decoded client request.
+
+        Args:
+            request (dict): The request, with an 'action' of 'run', 'ping', 'datasets' or 'shutdown'.
+
+        Returns:
+            dict: The response with an 'exit_code' and 'output'.
+        """
+        action = request.get('action', 'run')
+        if action == 'ping':
+            return {'exit_code': 0, 'output': "pong\n"}
+        if action == 'datasets':
+            return {'exit_code': 0, 'output': "".join(f"{path}\n" for path in self.registry.datasets())}
+        if action == 'shutdown':
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {'exit_code': 0, 'output': "Server shutting down.\n"}
+        if action == 'run':
+            with self._command_lock:
+                exit_code, output = execute_command(request.get('args', []), cwd=request.get('cwd'))
+            return {'exit_code': exit_code, 'output': output}
+        return {'exit_code': 1, 'output': f"Error: unknown action '{action}'.\n"}
+
+    def start(self):
+        """
+        Bind the listening socket and enable the dataset registry.
+
+        Raises:
+            FileExistsError: If the socket path is not a socket, or another server is listening on it.
+        """
+        import matplotlib.pyplot as plt
+
+        if self.port is None:
+            _remove_stale_socket(self.socket_path)
+            self._server = _UnixServer(self.socket_path, _RequestHandler)
+        else:
+            self._server = _TCPServer((self.host, self.port), _RequestHandler)
+        self._server.data_server = self
+
+        plt.switch_backend('Agg')
+        enable_registry(self.registry)
+
+    def serve_forever(self):
+        """Start the server if needed and handle requests until `shutdown` is called."""
+        if self._server is None:
+            self.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if self.socket_path and os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def shutdown(self):
+        """Stop serving requests."""
+        if self._server is not None:
+            self._server.shutdown()
+
+
+def send_request(request, socket_path=None, host='127.0.0.1', port=None, timeout=None):
+    """
+    Send a request to a running DataServer and wait for the response.
+
+    Args:
+        request (dict): The request to send (see `DataServer.handle_request`).
+        socket_path (str, optional): The server's Unix socket. Defaults to DEFAULT_SOCKET_PATH.
+        host (str, optional): The server host when `port` is given.
+        port (int, optional): The server's TCP port, if it is not listening on a Unix socket.
+        timeout (float, optional): Socket timeout in seconds.
+
+    Returns:
+        dict: The decoded response.
+    """
+    if port is None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = socket_path or DEFAULT_SOCKET_PATH
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        address = (host, port)
+
+    with sock:
+        sock.settimeout(timeout)
+        sock.connect(address)
+        sock.sendall(json.dumps(request).encode('utf-8') + b"\n")
+        with sock.makefile('rb') as response_file:
+            line = response_file.readline()
+    return json.loads(line.decode('utf-8'))
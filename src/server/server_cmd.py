@@ -0,0 +1,78 @@
+import os
+import sys
+import click
+from .server import DataServer, DEFAULT_SOCKET_PATH, send_request
+
+@click.command(
+    help="""
+    **Run a Warm TidyData Server**
+
+    Keeps a single process alive with pandas, matplotlib, plotly and reportlab already imported and
+    every dataset it reads cached in memory. Send it commands with `tidydata client`.
+
+    ### Examples:
+
+    1. **Serve on the default Unix socket, preloading a dataset**:
+    \b
+    python cmd.py serve --preload data.csv
+
+    2. **Run a command against the server**:
+    \b
+    python cmd.py client clean trim-spaces data.csv --output trimmed.csv
+    """
+)
+@click.option('--socket', 'socket_path', default=DEFAULT_SOCKET_PATH, type=click.Path(), help='Unix socket to listen on.')
+@click.option('--port', default=None, type=int, help='Listen on this localhost TCP port instead of a Unix socket.')
+@click.option('--preload', multiple=True, type=click.Path(exists=True), help='Dataset to load before serving (repeatable).')
+def serve(socket_path, port, preload):
+    """Run a long-lived server that executes tidydata commands."""
+    server = DataServer(socket_path=socket_path, port=port)
+    try:
+        server.start()
+    except FileExistsError as e:
+        raise click.ClickException(str(e))
+    server.preload(preload)
+    print(f"TidyData server listening on {server.address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+@click.command(
+    context_settings={'ignore_unknown_options': True, 'allow_interspersed_args': False},
+    help="""
+    **Send a Command to a Running TidyData Server**
+
+    Everything after the client options is forwarded as a normal tidydata command line.
+
+    ### Examples:
+
+    \b
+    python cmd.py client report generate-txt data.csv --output_txt report.txt
+    python cmd.py client --ping
+    """
+)
+@click.option('--socket', 'socket_path', default=DEFAULT_SOCKET_PATH, type=click.Path(), help='Unix socket of the server.')
+@click.option('--port', default=None, type=int, help='TCP port of the server, if it is not using a Unix socket.')
+@click.option('--host', default='127.0.0.1', help='Host of the server when --port is given.')
+@click.option('--ping', is_flag=True, default=False, help='Check that the server is running.')
+@click.option('--datasets', is_flag=True, default=False, help='List the datasets cached by the server.')
+@click.option('--shutdown', is_flag=True, default=False, help='Stop the server.')
+@click.argument('args', nargs=-1, type=click.UNPROCESSED)
+def client(socket_path, port, host, ping, datasets, shutdown, args):
+    """Forward a tidydata command to a running server."""
+    if ping:
+        request = {'action': 'ping'}
+    elif datasets:
+        request = {'action': 'datasets'}
+    elif shutdown:
+        request = {'action': 'shutdown'}
+    else:
+        request = {'action': 'run', 'args': list(args), 'cwd': os.getcwd()}
+
+    response = send_request(request, socket_path=socket_path, host=host, port=port)
+    click.echo(response['output'], nl=False)
+    sys.exit(response['exit_code'])
+
+if __name__ == '__main__':
+    serve()
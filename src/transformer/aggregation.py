@@ -0,0 +1,207 @@
+import re
+
+import pandas as pd
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from src.utils.sketches import QuantileSketch
+
+AGGREGATIONS = ('sum', 'mean', 'count', 'min', 'max', 'nunique', 'median')
+NUMERIC_AGGREGATIONS = ('sum', 'mean', 'median')
+PERCENTILE_PATTERN = re.compile(r'^p(\d+(?:\.\d+)?)$')
+
+# The mergeable partial states each decomposable aggregation is rebuilt from.
+PARTIAL_STATES = {'sum': ('sum',), 'mean': ('sum', 'count'), 'count': ('count',), 'min': ('min',), 'max': ('max',)}
+
+
+def percentile(aggregation):
+    """
+    Return the quantile in [0, 1] for 'median' or a percentile name such as 'p90', otherwise None.
+
+    Args:
+        aggregation (str): The aggregation name.
+
+    Returns:
+        float or None: The quantile.
+    """
+    if aggregation == 'median':
+        return 0.5
+    match = PERCENTILE_PATTERN.match(aggregation)
+    if match and float(match.group(1)) <= 100:
+        return float(match.group(1)) / 100
+    return None
+
+
+def parse_aggregations(text):
+    """
+    Parse a 'column:aggregation,column:aggregation' option into (column, aggregation) pairs.
+
+    The same column may appear several times, e.g. 'Sales:sum,Sales:mean,Sales:p90'.
+
+    Args:
+        text (str): The option value.
+
+    Returns:
+        list: The (column, aggregation) pairs.
+
+    Raises:
+        DataValidationError: If an item is malformed or names an unknown aggregation.
+    """
+    pairs = []
+    for item in filter(None, (text or '').split(',')):
+        column, separator, aggregation = item.rpartition(':')
+        aggregation = aggregation.strip().lower()
+        if not separator or not column.strip():
+            raise DataValidationError(f"Expected 'column:aggregation', got '{item}'.")
+        if aggregation not in AGGREGATIONS and percentile(aggregation) is None:
+            raise DataValidationError(
+                f"Unsupported aggregation '{aggregation}'. Choose from: {', '.join(AGGREGATIONS)} or a percentile such as p90.")
+        pairs.append((column.strip(), aggregation))
+    if not pairs:
+        raise DataValidationError("At least one aggregation is required.")
+    return pairs
+
+
+def _check_columns(data, keys, aggregations):
+    for column in list(keys) + [column for column, _ in aggregations]:
+        if column not in data.columns:
+            raise ColumnNotFoundError(column)
+    for column, aggregation in aggregations:
+        if aggregation in NUMERIC_AGGREGATIONS or percentile(aggregation) is not None:
+            if not pd.api.types.is_numeric_dtype(data[column].dtype) or pd.api.types.is_bool_dtype(data[column].dtype):
+                raise DataValidationError(f"Column '{column}' must be numeric for '{aggregation}'.")
+
+
+def _output_name(column, aggregation):
+    return f"{column}_{aggregation}"
+
+
+def aggregate(data: pd.DataFrame, keys, aggregations, sort=True) -> pd.DataFrame:
+    """
+    Group rows by `keys` and compute several aggregations with pandas' vectorized group kernels.
+
+    Args:
+        data (pd.DataFrame): The rows to aggregate.
+        keys (list): The grouping columns. Categorical keys only produce observed groups.
+        aggregations (list): (column, aggregation) pairs; aggregations are 'sum', 'mean', 'count',
+            'min', 'max', 'nunique', 'median' or percentiles such as 'p90'.
+        sort (bool, optional): Sort the result by the keys. Disable to keep first-seen order, which is faster.
+
+    Returns:
+        pd.DataFrame: One row per group, indexed by the keys, with a '<column>_<aggregation>' column per pair.
+
+    Raises:
+        ColumnNotFoundError: If a key or aggregated column does not exist.
+        DataValidationError: If a numeric aggregation is requested for a non-numeric column.
+    """
+    keys = list(keys)
+    _check_columns(data, keys, aggregations)
+    grouped = data.groupby(keys, observed=True, sort=sort)
+    results = {}
+    for column, aggregation in aggregations:
+        q = percentile(aggregation)
+        results[_output_name(column, aggregation)] = (grouped[column].quantile(q) if q is not None
+                                                      else grouped[column].agg(aggregation))
+    return pd.DataFrame(results)
+
+
+class GroupAggregator:
+    """
+    Chunked group-by aggregation: partial aggregates per chunk, merged into the final result.
+
+    Sums, counts, means, minima and maxima are kept as small mergeable partial states per group and
+    are exact. Distinct counts keep the distinct (key, value) pairs. Medians and percentiles come
+    from a mergeable quantile sketch per group, exact up to a few thousand values per group.
+    """
+
+    def __init__(self, keys, aggregations, sort=True, merge_every=16):
+        self.keys = list(keys)
+        self.aggregations = list(aggregations)
+        self.sort = sort
+        self.merge_every = merge_every
+        self.partial_states = sorted({(column, state) for column, aggregation in self.aggregations
+                                      for state in PARTIAL_STATES.get(aggregation, ())})
+        self.partials = []
+        self.distinct = {column: [] for column, aggregation in self.aggregations if aggregation == 'nunique'}
+        self.sketches = {column: {} for column, aggregation in self.aggregations if percentile(aggregation) is not None}
+
+    def update(self, chunk: pd.DataFrame):
+        """
+        Fold a chunk of rows into the partial aggregates.
+
+        Args:
+            chunk (pd.DataFrame): The rows to add.
+        """
+        _check_columns(chunk, self.keys, self.aggregations)
+        grouped = chunk.groupby(self.keys, observed=True, sort=False)
+        if self.partial_states:
+            self.partials.append(pd.DataFrame({position: grouped[column].agg(state)
+                                               for position, (column, state) in enumerate(self.partial_states)}))
+            if len(self.partials) >= self.merge_every:
+                self.partials = [self._merge_partials()]
+
+        for column, pairs in self.distinct.items():
+            pairs.append(chunk[self.keys + [column]].drop_duplicates())
+            if len(pairs) >= self.merge_every:
+                self.distinct[column] = [pd.concat(pairs, ignore_index=True).drop_duplicates()]
+
+        for column, sketches in self.sketches.items():
+            for key, values in grouped[column]:
+                key = key[0] if len(self.keys) == 1 else key
+                sketches.setdefault(key, QuantileSketch()).update(values.to_numpy())
+
+    def _merge_partials(self):
+        combined = pd.concat(self.partials)
+        grouped = combined.groupby(level=list(range(len(self.keys))), sort=False)
+        # Counts are merged by adding them, like sums; minima and maxima by taking the extreme.
+        return pd.DataFrame({position: grouped[position].agg('sum' if state == 'count' else state)
+                             for position, (_, state) in enumerate(self.partial_states)})
+
+    def result(self) -> pd.DataFrame:
+        """
+        Merge the partial aggregates into the final result.
+
+        Returns:
+            pd.DataFrame: The same layout as `aggregate`.
+        """
+        partials = self._merge_partials().set_axis(pd.MultiIndex.from_tuples(self.partial_states), axis=1) if self.partials else None
+        results = {}
+        for column, aggregation in self.aggregations:
+            if aggregation in PARTIAL_STATES:
+                if partials is None:
+                    values = pd.Series(dtype=float)
+                elif aggregation == 'mean':
+                    values = partials[(column, 'sum')] / partials[(column, 'count')].where(partials[(column, 'count')] > 0)
+                else:
+                    values = partials[(column, PARTIAL_STATES[aggregation][0])]
+            elif aggregation == 'nunique':
+                pairs = pd.concat(self.distinct[column], ignore_index=True) if self.distinct[column] else pd.DataFrame(columns=self.keys + [column])
+                values = pairs.groupby(self.keys, observed=True, sort=False)[column].nunique()
+            else:
+                q = percentile(aggregation)
+                values = pd.Series({key: sketch.quantile(q) for key, sketch in self.sketches[column].items()}, dtype=float)
+            results[_output_name(column, aggregation)] = values
+
+        frame = pd.DataFrame(results)
+        if len(self.keys) > 1 and not isinstance(frame.index, pd.MultiIndex):
+            frame.index = pd.MultiIndex.from_tuples(list(frame.index), names=self.keys)
+        frame.index.names = self.keys
+        return frame.sort_index() if self.sort else frame
+
+
+def aggregate_file(input_file, keys, aggregations, chunksize=100000, sort=True) -> pd.DataFrame:
+    """
+    Group-by aggregation over a CSV file that may not fit in memory.
+
+    Args:
+        input_file (str): The CSV file to aggregate.
+        keys (list): The grouping columns.
+        aggregations (list): (column, aggregation) pairs, as for `aggregate`.
+        chunksize (int, optional): Rows per chunk. Defaults to 100000.
+        sort (bool, optional): Sort the result by the keys.
+
+    Returns:
+        pd.DataFrame: One row per group, indexed by the keys.
+    """
+    aggregator = GroupAggregator(keys, aggregations, sort=sort)
+    for chunk in pd.read_csv(input_file, chunksize=chunksize):
+        aggregator.update(chunk)
+    return aggregator.result()
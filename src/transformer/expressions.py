@@ -0,0 +1,252 @@
+import ast
+import operator
+import re
+
+import numpy as np
+import pandas as pd
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+
+_STRING_LITERAL = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")""")
+_BACKTICK = re.compile(r"`([^`]+)`")
+_CASE_KEYWORDS = [(re.compile(r'\bcase\s+when\b', re.IGNORECASE), ' _case( '),
+                  (re.compile(r'\b(?:when|then|else)\b', re.IGNORECASE), ' , '),
+                  (re.compile(r'\bend\b', re.IGNORECASE), ' ) ')]
+
+_BINARY_OPERATORS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+                     ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod, ast.Pow: operator.pow,
+                     ast.BitAnd: operator.and_, ast.BitOr: operator.or_}
+_COMPARISONS = {ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Lt: operator.lt, ast.LtE: operator.le,
+                ast.Gt: operator.gt, ast.GtE: operator.ge}
+
+
+def _datetimes(values):
+    return values if pd.api.types.is_datetime64_any_dtype(values) else pd.to_datetime(values, errors='coerce')
+
+
+def _strings(values):
+    return values.astype('string') if isinstance(values, pd.Series) else str(values)
+
+
+def _case(*arguments):
+    conditions, choices = list(arguments[0:-1:2]), list(arguments[1::2])
+    default = arguments[-1] if len(arguments) % 2 else np.nan
+    if len(arguments) % 2:
+        choices = choices[:len(conditions)]
+    index = next((value.index for value in arguments if isinstance(value, pd.Series)), None)
+    conditions = [np.asarray(condition, dtype=bool) if not isinstance(condition, pd.Series)
+                  else condition.fillna(False).to_numpy(dtype=bool) for condition in conditions]
+    choices = [choice.to_numpy() if isinstance(choice, pd.Series) else choice for choice in choices]
+    default = default.to_numpy() if isinstance(default, pd.Series) else default
+    try:
+        result = np.select(conditions, choices, default=default)
+    except TypeError:
+        # Choices without a common dtype (e.g. strings with no `else`) are combined as objects.
+        if not len(arguments) % 2:
+            default = None
+        result = np.select(conditions, [np.asarray(choice, dtype=object) for choice in choices],
+                           default=np.asarray(default, dtype=object))
+    return pd.Series(result, index=index).infer_objects() if index is not None else result
+
+
+FUNCTIONS = {
+    'year': lambda values: _datetimes(values).dt.year,
+    'month': lambda values: _datetimes(values).dt.month,
+    'day': lambda values: _datetimes(values).dt.day,
+    'weekday': lambda values: _datetimes(values).dt.weekday,
+    'hour': lambda values: _datetimes(values).dt.hour,
+    'quarter': lambda values: _datetimes(values).dt.quarter,
+    'date': lambda values: _datetimes(values).dt.normalize(),
+    'to_datetime': _datetimes,
+    'to_number': lambda values: pd.to_numeric(values, errors='coerce'),
+    'str': _strings,
+    'upper': lambda values: _strings(values).str.upper(),
+    'lower': lambda values: _strings(values).str.lower(),
+    'strip': lambda values: _strings(values).str.strip(),
+    'length': lambda values: _strings(values).str.len(),
+    'concat': lambda *values: _concat(values),
+    'coalesce': lambda first, *rest: _coalesce(first, rest),
+    'if_else': lambda condition, when_true, when_false: _case(condition, when_true, when_false),
+    'abs': np.abs,
+    'round': lambda values, digits=0: np.round(values, int(digits)),
+    'sqrt': np.sqrt,
+    'log': np.log,
+    'exp': np.exp,
+    'isnull': pd.isna,
+    'notnull': pd.notna,
+    '_case': _case,
+}
+
+
+def _concat(values):
+    result = _strings(values[0])
+    for value in values[1:]:
+        result = result + _strings(value)
+    return result
+
+
+def _coalesce(first, rest):
+    result = first
+    for value in rest:
+        result = result.fillna(value) if isinstance(result, pd.Series) else result
+    return result
+
+
+def _rewrite(expression):
+    """Turn backticked names into identifiers and CASE WHEN syntax into a `_case(...)` call."""
+    names = {}
+
+    def quote(match):
+        placeholder = f"__column_{len(names)}__"
+        names[placeholder] = match.group(1)
+        return placeholder
+
+    parts = _STRING_LITERAL.split(expression)
+    for i in range(0, len(parts), 2):
+        part = _BACKTICK.sub(quote, parts[i])
+        for pattern, replacement in _CASE_KEYWORDS:
+            part = pattern.sub(replacement, part)
+        parts[i] = part
+    return ''.join(parts), names
+
+
+class _Evaluator:
+    def __init__(self, data, names):
+        self.data = data
+        self.names = names
+
+    def evaluate(self, node):
+        method = getattr(self, f"_{type(node).__name__}", None)
+        if method is None:
+            raise DataValidationError(f"Unsupported syntax in expression: {type(node).__name__}.")
+        return method(node)
+
+    def _Expression(self, node):
+        return self.evaluate(node.body)
+
+    def _Name(self, node):
+        column = self.names.get(node.id, node.id)
+        if column in self.data.columns:
+            return self.data[column]
+        if column in ('True', 'False', 'None'):
+            return {'True': True, 'False': False, 'None': None}[column]
+        raise ColumnNotFoundError(column)
+
+    def _Constant(self, node):
+        return node.value
+
+    def _BinOp(self, node):
+        if type(node.op) not in _BINARY_OPERATORS:
+            raise DataValidationError(f"Unsupported operator: {type(node.op).__name__}.")
+        return _BINARY_OPERATORS[type(node.op)](self.evaluate(node.left), self.evaluate(node.right))
+
+    def _UnaryOp(self, node):
+        operand = self.evaluate(node.operand)
+        if isinstance(node.op, ast.USub):
+            return -operand
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        return ~operand if isinstance(operand, pd.Series) else not operand
+
+    def _BoolOp(self, node):
+        combine = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+        result = self.evaluate(node.values[0])
+        for value in node.values[1:]:
+            result = combine(result, self.evaluate(value))
+        return result
+
+    def _Compare(self, node):
+        result = None
+        left = self.evaluate(node.left)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = self.evaluate(comparator)
+            if isinstance(op, (ast.In, ast.NotIn)):
+                part = left.isin(right) if isinstance(left, pd.Series) else left in right
+                part = ~part if isinstance(op, ast.NotIn) else part
+            elif type(op) in _COMPARISONS:
+                part = _COMPARISONS[type(op)](left, right)
+            else:
+                raise DataValidationError(f"Unsupported comparison: {type(op).__name__}.")
+            result = part if result is None else result & part
+            left = right
+        return result
+
+    def _List(self, node):
+        return [self.evaluate(element) for element in node.elts]
+
+    _Tuple = _List
+
+    def _Call(self, node):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            name = node.func.id if isinstance(node.func, ast.Name) else type(node.func).__name__
+            raise DataValidationError(f"Unknown function '{name}'. Available: {', '.join(sorted(f for f in FUNCTIONS if f[0] != '_'))}.")
+        return FUNCTIONS[node.func.id](*(self.evaluate(argument) for argument in node.args))
+
+
+def parse_assignment(text):
+    """
+    Split a 'name = expression' definition.
+
+    Args:
+        text (str): The definition, e.g. 'total = price * qty'.
+
+    Returns:
+        tuple: (name, expression).
+
+    Raises:
+        DataValidationError: If there is no assignment.
+    """
+    match = re.match(r'^\s*(`[^`]+`|[^=<>!\s][^=<>!]*?)\s*=(?!=)\s*(.+)$', text, re.DOTALL)
+    if not match:
+        raise DataValidationError(f"Expected 'name = expression', got '{text}'.")
+    return match.group(1).strip('`').strip(), match.group(2).strip()
+
+
+def evaluate_expression(data: pd.DataFrame, expression: str):
+    """
+    Evaluate an expression over whole columns at once, without row-wise `apply`.
+
+    Supported: arithmetic, comparisons (including chained and `in [...]`), `and`/`or`/`not`,
+    string concatenation with `+` or `concat(...)`, `case when ... then ... else ... end`, and the
+    functions in `FUNCTIONS` (date parts such as `year(col)`, `upper`, `coalesce`, `if_else`, ...).
+    Column names with spaces go in backticks.
+
+    Args:
+        data (pd.DataFrame): The columns the expression may refer to.
+        expression (str): The expression.
+
+    Returns:
+        pd.Series or scalar: The result.
+
+    Raises:
+        ColumnNotFoundError: If the expression refers to an unknown column.
+        DataValidationError: If the expression is invalid or uses unsupported syntax.
+    """
+    rewritten, names = _rewrite(expression)
+    try:
+        tree = ast.parse(rewritten.strip(), mode='eval')
+    except SyntaxError as e:
+        raise DataValidationError(f"Invalid expression '{expression}': {e.msg}")
+    try:
+        return _Evaluator(data, names).evaluate(tree)
+    except (TypeError, ValueError, ArithmeticError) as e:
+        raise DataValidationError(f"Could not evaluate expression '{expression}': {e}")
+
+
+def derive_columns(data: pd.DataFrame, expressions) -> pd.DataFrame:
+    """
+    Add or replace columns defined by 'name = expression' definitions, in order.
+
+    Later definitions may use columns defined earlier.
+
+    Args:
+        data (pd.DataFrame): The input rows.
+        expressions (list): Definitions such as ['total = price * qty', "size = case when total > 100 then 'big' else 'small' end"].
+
+    Returns:
+        pd.DataFrame: A copy of the data with the derived columns.
+    """
+    data = data.copy()
+    for text in expressions:
+        name, expression = parse_assignment(text)
+        data[name] = evaluate_expression(data, expression)
+    return data
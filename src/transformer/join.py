@@ -0,0 +1,173 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from src.utils.writers import open_output
+
+JOIN_TYPES = ('inner', 'left', 'anti')
+DEFAULT_MEMORY_LIMIT = 1024 * 1024 * 1024
+SUFFIXES = ('', '_right')
+
+
+def _check_join(left, right, on, how):
+    if how not in JOIN_TYPES:
+        raise DataValidationError(f"Unsupported join type '{how}'. Choose from: {', '.join(JOIN_TYPES)}.")
+    if not on:
+        raise DataValidationError("At least one join key is required.")
+    for frame in (left, right):
+        for column in on:
+            if column not in frame.columns:
+                raise ColumnNotFoundError(column)
+
+
+def _key_index(data, on):
+    return pd.MultiIndex.from_frame(data[on]) if len(on) > 1 else pd.Index(data[on[0]])
+
+
+def join_frames(left: pd.DataFrame, right: pd.DataFrame, on, how='inner') -> pd.DataFrame:
+    """
+    Join two DataFrames on one or more key columns with a hash join.
+
+    Args:
+        left (pd.DataFrame): The left rows; all of them are kept by a 'left' join.
+        right (pd.DataFrame): The right (lookup) rows.
+        on (list): The key columns, present in both frames.
+        how (str, optional): 'inner', 'left', or 'anti' (left rows without a match). Defaults to 'inner'.
+
+    Returns:
+        pd.DataFrame: The joined rows. Right columns that clash with left ones get a '_right' suffix.
+
+    Raises:
+        ColumnNotFoundError: If a key column is missing from either frame.
+        DataValidationError: If the join type is not supported or no keys are given.
+    """
+    on = list(on)
+    _check_join(left, right, on, how)
+    if how == 'anti':
+        return left[~_key_index(left, on).isin(_key_index(right, on))]
+    return left.merge(right, on=on, how=how, suffixes=SUFFIXES)
+
+
+def fan_out(left_rows, output_rows, matched_rows, how) -> float:
+    """
+    Average number of joined rows per left row that found a match.
+
+    Args:
+        left_rows (int): Rows in the left input.
+        output_rows (int): Rows in the join result.
+        matched_rows (int): Left rows with at least one match.
+        how (str): The join type.
+
+    Returns:
+        float: The fan-out, 0.0 for anti joins or when nothing matched.
+    """
+    if how == 'anti' or not matched_rows:
+        return 0.0
+    # Unmatched rows of a left join pass through once each and do not count towards the fan-out.
+    return (output_rows - (left_rows - matched_rows if how == 'left' else 0)) / matched_rows
+
+
+class _JoinWriter:
+    """Append joined chunks to the output CSV stream, counting rows and left rows that found a match."""
+
+    def __init__(self, file, on, how):
+        self.file = file
+        self.on = on
+        self.how = how
+        self.left_rows = 0
+        self.output_rows = 0
+        self.matched_rows = 0
+        self.header = True
+
+    def write(self, left, right):
+        matched = _key_index(left, self.on).isin(_key_index(right, self.on))
+        joined = join_frames(left, right, self.on, self.how)
+        self.left_rows += len(left)
+        self.matched_rows += int(matched.sum())
+        self.output_rows += len(joined)
+        if len(joined) or self.header:
+            joined.to_csv(self.file, index=False, header=self.header)
+            self.header = False
+
+
+def join_files(left_file, right_file, output, on, how='inner', memory_limit=DEFAULT_MEMORY_LIMIT,
+               chunksize=100000, partitions=64, temp_dir=None) -> dict:
+    """
+    Join two CSV files that may not fit in memory, writing the result to `output`.
+
+    If the right file is no larger than `memory_limit` bytes it is loaded once and broadcast: the
+    left file is streamed in chunks and each chunk is hash-joined against it. Otherwise both files
+    are hash-partitioned on the keys into `partitions` spill files on local disk and each pair of
+    partitions is joined in memory (a grace hash join). Values are read and compared as the text in
+    the files, so '1' and '1.0' do not match, and are written back unchanged.
+
+    Args:
+        left_file (str): The left CSV file.
+        right_file (str): The right (lookup) CSV file.
+        output (str): The CSV file to write.
+        on (list): The key columns, present in both files.
+        how (str, optional): 'inner', 'left' or 'anti'. Defaults to 'inner'.
+        memory_limit (int, optional): Largest right file size on disk, in bytes, to broadcast. Defaults to 1 GiB.
+            Parsed rows take several times their size on disk in memory, so leave headroom.
+        chunksize (int, optional): Rows per chunk when streaming. Defaults to 100000.
+        partitions (int, optional): Number of spill partitions per side. Defaults to 64.
+        temp_dir (str, optional): Where to put the spill files. Defaults to the system temp directory.
+
+    Returns:
+        dict: 'strategy' ('broadcast' or 'partitioned'), 'left_rows', 'right_rows', 'output_rows',
+        'matched_left_rows' and 'fan_out' (joined rows per matched left row).
+    """
+    on = list(on)
+    read_options = {'dtype': str, 'keep_default_na': False}
+    left_head = pd.read_csv(left_file, nrows=0)
+    right_head = pd.read_csv(right_file, nrows=0)
+    _check_join(left_head, right_head, on, how)
+
+    with open_output(output) as out:
+        writer = _JoinWriter(out, on, how)
+        if os.path.getsize(right_file) <= memory_limit:
+            strategy = 'broadcast'
+            right = pd.read_csv(right_file, **read_options)
+            right_rows = len(right)
+            for chunk in pd.read_csv(left_file, chunksize=chunksize, **read_options):
+                writer.write(chunk, right)
+            if writer.left_rows == 0:
+                writer.write(left_head.astype(str), right)
+        else:
+            strategy = 'partitioned'
+            work_dir = tempfile.mkdtemp(prefix='tidydata-join-', dir=temp_dir)
+            try:
+                _spill_partitions(left_file, os.path.join(work_dir, 'left'), on, read_options, chunksize, partitions)
+                right_rows = _spill_partitions(right_file, os.path.join(work_dir, 'right'), on, read_options, chunksize, partitions)
+                for partition in range(partitions):
+                    left_part = _read_partition(os.path.join(work_dir, f'left-{partition}.csv'), left_head, read_options)
+                    right_part = _read_partition(os.path.join(work_dir, f'right-{partition}.csv'), right_head, read_options)
+                    if len(left_part) or partition == partitions - 1:
+                        writer.write(left_part, right_part)
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+    return {'strategy': strategy, 'left_rows': writer.left_rows, 'right_rows': right_rows,
+            'output_rows': writer.output_rows, 'matched_left_rows': writer.matched_rows,
+            'fan_out': fan_out(writer.left_rows, writer.output_rows, writer.matched_rows, how)}
+
+
+def _spill_partitions(input_file, prefix, on, read_options, chunksize, partitions):
+    rows = 0
+    written = set()
+    for chunk in pd.read_csv(input_file, chunksize=chunksize, **read_options):
+        partition_ids = pd.util.hash_pandas_object(chunk[on], index=False).to_numpy() % np.uint64(partitions)
+        for partition in np.unique(partition_ids):
+            path = f"{prefix}-{int(partition)}.csv"
+            chunk[partition_ids == partition].to_csv(path, mode='a', index=False, header=path not in written)
+            written.add(path)
+        rows += len(chunk)
+    return rows
+
+
+def _read_partition(path, head, read_options):
+    if not os.path.exists(path):
+        return head.astype(str)
+    return pd.read_csv(path, **read_options)
@@ -0,0 +1,217 @@
+import re
+
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from src.utils.filtering import filter_frame
+
+RESAMPLE_AGGREGATIONS = ('mean', 'sum', 'count', 'min', 'max')
+
+# The mergeable partial states the resample aggregations are rebuilt from, as in aggregation.PARTIAL_STATES.
+PARTIAL_STATES = ('sum', 'count', 'min', 'max')
+
+# Older pandas frequency aliases, still common in scripts, mapped to the current spelling.
+_LEGACY_ALIASES = {'H': 'h', 'T': 'min', 'S': 's', 'L': 'ms', 'U': 'us', 'N': 'ns', 'M': 'ME', 'Q': 'QE', 'Y': 'YE', 'A': 'YE'}
+_RULE_PATTERN = re.compile(r'^\s*(\d*)\s*([A-Za-z-]+)\s*$')
+
+
+def parse_rule(rule):
+    """
+    Parse a resampling frequency such as '1H', '15min', 'D', 'W' or 'M' into a pandas offset.
+
+    Args:
+        rule (str): The bucket size.
+
+    Returns:
+        pd.DateOffset: The offset.
+
+    Raises:
+        DataValidationError: If the frequency is not understood.
+    """
+    match = _RULE_PATTERN.match(str(rule))
+    if match:
+        rule = match.group(1) + _LEGACY_ALIASES.get(match.group(2), match.group(2))
+    try:
+        return to_offset(rule)
+    except ValueError:
+        raise DataValidationError(f"Invalid resampling frequency '{rule}'. Use e.g. '1h', '15min', 'D', 'W' or 'ME'.")
+
+
+def parse_resample_aggregations(text):
+    """
+    Parse a comma-separated list of resample aggregations such as 'mean,max'.
+
+    Args:
+        text (str or list): The aggregations.
+
+    Returns:
+        list: The aggregation names.
+
+    Raises:
+        DataValidationError: If an aggregation is not supported.
+    """
+    names = [name.strip().lower() for name in (text.split(',') if isinstance(text, str) else text) if name.strip()]
+    for name in names:
+        if name not in RESAMPLE_AGGREGATIONS:
+            raise DataValidationError(f"Unsupported aggregation '{name}'. Choose from: {', '.join(RESAMPLE_AGGREGATIONS)}.")
+    if not names:
+        raise DataValidationError("At least one aggregation is required.")
+    return names
+
+
+def _check_columns(columns, time_column, value_columns):
+    for column in [time_column] + list(value_columns):
+        if column not in columns:
+            raise ColumnNotFoundError(column)
+
+
+def _time_indexed(data, time_column, value_columns):
+    """The value columns indexed by the parsed time column, without rows whose time is missing or invalid."""
+    times = data[time_column]
+    if not pd.api.types.is_datetime64_any_dtype(times.dtype):
+        times = pd.to_datetime(times, errors='coerce')
+    frame = data[list(value_columns)].set_axis(pd.DatetimeIndex(times, name=time_column), axis=0)
+    return frame[frame.index.notna()]
+
+
+def _check_numeric(frame, aggregations):
+    if any(aggregation in ('mean', 'sum') for aggregation in aggregations):
+        for column in frame.columns:
+            if not pd.api.types.is_numeric_dtype(frame[column].dtype) or pd.api.types.is_bool_dtype(frame[column].dtype):
+                raise DataValidationError(f"Column '{column}' must be numeric for 'mean' and 'sum'.")
+
+
+def resample_frame(data: pd.DataFrame, time_column, value_columns, rule, aggregations=('mean',)) -> pd.DataFrame:
+    """
+    Aggregate columns into fixed time buckets with pandas resampling.
+
+    The time column is parsed once into a datetime index. Buckets are aligned to the Unix epoch,
+    so the same rule always gives the same bucket boundaries, and empty buckets inside the time
+    range are kept (their mean, minimum and maximum are missing; their sum and count are 0).
+
+    Args:
+        data (pd.DataFrame): The rows to resample.
+        time_column (str): The column holding the timestamps. Rows with a missing or unparsable time are dropped.
+        value_columns (list): The columns to aggregate.
+        rule (str): The bucket size, e.g. '1h', '15min', 'D', 'W' or 'ME'.
+        aggregations (list, optional): Names from RESAMPLE_AGGREGATIONS. Defaults to ['mean'].
+
+    Returns:
+        pd.DataFrame: One row per bucket, indexed by its label (the bucket start; the end for 'W' and 'ME'),
+            with a '<column>_<aggregation>' column per pair.
+
+    Raises:
+        ColumnNotFoundError: If a column does not exist.
+        DataValidationError: If the rule or an aggregation is not supported, or 'mean' or 'sum' is asked of a non-numeric column.
+    """
+    offset = parse_rule(rule)
+    aggregations = parse_resample_aggregations(aggregations)
+    _check_columns(data.columns, time_column, value_columns)
+    frame = _time_indexed(data, time_column, value_columns)
+    _check_numeric(frame, aggregations)
+
+    resampled = frame.resample(offset, origin='epoch')
+    results = {f"{column}_{aggregation}": resampled[column].agg(aggregation)
+               for column in value_columns for aggregation in aggregations}
+    return pd.DataFrame(results).rename_axis(time_column)
+
+
+class TimeBucketAggregator:
+    """
+    Streaming resampling: per-chunk bucket partials (sum, count, min, max) merged into the final buckets.
+
+    Every chunk is bucketed with the same epoch-aligned rule, so a bucket split across chunks, or
+    rows arriving out of order, merge into exactly the result `resample_frame` gives for all the rows.
+    """
+
+    def __init__(self, time_column, value_columns, rule, aggregations=('mean',), merge_every=16):
+        self.time_column = time_column
+        self.value_columns = list(value_columns)
+        self.offset = parse_rule(rule)
+        self.aggregations = parse_resample_aggregations(aggregations)
+        self.merge_every = merge_every
+        self.partial_states = [(column, state) for column in self.value_columns for state in PARTIAL_STATES]
+        self.partials = []
+
+    def update(self, chunk: pd.DataFrame):
+        """
+        Fold a chunk of rows into the bucket partials.
+
+        Args:
+            chunk (pd.DataFrame): The rows to add.
+        """
+        _check_columns(chunk.columns, self.time_column, self.value_columns)
+        frame = _time_indexed(chunk, self.time_column, self.value_columns)
+        _check_numeric(frame, self.aggregations)
+        if frame.empty:
+            return
+        resampled = frame.resample(self.offset, origin='epoch')
+        self.partials.append(pd.DataFrame({position: resampled[column].agg(state)
+                                           for position, (column, state) in enumerate(self.partial_states)}))
+        if len(self.partials) >= self.merge_every:
+            self.partials = [self._merge_partials()]
+
+    def _merge_partials(self):
+        grouped = pd.concat(self.partials).groupby(level=0)
+        # Sums and counts add up across chunks; minima and maxima keep the extreme.
+        return pd.DataFrame({position: grouped[position].agg('sum' if state == 'count' else state)
+                             for position, (_, state) in enumerate(self.partial_states)})
+
+    def result(self) -> pd.DataFrame:
+        """
+        Merge the partials into the final buckets, filling the empty buckets between them.
+
+        Returns:
+            pd.DataFrame: The same layout as `resample_frame`.
+        """
+        index = pd.DatetimeIndex([], name=self.time_column)
+        partials = None
+        if self.partials:
+            partials = self._merge_partials().set_axis(pd.MultiIndex.from_tuples(self.partial_states), axis=1)
+            index = pd.date_range(partials.index.min(), partials.index.max(), freq=self.offset, name=self.time_column)
+            partials = partials.reindex(index)
+
+        results = {}
+        for column in self.value_columns:
+            for aggregation in self.aggregations:
+                if partials is None:
+                    values = pd.Series(dtype=float, index=index)
+                elif aggregation == 'mean':
+                    counts = partials[(column, 'count')]
+                    values = partials[(column, 'sum')] / counts.where(counts > 0)
+                elif aggregation in ('sum', 'count'):
+                    values = partials[(column, aggregation)].fillna(0)
+                    values = values.astype('int64') if aggregation == 'count' else values
+                else:
+                    values = partials[(column, aggregation)]
+                results[f"{column}_{aggregation}"] = values
+        return pd.DataFrame(results, index=index)
+
+
+def resample_file(input_file, time_column, value_columns, rule, aggregations=('mean',), chunksize=100000, where=None) -> pd.DataFrame:
+    """
+    Resample a CSV file that may not fit in memory, one chunk at a time.
+
+    Only the bucket partials are kept in memory, so a year of per-second rows costs one small row
+    per bucket.
+
+    Args:
+        input_file (str): The CSV file.
+        time_column (str): The column holding the timestamps.
+        value_columns (list): The columns to aggregate.
+        rule (str): The bucket size, e.g. '1h'.
+        aggregations (list, optional): Names from RESAMPLE_AGGREGATIONS. Defaults to ['mean'].
+        chunksize (int, optional): Rows per chunk. Defaults to 100000.
+        where (str, optional): Only use rows matching this filter expression.
+
+    Returns:
+        pd.DataFrame: The same layout as `resample_frame`.
+
+    Raises:
+        ColumnNotFoundError: If a column is not in the file.
+    """
+    _check_columns(pd.read_csv(input_file, nrows=0).columns, time_column, value_columns)
+    aggregator = TimeBucketAggregator(time_column, value_columns, rule, aggregations)
+    for chunk in pd.read_csv(input_file, chunksize=chunksize, usecols=None if where else [time_column] + list(value_columns)):
+        aggregator.update(filter_frame(chunk, where) if where else chunk)
+    return aggregator.result()
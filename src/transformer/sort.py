@@ -0,0 +1,245 @@
+import csv
+import heapq
+import os
+import shutil
+import tempfile
+from functools import total_ordering
+
+import numpy as np
+import pandas as pd
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from src.utils.writers import open_output, write_csv
+
+DEFAULT_MEMORY_LIMIT = 1024 * 1024 * 1024
+
+
+def parse_sort_keys(text):
+    """
+    Parse a 'column[:asc|desc],...' option into key columns and sort directions.
+
+    Args:
+        text (str): The option value, e.g. 'Country,Amount:desc'.
+
+    Returns:
+        tuple: (columns, ascending) lists.
+
+    Raises:
+        DataValidationError: If a direction is not 'asc' or 'desc', or no keys are given.
+    """
+    columns, ascending = [], []
+    for item in filter(None, (text or '').split(',')):
+        column, separator, direction = item.rpartition(':')
+        if not separator:
+            column, direction = item, 'asc'
+        direction = direction.strip().lower()
+        if direction not in ('asc', 'desc'):
+            raise DataValidationError(f"Sort direction must be 'asc' or 'desc', got '{direction}'.")
+        columns.append(column.strip())
+        ascending.append(direction == 'asc')
+    if not columns:
+        raise DataValidationError("At least one sort key is required.")
+    return columns, ascending
+
+
+def _check_keys(data, by, ascending):
+    for column in by:
+        if column not in data.columns:
+            raise ColumnNotFoundError(column)
+    if len(ascending) != len(by):
+        raise DataValidationError("Give one sort direction per key column.")
+
+
+def sort_order(keys: pd.DataFrame, by, ascending, n=None) -> pd.Index:
+    """
+    Return the index labels of `keys` in sorted order, or only the first `n` of them.
+
+    Missing values sort last. For a top-N on numeric keys sorted in one direction, `nsmallest` /
+    `nlargest` select the rows with a partial sort instead of sorting everything.
+
+    Args:
+        keys (pd.DataFrame): The key columns.
+        by (list): The key column names, most significant first.
+        ascending (list): One direction per key.
+        n (int, optional): Only return the first `n` labels.
+
+    Returns:
+        pd.Index: The ordered labels.
+    """
+    numeric = all(pd.api.types.is_numeric_dtype(keys[column].dtype) and not pd.api.types.is_bool_dtype(keys[column].dtype)
+                  for column in by)
+    if n is not None and numeric and len(set(ascending)) == 1:
+        select = keys.nsmallest if ascending[0] else keys.nlargest
+        top = select(n, by, keep='first').index
+        if len(top) == min(n, len(keys)):
+            return top
+    order = keys.sort_values(by, ascending=ascending, na_position='last', kind='stable').index
+    return order if n is None else order[:n]
+
+
+def sort_frame(data: pd.DataFrame, by, ascending, n=None) -> pd.DataFrame:
+    """
+    Sort a DataFrame in memory on one or more keys, or select its top `n` rows.
+
+    Args:
+        data (pd.DataFrame): The rows to sort.
+        by (list): The key columns, most significant first.
+        ascending (list): One direction per key.
+        n (int, optional): Only keep the first `n` rows of the sorted order.
+
+    Returns:
+        pd.DataFrame: The sorted rows. Ties keep their input order.
+
+    Raises:
+        ColumnNotFoundError: If a key column does not exist.
+        DataValidationError: If the number of directions does not match the keys.
+    """
+    by, ascending = list(by), list(ascending)
+    _check_keys(data, by, ascending)
+    if n is not None and (not isinstance(n, int) or n <= 0):
+        raise DataValidationError("Parameter 'n' must be a positive integer.")
+    return data.loc[sort_order(data[by], by, ascending, n)]
+
+
+@total_ordering
+class _Descending:
+    """Wraps a value so that it compares in reverse order."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return self.value > other.value
+
+
+class _KeyTyper:
+    """
+    Types the key columns of text chunks consistently across a whole file.
+
+    Files are read as text so rows are written back unchanged; key columns are parsed as numbers
+    if they are numeric in the first chunk, and empty keys count as missing.
+    """
+
+    def __init__(self, first_chunk, by):
+        self.by = by
+        self.numeric = {}
+        for column in by:
+            values = first_chunk[column].mask(first_chunk[column] == '').dropna()
+            self.numeric[column] = len(values) > 0 and pd.to_numeric(values, errors='coerce').notna().all()
+
+    def keys(self, chunk):
+        return pd.DataFrame({column: pd.to_numeric(chunk[column], errors='coerce') if self.numeric[column]
+                             else chunk[column].mask(chunk[column] == '') for column in self.by}, index=chunk.index)
+
+    def merge_keys(self, keys, ascending):
+        """Row-wise comparable tuples (missing values last) for the k-way heap merge."""
+        columns = []
+        for column, asc in zip(self.by, ascending):
+            values = keys[column]
+            missing = values.isna().tolist()
+            filled = values.fillna(0 if self.numeric[column] else '').tolist()
+            if not asc:
+                filled = [-value for value in filled] if self.numeric[column] else [_Descending(value) for value in filled]
+            columns.extend([missing, filled])
+        return list(zip(*columns))
+
+
+def _read_text(path, chunksize=None):
+    return pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunksize)
+
+
+def sort_file(input_file, output, by, ascending, n=None, chunksize=100000, memory_limit=DEFAULT_MEMORY_LIMIT,
+              temp_dir=None) -> dict:
+    """
+    Sort a CSV file on one or more keys, or select its top `n` rows, writing the result to `output`.
+
+    Files up to `memory_limit` bytes are sorted in memory. Larger files get an external merge sort:
+    each chunk is sorted and spilled to disk as a run, and the runs are combined with a k-way heap
+    merge. A top-N never sorts the whole file: each chunk's top `n` rows are merged into a bounded
+    candidate set. On every path values are read as text and written back unchanged, so the output
+    does not depend on which strategy is used.
+
+    Args:
+        input_file (str): The CSV file to sort.
+        output (str): The CSV file to write.
+        by (list): The key columns, most significant first.
+        ascending (list): One direction per key.
+        n (int, optional): Only write the first `n` rows of the sorted order.
+        chunksize (int, optional): Rows per chunk and per sorted run. Defaults to 100000.
+        memory_limit (int, optional): Largest file size on disk, in bytes, sorted in memory. Defaults to 1 GiB.
+        temp_dir (str, optional): Where to put the sorted runs. Defaults to the system temp directory.
+
+    Returns:
+        dict: 'strategy' ('memory', 'top-n' or 'external'), 'rows' read and 'runs' spilled.
+    """
+    by, ascending = list(by), list(ascending)
+    _check_keys(pd.read_csv(input_file, nrows=0), by, ascending)
+    if n is not None and (not isinstance(n, int) or n <= 0):
+        raise DataValidationError("Parameter 'n' must be a positive integer.")
+
+    if os.path.getsize(input_file) <= memory_limit:
+        data = _read_text(input_file)
+        write_csv(data.loc[sort_order(_KeyTyper(data, by).keys(data), by, ascending, n)], output)
+        return {'strategy': 'memory', 'rows': len(data), 'runs': 0}
+    if n is not None:
+        return _top_n_file(input_file, output, by, ascending, n, chunksize)
+    return _external_sort(input_file, output, by, ascending, chunksize, temp_dir)
+
+
+def _top_n_file(input_file, output, by, ascending, n, chunksize):
+    typer = None
+    candidates = None
+    rows = 0
+    for chunk in _read_text(input_file, chunksize):
+        chunk.index = pd.RangeIndex(rows, rows + len(chunk))
+        rows += len(chunk)
+        typer = typer or _KeyTyper(chunk, by)
+        chunk = chunk.loc[sort_order(typer.keys(chunk), by, ascending, n)]
+        # Candidates come from earlier rows, so putting them first keeps ties in input order.
+        candidates = chunk if candidates is None else pd.concat([candidates, chunk])
+        candidates = candidates.loc[sort_order(typer.keys(candidates), by, ascending, n)]
+    if candidates is None:
+        candidates = pd.read_csv(input_file, nrows=0)
+    write_csv(candidates, output)
+    return {'strategy': 'top-n', 'rows': rows, 'runs': 0}
+
+
+def _external_sort(input_file, output, by, ascending, chunksize, temp_dir):
+    work_dir = tempfile.mkdtemp(prefix='tidydata-sort-', dir=temp_dir)
+    try:
+        typer = None
+        runs = []
+        rows = 0
+        for chunk in _read_text(input_file, chunksize):
+            typer = typer or _KeyTyper(chunk, by)
+            run = os.path.join(work_dir, f'run-{len(runs)}.csv')
+            chunk.loc[sort_order(typer.keys(chunk), by, ascending)].to_csv(run, index=False)
+            runs.append(run)
+            rows += len(chunk)
+
+        # Each run is read back a small block at a time, so the merge holds about one chunk in memory.
+        block_size = max(1, chunksize // max(len(runs), 1))
+
+        # Runs are in input order and heapq.merge prefers earlier iterables on ties, so the merge is stable.
+        def iter_run(path):
+            for block in _read_text(path, block_size):
+                yield from zip(typer.merge_keys(typer.keys(block), ascending), block.itertuples(index=False, name=None))
+
+        merged = heapq.merge(*(iter_run(run) for run in runs), key=lambda item: item[0])
+        with open_output(output) as out:
+            writer = csv.writer(out, lineterminator='\n')
+            writer.writerow(pd.read_csv(input_file, nrows=0).columns)
+            batch = []
+            for _, row in merged:
+                batch.append(row)
+                if len(batch) >= chunksize:
+                    writer.writerows(batch)
+                    batch = []
+            writer.writerows(batch)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return {'strategy': 'external', 'rows': rows, 'runs': len(runs)}
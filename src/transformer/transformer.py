@@ -1,5 +1,11 @@
+import re
 import pandas as pd
 from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from .aggregation import aggregate
+from .expressions import derive_columns, parse_assignment
+from .join import join_frames
+from .resample import resample_frame
+from .sort import sort_frame
 
 class DataTransformer:
     """Class to handle various data transformations on Pandas DataFrames."""
@@ -64,6 +70,112 @@ class DataTransformer:
             raise ColumnNotFoundError(old_name)
         return data.rename(columns={old_name: new_name})
 
+    def add_columns(self, data: pd.DataFrame, values: dict = None, expressions: list = None) -> pd.DataFrame:
+        """
+        Add several columns at once, from constant values and/or computed expressions.
+
+        Args:
+            data (pd.DataFrame): The DataFrame to modify.
+            values (dict, optional): New column name to constant value.
+            expressions (list, optional): Definitions such as 'total = price * qty', evaluated with the
+                same expression language as `derive_columns`. They may use the constant columns and
+                columns defined by earlier expressions.
+
+        Returns:
+            pd.DataFrame: The DataFrame with the new columns added.
+
+        Raises:
+            ColumnNotFoundError: If a new column already exists in the DataFrame, or an expression refers to an unknown column.
+            DataValidationError: If a column is defined twice, or an expression is invalid.
+        """
+        values = values or {}
+        expressions = list(expressions or [])
+        targets = list(values) + [parse_assignment(text)[0] for text in expressions]
+        for column_name in targets:
+            if column_name in data.columns:
+                raise ColumnNotFoundError(column_name, f"Column '{column_name}' already exists in the dataset.")
+            if targets.count(column_name) > 1:
+                raise DataValidationError(f"Column '{column_name}' is defined more than once.")
+        data = data.assign(**values)
+        return derive_columns(data, expressions) if expressions else data
+
+    def derive_columns(self, data: pd.DataFrame, expressions: list) -> pd.DataFrame:
+        """
+        Add or replace columns computed from expressions over whole columns at once.
+
+        Besides arithmetic, expressions support comparisons, `and`/`or`/`not`, string functions and
+        concatenation, date parts such as `year(order_date)` and `case when ... then ... else ... end`.
+        Each chunk of a streamed file can be derived independently, as no expression looks at other rows.
+
+        Args:
+            data (pd.DataFrame): The DataFrame to modify.
+            expressions (list): Definitions such as 'total = price * qty', applied in order.
+
+        Returns:
+            pd.DataFrame: The DataFrame with the derived columns.
+
+        Raises:
+            ColumnNotFoundError: If an expression refers to a column that does not exist.
+            DataValidationError: If an expression is invalid or uses unsupported syntax.
+        """
+        return derive_columns(data, expressions)
+
+    def select_columns(self, columns, names=None, pattern: str = None) -> list:
+        """
+        Resolve a list and/or regular-expression selection against the available column names.
+
+        Args:
+            columns (list): The available column names.
+            names (list, optional): Column names to select.
+            pattern (str, optional): Select every column whose name matches this regular expression.
+
+        Returns:
+            list: The selected column names, in their original order.
+
+        Raises:
+            ColumnNotFoundError: If a listed column does not exist.
+        """
+        names = list(names or [])
+        for column_name in names:
+            if column_name not in columns:
+                raise ColumnNotFoundError(column_name)
+        regex = re.compile(pattern) if pattern else None
+        return [column for column in columns if column in names or (regex is not None and regex.search(str(column)))]
+
+    def drop_columns(self, data: pd.DataFrame, names=None, pattern: str = None) -> pd.DataFrame:
+        """
+        Drop a list of columns and/or every column matching a regular expression in one operation.
+
+        Args:
+            data (pd.DataFrame): The DataFrame to modify.
+            names (list, optional): Column names to drop.
+            pattern (str, optional): Drop every column whose name matches this regular expression.
+
+        Returns:
+            pd.DataFrame: The DataFrame without the selected columns.
+
+        Raises:
+            ColumnNotFoundError: If a listed column does not exist in the DataFrame.
+        """
+        return data.drop(columns=self.select_columns(data.columns, names, pattern))
+
+    def rename_columns(self, data: pd.DataFrame, mapping: dict) -> pd.DataFrame:
+        """
+        Rename several columns at once.
+
+        Args:
+            data (pd.DataFrame): The DataFrame to modify.
+            mapping (dict): Current column name to new name.
+
+        Returns:
+            pd.DataFrame: The DataFrame with the columns renamed.
+
+        Raises:
+            ColumnNotFoundError: If a column to be renamed does not exist in the DataFrame.
+        """
+        self.select_columns(data.columns, list(mapping))
+        return data.rename(columns=mapping)
+
     def view_head(self, data: pd.DataFrame, n: int = 5) -> pd.DataFrame:
         """
         View the first `n` rows of the DataFrame.
@@ -100,3 +212,81 @@ class DataTransformer:
             raise DataValidationError("Parameter 'n' must be a positive integer.")
         return data.tail(n)
 
+    def group_aggregate(self, data: pd.DataFrame, keys, aggregations, sort: bool = True) -> pd.DataFrame:
+        """
+        Group the DataFrame by one or more keys and compute several aggregations.
+
+        Args:
+            data (pd.DataFrame): The DataFrame to aggregate.
+            keys (list): The grouping columns.
+            aggregations (list): (column, aggregation) pairs, e.g. [('Sales', 'sum'), ('Sales', 'p90')].
+                Supported: sum, mean, count, min, max, nunique, median and percentiles such as p90.
+            sort (bool, optional): Sort the groups by key. Defaults to True.
+
+        Returns:
+            pd.DataFrame: One row per group with the keys as columns followed by '<column>_<aggregation>' columns.
+
+        Raises:
+            ColumnNotFoundError: If a key or aggregated column does not exist in the DataFrame.
+            DataValidationError: If a numeric aggregation is requested for a non-numeric column.
+        """
+        return aggregate(data, keys, aggregations, sort=sort).reset_index()
+
+    def join(self, data: pd.DataFrame, other: pd.DataFrame, on, how: str = 'inner') -> pd.DataFrame:
+        """
+        Join the DataFrame with another one (e.g. a lookup table) on one or more key columns.
+
+        Args:
+            data (pd.DataFrame): The left DataFrame.
+            other (pd.DataFrame): The right DataFrame.
+            on (list): The key columns, present in both DataFrames.
+            how (str, optional): 'inner', 'left', or 'anti' (rows of `data` without a match). Defaults to 'inner'.
+
+        Returns:
+            pd.DataFrame: The joined DataFrame. Clashing columns from `other` get a '_right' suffix.
+
+        Raises:
+            ColumnNotFoundError: If a key column does not exist in either DataFrame.
+            DataValidationError: If the join type is not supported.
+        """
+        return join_frames(data, other, on, how=how)
+
+    def sort(self, data: pd.DataFrame, by, ascending=None, n: int = None) -> pd.DataFrame:
+        """
+        Sort the DataFrame on one or more keys, or select its top `n` rows on them.
+
+        Args:
+            data (pd.DataFrame): The DataFrame to sort.
+            by (list): The key columns, most significant first.
+            ascending (list, optional): One direction per key. Defaults to ascending for every key.
+            n (int, optional): Only return the first `n` rows of the sorted order (top-N).
+
+        Returns:
+            pd.DataFrame: The sorted rows, with missing keys last and ties in their original order.
+
+        Raises:
+            ColumnNotFoundError: If a key column does not exist in the DataFrame.
+            DataValidationError: If `n` is not a positive integer.
+        """
+        ascending = ascending if ascending is not None else [True] * len(by)
+        return sort_frame(data, by, ascending, n=n)
+
+    def resample(self, data: pd.DataFrame, time_column: str, value_columns, rule: str, aggregations=('mean',)) -> pd.DataFrame:
+        """
+        Aggregate columns into fixed time buckets, e.g. per-second readings into hourly means.
+
+        Args:
+            data (pd.DataFrame): The DataFrame to resample.
+            time_column (str): The column holding the timestamps, parsed once into a datetime index.
+            value_columns (list): The columns to aggregate.
+            rule (str): The bucket size, e.g. '1h', '15min', 'D', 'W' or 'ME'.
+            aggregations (list, optional): Any of 'mean', 'sum', 'count', 'min' and 'max'. Defaults to ['mean'].
+
+        Returns:
+            pd.DataFrame: One row per bucket with the time column followed by '<column>_<aggregation>' columns.
+
+        Raises:
+            ColumnNotFoundError: If a column does not exist in the DataFrame.
+            DataValidationError: If the rule or an aggregation is not supported.
+        """
+        return resample_frame(data, time_column, value_columns, rule, aggregations).reset_index()
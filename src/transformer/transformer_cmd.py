@@ -1,6 +1,15 @@
+import json
 import click
 import pandas as pd
+from src.utils.filtering import WHERE_HELP, filter_frame
+from src.utils.loader import load_data, read_columns
+from src.utils.streaming import run_chunked
+from src.utils.writers import open_output, write_csv
 from .transformer import DataTransformer
+from .aggregation import aggregate_file, parse_aggregations
+from .join import JOIN_TYPES, fan_out, join_files
+from .resample import parse_resample_aggregations, resample_file
+from .sort import parse_sort_keys, sort_file
 
 @click.group(
     help="""
@@ -11,8 +20,15 @@ from .transformer import DataTransformer
     - **Adding New Column to data**: Add a new column to the DataFrame with a specified value.\n
     - **Dropping an entire Column**: Drop a column from the DataFrame.\n
     - **Renaming a Column**: Rename a column in the DataFrame.\n
+    - **Derived Columns**: Compute columns from expressions (arithmetic, date parts, string functions, `case when`), optionally chunk by chunk.\n
+    - **Bulk Column Operations**: Add constant and computed columns, drop a list or regex selection (never parsed), or rename from a mapping file.\n
     - **Viewing of the first top rows**: View the first `n` rows of the DataFrame.\n
     - **Viewing of the last bottom rows**: View the last `n` rows of the DataFrame.\n
+    - **Filtering Rows**: Keep rows matching an expression such as "amount > 100 and country == 'KE'".\n
+    - **Sorting and Top-N**: Sort on several keys, or keep the top `n` rows, with an external merge sort for large files.\n
+    - **Joining Datasets**: Inner, left or anti join with a lookup table, broadcast or partitioned on disk for large files.\n
+    - **Group-by Aggregation**: Aggregate by one or more keys (sum, mean, count, nunique, min, max, median, percentiles), chunked for large files.\n
+    - **Time-series Resampling**: Aggregate rows into fixed time buckets (e.g. hourly means), chunked for large files.\n
 
     ### Examples:
 
@@ -28,6 +44,18 @@ from .transformer import DataTransformer
     \b
     python cmd.py transform view-tail input.csv --n 10 --output 'viewed_tail_data.csv'
 
+    4. **Derive Columns**:
+    \b
+    python cmd.py transform derive orders.csv --expr 'total = price * qty' --expr "size = case when total > 100 then 'large' else 'small' end" --output derived.csv
+
+    5. **Aggregate Sales by Region and Year**:
+    \b
+    python cmd.py transform group-aggregate sales.csv --by 'Region,Year' --agg 'Sales:sum,Sales:mean,Sales:p90,Customer:nunique' --chunksize 500000
+
+    6. **Hourly Averages of Per-Second Readings**:
+    \b
+    python cmd.py transform resample sensors.csv --time_column 'timestamp' --columns 'temperature,humidity' --rule 1H --agg 'mean,max' --chunksize 1000000
+
     """
 )
 def cli():
@@ -41,12 +69,12 @@ def cli():
 @click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
 def add_column(input_file, column_name , value, output):
     """Add a new column to the DataFrame with a specified value."""
-    data = pd.read_csv(input_file)
+    data = load_data(input_file)
     column_add = DataTransformer(data)
-    transformed_data = column_add.add_column(column_name=column_name, value=value).data
+    transformed_data = column_add.add_column(data=data, column_name=column_name, value=value)
 
     if output:
-        transformed_data.to_csv(output, index=False)
+        write_csv(transformed_data, output)
     else:
         print(transformed_data.head())
 
@@ -56,12 +84,12 @@ def add_column(input_file, column_name , value, output):
 @click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
 def drop_column(input_file, column_name, output):
     """Drop a column from the DataFrame."""
-    data = pd.read_csv(input_file)
+    data = load_data(input_file)
     column_drop = DataTransformer(data)
-    transformed_data = column_drop.drop_column(column_name=column_name).data
+    transformed_data = column_drop.drop_column(data=data, column_name=column_name)
 
     if output:
-        transformed_data.to_csv(output, index=False)
+        write_csv(transformed_data, output)
     else:
         print(transformed_data.head())
 
@@ -72,12 +100,114 @@ def drop_column(input_file, column_name, output):
 @click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
 def rename_column(input_file,old_name, new_name, output):
     """Rename a column in the DataFrame."""
-    data = pd.read_csv(input_file)
+    data = load_data(input_file)
     column_renamed = DataTransformer(data)
-    transformed_data = column_renamed.rename_column(old_name=old_name, new_name=new_name).data
+    transformed_data = column_renamed.rename_column(data=data, old_name=old_name, new_name=new_name)
+
+    if output:
+        write_csv(transformed_data, output)
+    else:
+        print(transformed_data.head())
+
+def read_mapping_file(mapping_file):
+    """
+    Read a column rename mapping from a JSON object file or a two-column CSV file (old name, new name).
+
+    Args:
+        mapping_file (str): The path of the mapping file.
+
+    Returns:
+        dict: Current column name to new name.
+    """
+    if mapping_file.lower().endswith('.json'):
+        with open(mapping_file) as file:
+            return json.load(file)
+    mapping = pd.read_csv(mapping_file, dtype=str)
+    return dict(zip(mapping.iloc[:, 0], mapping.iloc[:, 1]))
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--set', 'values', multiple=True, help="A constant column as 'name=value'. Repeat for several columns.")
+@click.option('--expr', 'expressions', multiple=True, help="A computed column such as 'total = price * qty'. Repeat for several columns.")
+@click.option('--output', default=None, type=click.Path(), help='Path to save the transformed data (optional).')
+def add_columns(input_file, values, expressions, output):
+    """Add several constant and computed columns in one pass."""
+    constants = {}
+    for item in values:
+        name, separator, value = item.partition('=')
+        if not separator:
+            raise click.BadParameter(f"Expected 'name=value', got '{item}'.")
+        constants[name.strip()] = value
+    data = load_data(input_file)
+    transformed_data = DataTransformer(data).add_columns(data=data, values=constants, expressions=list(expressions))
+
+    if output:
+        write_csv(transformed_data, output)
+    else:
+        print(transformed_data.head())
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--expr', 'expressions', multiple=True, required=True,
+              help="A derived column such as 'total = price * qty' or \"band = case when age < 18 then 'minor' else 'adult' end\". Repeat for several columns.")
+@click.option('--chunksize', default=None, type=int,
+              help='Process the input in chunks of this many rows, checkpointing after each chunk (requires --output).')
+@click.option('--resume', is_flag=True, default=False, help='Continue a chunked run from its last checkpoint.')
+@click.option('--output', default=None, type=click.Path(), help='Path to save the transformed data (optional).')
+def derive(input_file, expressions, chunksize, resume, output):
+    """Add columns computed from vectorized expressions."""
+    expressions = list(expressions)
+    if chunksize:
+        if not output:
+            raise click.UsageError("--chunksize requires --output.")
+        stats = run_chunked(input_file, output, lambda chunk: DataTransformer(chunk).derive_columns(chunk, expressions),
+                            {'command': 'derive', 'expressions': expressions}, chunksize=chunksize, resume=resume)
+        print(f"Derived columns for {stats['rows_this_run']} rows ({stats['rows_processed']} in total) and saved to {output}")
+        return
+    if resume:
+        raise click.UsageError("--resume requires --chunksize.")
+
+    data = load_data(input_file)
+    transformed_data = DataTransformer(data).derive_columns(data, expressions)
+    if output:
+        write_csv(transformed_data, output)
+    else:
+        print(transformed_data.head())
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--columns', default=None, help='Comma-separated list of columns to drop.')
+@click.option('--pattern', default=None, help="Drop every column whose name matches this regular expression, e.g. '^tmp_'.")
+@click.option('--output', default=None, type=click.Path(), help='Path to save the transformed data (optional).')
+def drop_columns(input_file, columns, pattern, output):
+    """Drop several columns; they are skipped at load time and never parsed."""
+    available = read_columns(input_file)
+    dropped = DataTransformer(pd.DataFrame()).select_columns(available, columns.split(',') if columns else None, pattern)
+    transformed_data = load_data(input_file, columns=[column for column in available if column not in dropped])
+
+    if output:
+        write_csv(transformed_data, output)
+    else:
+        print(transformed_data.head())
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--mapping', default=None, help="Comma-separated 'old:new' pairs.")
+@click.option('--mapping_file', default=None, type=click.Path(exists=True), help='JSON object or two-column CSV (old name, new name) with the renames.')
+@click.option('--output', default=None, type=click.Path(), help='Path to save the transformed data (optional).')
+def rename_columns(input_file, mapping, mapping_file, output):
+    """Rename several columns from a mapping."""
+    renames = read_mapping_file(mapping_file) if mapping_file else {}
+    for item in filter(None, (mapping or '').split(',')):
+        old_name, separator, new_name = item.rpartition(':')
+        if not separator:
+            raise click.BadParameter(f"Expected 'old:new', got '{item}'.")
+        renames[old_name.strip()] = new_name.strip()
+    data = load_data(input_file)
+    transformed_data = DataTransformer(data).rename_columns(data=data, mapping=renames)
 
     if output:
-        transformed_data.to_csv(output, index=False)
+        write_csv(transformed_data, output)
     else:
         print(transformed_data.head())
 
@@ -87,12 +217,12 @@ def rename_column(input_file,old_name, new_name, output):
 @click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
 def view_head(input_file,n, output):
     """View the first `n` rows of the DataFrame."""
-    data = pd.read_csv(input_file)
+    data = load_data(input_file)
     data_viewed = DataTransformer(data)
-    transformed_data = data_viewed.view_head(n=n).data
+    transformed_data = data_viewed.view_head(data=data, n=n)
 
     if output:
-       transformed_data.to_csv(output, index=False)
+       write_csv(transformed_data, output)
     else:
         print(transformed_data.head())
 
@@ -102,12 +232,143 @@ def view_head(input_file,n, output):
 @click.option('--output', default=None, type=click.Path(), help='Path to save the cleaned data (optional).')
 def view_tail(input_file,n, output):
     """View the last `n` rows of the DataFrame."""
-    data = pd.read_csv(input_file)
+    data = load_data(input_file)
     data_viewed = DataTransformer(data)
-    transformed_data = data_viewed.view_tail(n=n).data
+    transformed_data = data_viewed.view_tail(data=data, n=n)
+
+    if output:
+        write_csv(transformed_data, output)
+    else:
+        print(transformed_data.head())
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--by', 'keys', required=True, help='Comma-separated grouping columns.')
+@click.option('--agg', 'aggregations', required=True, help="Comma-separated 'column:aggregation' pairs (sum, mean, count, min, max, nunique, median, p90, ...).")
+@click.option('--sort/--no-sort', default=True, help='Sort groups by key (default) or keep first-seen order, which is faster.')
+@click.option('--chunksize', default=None, type=int, help='Aggregate a CSV file in chunks of this many rows and merge the partial results.')
+@click.option('--output', default=None, type=click.Path(), help='Path to save the aggregated data (optional).')
+def group_aggregate(input_file, keys, aggregations, sort, chunksize, output):
+    """Group rows by one or more keys and compute aggregations."""
+    keys = keys.split(',')
+    aggregations = parse_aggregations(aggregations)
+    if chunksize and input_file.lower().endswith('.csv'):
+        transformed_data = aggregate_file(input_file, keys, aggregations, chunksize=chunksize, sort=sort).reset_index()
+    else:
+        data = load_data(input_file)
+        transformed_data = DataTransformer(data).group_aggregate(data, keys, aggregations, sort=sort)
+
+    if output:
+        write_csv(transformed_data, output)
+    else:
+        print(transformed_data.head())
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--time_column', required=True, help='The column holding the timestamps.')
+@click.option('--columns', 'value_columns', required=True, help='Comma-separated columns to aggregate.')
+@click.option('--rule', required=True, help="Bucket size, e.g. '1H', '15min', 'D', 'W' or 'M'.")
+@click.option('--agg', 'aggregations', default='mean', help='Comma-separated aggregations: mean, sum, count, min, max (default mean).')
+@click.option('--chunksize', default=None, type=int, help='Resample a CSV file in chunks of this many rows and merge the bucket partials.')
+@click.option('--output', default=None, type=click.Path(), help='Path to save the resampled data (optional).')
+def resample(input_file, time_column, value_columns, rule, aggregations, chunksize, output):
+    """Aggregate rows into fixed time buckets."""
+    value_columns = value_columns.split(',')
+    aggregations = parse_resample_aggregations(aggregations)
+    if chunksize and input_file.lower().endswith('.csv'):
+        transformed_data = resample_file(input_file, time_column, value_columns, rule, aggregations,
+                                         chunksize=chunksize).reset_index()
+    else:
+        data = load_data(input_file, columns=[time_column] + value_columns)
+        transformed_data = DataTransformer(data).resample(data, time_column, value_columns, rule, aggregations)
+
+    if output:
+        write_csv(transformed_data, output)
+        print(f"Resampled into {len(transformed_data)} buckets and saved to {output}")
+    else:
+        print(transformed_data.head())
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.argument('right_file', type=click.Path(exists=True))
+@click.option('--on', required=True, help='Comma-separated key columns present in both files.')
+@click.option('--how', default='inner', type=click.Choice(JOIN_TYPES), help='Join type: inner, left, or anti (rows without a match).')
+@click.option('--memory_limit', default=1024, type=int, help='Largest right CSV file in MB (size on disk) to broadcast; larger files are partitioned on disk (default 1024).')
+@click.option('--chunksize', default=100000, type=int, help='Rows per chunk when streaming the files (default 100000).')
+@click.option('--partitions', default=64, type=int, help='Number of on-disk hash partitions for large joins (default 64).')
+@click.option('--output', default=None, type=click.Path(), help='Path to save the joined data (optional). Joins of two CSV files are streamed to it.')
+def join(input_file, right_file, on, how, memory_limit, chunksize, partitions, output):
+    """Join the input with another dataset on one or more key columns."""
+    on = on.split(',')
+    if output and input_file.lower().endswith('.csv') and right_file.lower().endswith('.csv'):
+        stats = join_files(input_file, right_file, output, on, how=how, memory_limit=memory_limit * 1024 * 1024,
+                           chunksize=chunksize, partitions=partitions)
+        print(f"Joined with a {stats['strategy']} join and saved to {output}")
+    else:
+        data = load_data(input_file)
+        right = load_data(right_file)
+        transformer = DataTransformer(data)
+        transformed_data = transformer.join(data, right, on, how=how)
+        matched_rows = len(data) - len(transformer.join(data, right, on, how='anti'))
+        stats = {'left_rows': len(data), 'output_rows': len(transformed_data), 'matched_left_rows': matched_rows,
+                 'fan_out': fan_out(len(data), len(transformed_data), matched_rows, how)}
+        if output:
+            write_csv(transformed_data, output)
+            print(f"Joined in memory and saved to {output}")
+        else:
+            print(transformed_data.head())
+
+    print(f"Left rows: {stats['left_rows']}, output rows: {stats['output_rows']}, "
+          f"left rows matched: {stats['matched_left_rows']}, fan-out: {stats['fan_out']:.2f}")
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--by', 'keys', required=True, help="Comma-separated sort keys with optional direction, e.g. 'Country,Amount:desc'.")
+@click.option('--top', default=None, type=int, help='Only keep the first N rows of the sorted order, without sorting the whole file.')
+@click.option('--memory_limit', default=1024, type=int, help='Largest CSV file in MB (size on disk) sorted in memory; larger files use an external merge sort (default 1024).')
+@click.option('--chunksize', default=100000, type=int, help='Rows per sorted run for the external sort (default 100000).')
+@click.option('--output', default=None, type=click.Path(), help='Path to save the sorted data (optional). Required for CSV files above --memory_limit.')
+def sort(input_file, keys, top, memory_limit, chunksize, output):
+    """Sort the data on one or more keys, or show the top N rows."""
+    by, ascending = parse_sort_keys(keys)
+    if output and input_file.lower().endswith('.csv'):
+        stats = sort_file(input_file, output, by, ascending, n=top, chunksize=chunksize,
+                          memory_limit=memory_limit * 1024 * 1024)
+        print(f"Sorted {stats['rows']} rows ({stats['strategy']}) and saved to {output}")
+        return
+
+    data = load_data(input_file)
+    transformed_data = DataTransformer(data).sort(data, by, ascending, n=top)
+    if output:
+        write_csv(transformed_data, output)
+        print(f"Sorted {len(data)} rows (memory) and saved to {output}")
+    else:
+        print(transformed_data.head(top or 5))
+
+@click.command(name='filter')
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--where', required=True, help=WHERE_HELP)
+@click.option('--chunksize', default=100000, type=int, help='Rows per chunk when streaming a CSV file to --output (default 100000).')
+@click.option('--output', default=None, type=click.Path(), help='Path to save the filtered data (optional).')
+def filter_rows(input_file, where, chunksize, output):
+    """Keep only the rows that match a filter expression."""
+    if output and input_file.lower().endswith('.csv'):
+        rows = kept = 0
+        with open_output(output) as out:
+            for chunk in pd.read_csv(input_file, chunksize=chunksize):
+                filtered = filter_frame(chunk, where)
+                filtered.to_csv(out, index=False, header=rows == 0)
+                rows += len(chunk)
+                kept += len(filtered)
+            if rows == 0:
+                pd.read_csv(input_file, nrows=0).to_csv(out, index=False)
+        print(f"Kept {kept} of {rows} rows and saved to {output}")
+        return
 
+    transformed_data = load_data(input_file, where=where)
     if output:
-        transformed_data.to_csv(output, index=False)
+        write_csv(transformed_data, output)
+        print(f"Kept {len(transformed_data)} rows and saved to {output}")
     else:
         print(transformed_data.head())
 
@@ -118,8 +379,17 @@ Add commands to the main CLI group
 cli.add_command(add_column)
 cli.add_command(drop_column)
 cli.add_command(rename_column)
+cli.add_command(add_columns)
+cli.add_command(derive)
+cli.add_command(drop_columns)
+cli.add_command(rename_columns)
 cli.add_command(view_head)
 cli.add_command(view_tail)
+cli.add_command(group_aggregate)
+cli.add_command(resample)
+cli.add_command(join)
+cli.add_command(sort)
+cli.add_command(filter_rows)
 
 if __name__ == '__main__':
     cli()
@@ -0,0 +1,109 @@
+import ast
+import operator
+
+import pandas as pd
+from src.utils.exceptions import DataValidationError
+
+try:
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is optional; without it Parquet files are filtered after loading.
+    pc = None
+
+WHERE_HELP = ("Only use rows matching this filter expression, e.g. \"amount > 100 and country == 'KE'\". "
+              "Column names with spaces go in backticks.")
+
+# Negations ('not', '!=', 'not in') are never pushed down: Arrow drops rows where they compare with
+# null, while pandas keeps them, so the pushed-down filter would no longer be a superset.
+_COMPARISONS = {ast.Eq: operator.eq, ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge}
+_REVERSED = {ast.Lt: ast.Gt, ast.LtE: ast.GtE, ast.Gt: ast.Lt, ast.GtE: ast.LtE, ast.Eq: ast.Eq}
+
+
+def filter_frame(data: pd.DataFrame, where: str) -> pd.DataFrame:
+    """
+    Keep the rows of a DataFrame that match a filter expression.
+
+    The expression uses `DataFrame.query` syntax and is evaluated column-wise, with numexpr when it
+    is installed.
+
+    Args:
+        data (pd.DataFrame): The rows to filter.
+        where (str): The filter expression, e.g. "amount > 100 and country == 'KE'".
+
+    Returns:
+        pd.DataFrame: The matching rows.
+
+    Raises:
+        DataValidationError: If the expression is invalid or refers to unknown columns.
+    """
+    try:
+        return data.query(where)
+    except (SyntaxError, NameError, ValueError, TypeError, KeyError) as e:
+        raise DataValidationError(f"Invalid filter expression '{where}': {e}")
+
+
+def _arrow_operand(node):
+    if isinstance(node, ast.Name):
+        return 'field', node.id
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str, bool)):
+        return 'value', node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+        return 'value', -node.operand.value
+    if isinstance(node, (ast.List, ast.Tuple)):
+        values = [_arrow_operand(element) for element in node.elts]
+        if all(kind == 'value' for kind, _ in values):
+            return 'values', [value for _, value in values]
+    return None, None
+
+
+def _to_arrow(node):
+    if isinstance(node, ast.BoolOp):
+        parts = [_to_arrow(value) for value in node.values]
+        combine = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+        result = parts[0]
+        for part in parts[1:]:
+            result = combine(result, part)
+        return result
+    if isinstance(node, ast.Compare):
+        result = None
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            part = _compare_to_arrow(left, op, right)
+            result = part if result is None else result & part
+            left = right
+        return result
+    raise ValueError("unsupported expression")
+
+
+def _compare_to_arrow(left, op, right):
+    (left_kind, left_value), (right_kind, right_value) = _arrow_operand(left), _arrow_operand(right)
+    if isinstance(op, ast.In) and left_kind == 'field' and right_kind == 'values':
+        return pc.field(left_value).isin(right_value)
+    if type(op) in _COMPARISONS:
+        if left_kind == 'value' and right_kind == 'field':
+            (left_kind, left_value), (right_kind, right_value) = (right_kind, right_value), (left_kind, left_value)
+            op = _REVERSED[type(op)]()
+        if left_kind == 'field' and right_kind == 'value':
+            return _COMPARISONS[type(op)](pc.field(left_value), right_value)
+    raise ValueError("unsupported comparison")
+
+
+def to_arrow_filter(where: str):
+    """
+    Translate a simple filter expression into a pyarrow compute expression for predicate pushdown.
+
+    Comparisons between a column and a literal, `in` lists, `and` and `or` are supported. Anything
+    else returns None and the caller filters after loading instead. The pushed-down filter only
+    skips data; callers still apply the full expression to the rows that are read.
+
+    Args:
+        where (str): The filter expression.
+
+    Returns:
+        pyarrow.compute.Expression or None: The equivalent expression, or None if it cannot be translated.
+    """
+    if pc is None or '`' in where:
+        return None
+    try:
+        return _to_arrow(ast.parse(where, mode='eval').body)
+    except (SyntaxError, ValueError, TypeError):
+        return None
@@ -0,0 +1,226 @@
+import os
+import threading
+import pandas as pd
+from src.utils.exceptions import DataFileError
+from src.utils.filtering import filter_frame, to_arrow_filter
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; it is only needed for Arrow IPC/Feather inputs.
+    pa = None
+
+ARROW_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+EXCEL_EXTENSIONS = ('.xlsx', '.xls')
+FILTER_CHUNKSIZE = 100000
+# Errors from pushing a filter down to a Parquet read, after which the file is filtered in pandas.
+PUSHDOWN_ERRORS = (ValueError, pa.ArrowException) if pa is not None else (ValueError,)
+
+
+class DatasetRegistry:
+    """
+    In-memory cache of loaded datasets, keyed by file path and load options.
+
+    Entries are invalidated automatically when the file's size or modification time changes,
+    so a long-running process never serves stale data.
+    """
+
+    def __init__(self):
+        self._datasets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _signature(file_path):
+        stat = os.stat(file_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def get(self, file_path, loader, options=()):
+        """
+        Return the cached dataset for `file_path`, loading it with `loader` on a miss.
+
+        Args:
+            file_path (str): The path of the dataset.
+            loader (callable): A zero-argument callable returning the loaded DataFrame.
+            options (tuple, optional): Hashable load options that are part of the cache key.
+
+        Returns:
+            pd.DataFrame: A copy of the cached DataFrame, safe for the caller to modify.
+        """
+        key = (os.path.abspath(file_path), options)
+        signature = self._signature(file_path)
+        with self._lock:
+            entry = self._datasets.get(key)
+            if entry is not None and entry[0] == signature:
+                return entry[1].copy()
+
+        data = loader()
+        with self._lock:
+            self._datasets[key] = (signature, data)
+        return data.copy()
+
+    def datasets(self):
+        """
+        List the paths currently held in the registry.
+
+        Returns:
+            list: The absolute paths of the cached datasets.
+        """
+        with self._lock:
+            return sorted({path for path, _ in self._datasets})
+
+    def clear(self):
+        """Drop every cached dataset."""
+        with self._lock:
+            self._datasets.clear()
+
+    def __len__(self):
+        return len(self._datasets)
+
+
+_registry = None
+
+
+def enable_registry(registry=None):
+    """
+    Route every `load_data` call through a dataset registry.
+
+    Args:
+        registry (DatasetRegistry, optional): The registry to use. A new one is created if omitted.
+
+    Returns:
+        DatasetRegistry: The active registry.
+    """
+    global _registry
+    _registry = registry if registry is not None else DatasetRegistry()
+    return _registry
+
+
+def disable_registry():
+    """Stop caching datasets and release the active registry."""
+    global _registry
+    _registry = None
+
+
+def get_registry():
+    """
+    Return the active dataset registry.
+
+    Returns:
+        DatasetRegistry or None: The active registry, or None when caching is disabled.
+    """
+    return _registry
+
+
+def read_arrow_ipc(file_path: str) -> pd.DataFrame:
+    """
+    Memory-map an Arrow IPC (Feather v2) file and wrap it in a DataFrame without copying.
+
+    Columns are backed by `pd.ArrowDtype`, so the DataFrame points straight into the mapped
+    file and processes reading the same file share the OS page cache. Compressed files are
+    decompressed into memory, so write inputs with `compression='uncompressed'` to benefit.
+
+    Args:
+        file_path (str): The path of the .arrow/.feather/.ipc file.
+
+    Returns:
+        pd.DataFrame: The data, with Arrow-backed columns.
+
+    Raises:
+        DataFileError: If pyarrow is not installed.
+    """
+    if pa is None:
+        raise DataFileError("Reading Arrow IPC/Feather files requires pyarrow.")
+
+    source = pa.memory_map(file_path, 'r')
+    try:
+        table = pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        source.seek(0)
+        try:
+            table = pa.ipc.open_stream(source).read_all()
+        except pa.ArrowInvalid:
+            # Feather v1 files are not IPC formatted.
+            table = feather.read_table(file_path, memory_map=True)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def read_columns(file_path: str) -> list:
+    """
+    Read the column names of a dataset without loading its rows.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        list: The column names, in file order.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in ARROW_EXTENSIONS:
+        return list(read_arrow_ipc(file_path).columns)
+    if extension == '.parquet':
+        if pa is not None:
+            return list(pq.read_schema(file_path).names)
+        return list(pd.read_parquet(file_path).columns)
+    if extension in EXCEL_EXTENSIONS:
+        return list(pd.read_excel(file_path, nrows=0).columns)
+    return list(pd.read_csv(file_path, nrows=0).columns)
+
+
+def load_data(file_path: str, where: str = None, chunksize: int = FILTER_CHUNKSIZE, columns=None) -> pd.DataFrame:
+    """
+    Load a dataset from disk, reusing the in-memory copy when a registry is active.
+
+    The reader is chosen from the file extension: Arrow IPC/Feather files are memory-mapped
+    (see `read_arrow_ipc`), Parquet and Excel use their pandas readers and anything else is
+    read as CSV.
+
+    With `where`, only matching rows are loaded: Parquet filters are pushed down so row groups
+    whose statistics rule them out are skipped, and CSV files are filtered chunk by chunk so the
+    whole file is never held in memory.
+
+    Args:
+        file_path (str): The path of the file to load.
+        where (str, optional): A filter expression in `DataFrame.query` syntax.
+        chunksize (int, optional): Rows per chunk when filtering a CSV file.
+        columns (list, optional): Only load these columns. CSV, Parquet and Excel readers skip the
+            other columns entirely, so they are never parsed.
+
+    Returns:
+        pd.DataFrame: The loaded data.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    columns = list(columns) if columns is not None else None
+    # A filter may use columns outside the projection, so project after filtering in that case.
+    projection = columns if not where else None
+
+    def _load():
+        if extension in ARROW_EXTENSIONS:
+            # Selecting columns of a memory-mapped table copies nothing.
+            data = read_arrow_ipc(file_path)
+            data = data[projection] if projection is not None else data
+        elif extension == '.parquet':
+            pushdown = to_arrow_filter(where) if where else None
+            try:
+                data = pd.read_parquet(file_path, columns=projection, filters=pushdown)
+            except PUSHDOWN_ERRORS:
+                # The filter names a column the file does not have, or compares a column with a value
+                # of another type; read everything and let filter_frame report or apply it.
+                data = pd.read_parquet(file_path, columns=projection)
+        elif extension in EXCEL_EXTENSIONS:
+            data = pd.read_excel(file_path, usecols=projection)
+        elif where:
+            chunks = [filter_frame(chunk, where) for chunk in pd.read_csv(file_path, chunksize=chunksize)]
+            data = pd.concat(chunks, ignore_index=True) if chunks else pd.read_csv(file_path, nrows=0)
+            return data[columns] if columns is not None else data
+        else:
+            data = pd.read_csv(file_path, usecols=projection)
+        if where:
+            data = filter_frame(data, where)
+            data = data[columns] if columns is not None else data
+        return data
+
+    if _registry is None:
+        return _load()
+    options = tuple((name, value) for name, value in (('where', where), ('columns', tuple(columns or ()))) if value)
+    return _registry.get(file_path, _load, options=options)
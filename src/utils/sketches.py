@@ -0,0 +1,374 @@
+import base64
+import numpy as np
+import pandas as pd
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """
+    Hash the values of a Series to 64-bit integers.
+
+    Args:
+        values (pd.Series): The values to hash.
+
+    Returns:
+        np.ndarray: One uint64 hash per value.
+    """
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    values = values.copy()
+    length = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values >= np.uint64(1 << shift)
+        length[mask] += shift
+        values[mask] >>= np.uint64(shift)
+    return length + (values > 0)
+
+
+class HyperLogLog:
+    """Mergeable distinct-count sketch with a relative error of about 1.04 / sqrt(2 ** precision)."""
+
+    def __init__(self, precision=12, registers=None):
+        self.precision = precision
+        self.registers = registers if registers is not None else np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, hashes: np.ndarray):
+        """
+        Add hashed values to the sketch.
+
+        Args:
+            hashes (np.ndarray): uint64 hashes, e.g. from `hash_values`.
+        """
+        if len(hashes) == 0:
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        remaining_bits = 64 - self.precision
+        index = (hashes >> np.uint64(remaining_bits)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << remaining_bits) - 1)
+        rank = (remaining_bits - _bit_length(remainder) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        """Fold another sketch with the same precision into this one."""
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> int:
+        """
+        Estimate the number of distinct values seen.
+
+        Returns:
+            int: The estimated distinct count.
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+    def to_dict(self):
+        return {'precision': self.precision, 'registers': base64.b64encode(self.registers.tobytes()).decode('ascii')}
+
+    @classmethod
+    def from_dict(cls, state):
+        registers = np.frombuffer(base64.b64decode(state['registers']), dtype=np.uint8).copy()
+        return cls(precision=state['precision'], registers=registers)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch backed by a bottom-k uniform sample.
+
+    Every value gets a random priority and the `capacity` values with the smallest priorities are
+    kept, which is a uniform sample of everything seen and stays uniform after merging. Quantiles
+    are exact while fewer than `capacity` values have been added.
+    """
+
+    def __init__(self, capacity=4096, values=None, priorities=None, count=0, seed=None):
+        self.capacity = capacity
+        self.values = values if values is not None else np.empty(0, dtype=np.float64)
+        self.priorities = priorities if priorities is not None else np.empty(0, dtype=np.float64)
+        self.count = count
+        self._rng = np.random.default_rng(seed)
+
+    def _keep_smallest(self, values, priorities):
+        if len(values) > self.capacity:
+            keep = np.argpartition(priorities, self.capacity - 1)[:self.capacity]
+            values, priorities = values[keep], priorities[keep]
+        self.values, self.priorities = values, priorities
+
+    def update(self, values):
+        """
+        Add non-null numeric values to the sketch.
+
+        Args:
+            values (array-like): The values to add.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.count += len(values)
+        self._keep_smallest(np.concatenate([self.values, values]),
+                            np.concatenate([self.priorities, self._rng.random(len(values))]))
+
+    def merge(self, other):
+        """Fold another sketch into this one."""
+        self.count += other.count
+        self._keep_smallest(np.concatenate([self.values, other.values]),
+                            np.concatenate([self.priorities, other.priorities]))
+        return self
+
+    def quantile(self, q):
+        """
+        Estimate a quantile (or several) of the values seen.
+
+        Args:
+            q (float or list): Quantile(s) in [0, 1].
+
+        Returns:
+            float or np.ndarray: The estimated quantile(s), NaN if the sketch is empty.
+        """
+        if len(self.values) == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        return np.quantile(self.values, q)
+
+    def fraction_outside(self, lower, upper) -> float:
+        """
+        Estimate the fraction of values outside [lower, upper].
+
+        Returns:
+            float: The estimated fraction, 0.0 if the sketch is empty.
+        """
+        if len(self.values) == 0:
+            return 0.0
+        return float(np.mean((self.values < lower) | (self.values > upper)))
+
+    def to_dict(self):
+        return {'capacity': self.capacity, 'count': self.count,
+                'values': self.values.tolist(), 'priorities': self.priorities.tolist()}
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(capacity=state['capacity'], count=state['count'],
+                   values=np.asarray(state['values'], dtype=np.float64),
+                   priorities=np.asarray(state['priorities'], dtype=np.float64))
+
+
+class TopK:
+    """
+    Mergeable heavy-hitters counter.
+
+    Keeps at most `capacity` counts, dropping the smallest when full, so the most frequent values
+    are exact unless the long tail is heavier than the retained counts.
+    """
+
+    def __init__(self, capacity=100, counts=None):
+        self.capacity = capacity
+        self.counts = counts if counts is not None else {}
+
+    def _truncate(self):
+        if len(self.counts) > self.capacity:
+            self.counts = dict(sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:self.capacity])
+
+    def update(self, values: pd.Series):
+        """
+        Count the non-null values of a Series.
+
+        Args:
+            values (pd.Series): The values to count.
+        """
+        for value, count in values.value_counts().items():
+            key = str(value)
+            self.counts[key] = self.counts.get(key, 0) + int(count)
+        self._truncate()
+
+    def merge(self, other):
+        """Fold another counter into this one."""
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self._truncate()
+        return self
+
+    def most_common(self, n=None):
+        """
+        Return the most frequent values.
+
+        Args:
+            n (int, optional): The number of values to return. All retained values if omitted.
+
+        Returns:
+            list: (value, count) pairs, most frequent first.
+        """
+        return sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def to_dict(self):
+        return {'capacity': self.capacity, 'counts': self.counts}
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(capacity=state['capacity'], counts=dict(state['counts']))
+
+
+class ColumnAccumulator:
+    """
+    Mergeable per-column statistics: counts, mean/variance moments, min/max and sketches.
+
+    Numeric columns track moments, extremes and quantiles; every column tracks distinct values, and
+    non-numeric columns track their most frequent values.
+    """
+
+    def __init__(self, numeric, dtype='object'):
+        self.numeric = numeric
+        self.dtype = dtype
+        self.count = 0
+        self.missing = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.distinct = HyperLogLog()
+        self.quantiles = QuantileSketch() if numeric else None
+        self.top_values = None if numeric else TopK()
+
+    @classmethod
+    def for_series(cls, series: pd.Series):
+        """Create an empty accumulator suited to the dtype of `series`."""
+        numeric = pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+        return cls(numeric=numeric, dtype=str(series.dtype))
+
+    def _merge_moments(self, count, mean, m2):
+        total = self.count + count
+        if total == 0:
+            return
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+
+    def update(self, series: pd.Series):
+        """
+        Add the values of a Series.
+
+        Args:
+            series (pd.Series): The values to add. Numeric accumulators coerce unparsable values to missing.
+        """
+        if self.numeric:
+            series = pd.to_numeric(series, errors='coerce')
+        present = series.dropna()
+        self.missing += len(series) - len(present)
+        if self.numeric:
+            # A chunk with a blank parses an int column as float; hash as float64 so 1 and 1.0 agree.
+            values = present.to_numpy(dtype=np.float64)
+            self.distinct.update(hash_values(pd.Series(values)))
+        else:
+            self.distinct.update(hash_values(present))
+
+        if self.numeric and len(present):
+            self._merge_moments(len(values), float(values.mean()), float(((values - values.mean()) ** 2).sum()))
+            self.minimum = float(values.min()) if self.minimum is None else min(self.minimum, float(values.min()))
+            self.maximum = float(values.max()) if self.maximum is None else max(self.maximum, float(values.max()))
+            self.quantiles.update(values)
+        elif not self.numeric:
+            self.top_values.update(present)
+        self.count += len(present)
+
+    def merge(self, other):
+        """Fold another accumulator for the same column into this one."""
+        self.missing += other.missing
+        self.distinct.merge(other.distinct)
+        if self.numeric:
+            self._merge_moments(other.count, other.mean, other.m2)
+            for name, pick in (('minimum', min), ('maximum', max)):
+                values = [v for v in (getattr(self, name), getattr(other, name)) if v is not None]
+                setattr(self, name, pick(values) if values else None)
+            self.quantiles.merge(other.quantiles)
+        else:
+            self.top_values.merge(other.top_values)
+        self.count += other.count
+        return self
+
+    @property
+    def std(self):
+        """Sample standard deviation, NaN with fewer than two values."""
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+    def to_dict(self):
+        return {
+            'numeric': self.numeric, 'dtype': self.dtype, 'count': self.count, 'missing': self.missing,
+            'mean': self.mean, 'm2': self.m2, 'minimum': self.minimum, 'maximum': self.maximum,
+            'distinct': self.distinct.to_dict(),
+            'quantiles': self.quantiles.to_dict() if self.quantiles else None,
+            'top_values': self.top_values.to_dict() if self.top_values else None,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        accumulator = cls(numeric=state['numeric'], dtype=state['dtype'])
+        for name in ('count', 'missing', 'mean', 'm2', 'minimum', 'maximum'):
+            setattr(accumulator, name, state[name])
+        accumulator.distinct = HyperLogLog.from_dict(state['distinct'])
+        if state['quantiles'] is not None:
+            accumulator.quantiles = QuantileSketch.from_dict(state['quantiles'])
+        if state['top_values'] is not None:
+            accumulator.top_values = TopK.from_dict(state['top_values'])
+        return accumulator
+
+
+class CorrelationAccumulator:
+    """Mergeable pairwise co-moments for Pearson correlations over pairwise-complete rows."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        size = len(self.columns)
+        self.n = np.zeros((size, size))
+        self.sum_x = np.zeros((size, size))
+        self.sum_xx = np.zeros((size, size))
+        self.sum_xy = np.zeros((size, size))
+
+    def update(self, data: pd.DataFrame):
+        """
+        Add the rows of `data`, which must contain every tracked column.
+
+        Args:
+            data (pd.DataFrame): The rows to add.
+        """
+        values = data[self.columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        present = (~np.isnan(values)).astype(np.float64)
+        filled = np.nan_to_num(values)
+        self.n += present.T @ present
+        self.sum_x += filled.T @ present
+        self.sum_xx += (filled ** 2).T @ present
+        self.sum_xy += filled.T @ filled
+
+    def merge(self, other):
+        """Fold another accumulator over the same columns into this one."""
+        self.n += other.n
+        self.sum_x += other.sum_x
+        self.sum_xx += other.sum_xx
+        self.sum_xy += other.sum_xy
+        return self
+
+    def correlation(self) -> pd.DataFrame:
+        """
+        Compute the Pearson correlation matrix.
+
+        Returns:
+            pd.DataFrame: The correlations, indexed and labelled by column name.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            covariance = self.n * self.sum_xy - self.sum_x * self.sum_x.T
+            variance_x = self.n * self.sum_xx - self.sum_x ** 2
+            matrix = covariance / np.sqrt(variance_x * variance_x.T)
+        return pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+    def to_dict(self):
+        return {'columns': self.columns, 'n': self.n.tolist(), 'sum_x': self.sum_x.tolist(),
+                'sum_xx': self.sum_xx.tolist(), 'sum_xy': self.sum_xy.tolist()}
+
+    @classmethod
+    def from_dict(cls, state):
+        accumulator = cls(state['columns'])
+        for name in ('n', 'sum_x', 'sum_xx', 'sum_xy'):
+            setattr(accumulator, name, np.asarray(state[name], dtype=np.float64).reshape(len(accumulator.columns), -1))
+        return accumulator
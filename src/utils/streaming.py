@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+from io import BytesIO
+from itertools import islice
+
+import pandas as pd
+from src.utils.exceptions import DataValidationError
+
+DEFAULT_CHUNKSIZE = 100000
+
+
+def step_hash(step_spec) -> str:
+    """
+    Fingerprint a processing step so a checkpoint is only resumed by the same step.
+
+    Args:
+        step_spec: A JSON-serialisable description of the step and its parameters.
+
+    Returns:
+        str: The SHA-256 hex digest of the description.
+    """
+    return hashlib.sha256(json.dumps(step_spec, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def iter_csv_chunks(file_path, chunksize=DEFAULT_CHUNKSIZE, offset=None, **read_csv_kwargs):
+    """
+    Read a CSV file in chunks of rows, reporting the byte offset after each chunk.
+
+    Rows are split on newlines, so quoted fields must not contain line breaks.
+
+    Args:
+        file_path (str): The CSV file to read.
+        chunksize (int, optional): The number of rows per chunk.
+        offset (int, optional): Byte offset of the first row to read. Defaults to the row after the header.
+        **read_csv_kwargs: Extra arguments for `pd.read_csv`, applied to every chunk.
+
+    Yields:
+        tuple: (chunk, header, end_offset) with the parsed rows, the raw header line and the byte
+        offset just past the chunk.
+    """
+    if not isinstance(chunksize, int) or chunksize <= 0:
+        raise DataValidationError("Parameter 'chunksize' must be a positive integer.")
+
+    with open(file_path, 'rb') as file:
+        header = file.readline()
+        position = len(header) if offset is None else offset
+        file.seek(position)
+        while True:
+            lines = list(islice(file, chunksize))
+            if not lines:
+                return
+            raw = b''.join(lines)
+            position += len(raw)
+            if raw.strip():
+                yield pd.read_csv(BytesIO(header + raw), **read_csv_kwargs), header, position
+
+
+class Checkpoint:
+    """Progress of a chunked run, saved after every completed chunk."""
+
+    def __init__(self, input_file, step_hash, header, byte_offset=0, rows_processed=0, output_position=0, state=None):
+        self.input_file = input_file
+        self.step_hash = step_hash
+        self.header = header
+        self.byte_offset = byte_offset
+        self.rows_processed = rows_processed
+        self.output_position = output_position
+        self.state = state or {}
+
+    def save(self, checkpoint_file):
+        """Atomically write the checkpoint to `checkpoint_file`."""
+        temp_file = f"{checkpoint_file}.tmp"
+        with open(temp_file, 'w') as file:
+            json.dump(self.__dict__, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, checkpoint_file)
+
+    @classmethod
+    def load(cls, checkpoint_file):
+        """Read a checkpoint written by `save`."""
+        with open(checkpoint_file) as file:
+            return cls(**json.load(file))
+
+
+def checkpoint_path(output):
+    """The default checkpoint file for an output file."""
+    return f"{output}.checkpoint.json"
+
+
+def run_chunked(input_file, output, step, step_spec, chunksize=DEFAULT_CHUNKSIZE,
+                checkpoint_file=None, resume=False, on_chunk=None, state=None):
+    """
+    Apply a DataFrame-to-DataFrame step to a CSV file chunk by chunk, with resumable checkpoints.
+
+    After every chunk the output is flushed to disk and a checkpoint records the input byte offset,
+    rows processed, output file position and a hash of the step. With `resume=True` a run continues
+    after the last completed chunk, discarding any partially written output; if the input has grown
+    since a completed run, only the appended rows are processed.
+
+    Args:
+        input_file (str): The CSV file to process.
+        output (str): The CSV file to write.
+        step (callable): Function applied to each chunk, returning the processed chunk.
+        step_spec: JSON-serialisable description of the step, used to validate resumes.
+        chunksize (int, optional): Rows per chunk. Defaults to DEFAULT_CHUNKSIZE.
+        checkpoint_file (str, optional): Where to keep the checkpoint. Defaults to `<output>.checkpoint.json`.
+        resume (bool, optional): Continue from an existing checkpoint instead of starting over.
+        on_chunk (callable, optional): Called with (input_chunk, output_chunk) after each chunk is written.
+        state (dict, optional): JSON-serialisable values the step carries from chunk to chunk, such as
+            running counts. It is saved with every checkpoint and restored into the dict on resume.
+
+    Returns:
+        dict: 'rows_processed' in total, 'rows_this_run' and 'resumed_from' (the row count at start).
+
+    Raises:
+        DataValidationError: If the checkpoint belongs to a different step or input, or the input was rewritten.
+    """
+    checkpoint_file = checkpoint_file or checkpoint_path(output)
+    fingerprint = step_hash(step_spec)
+    with open(input_file, 'rb') as file:
+        header = file.readline()
+        input_size = os.fstat(file.fileno()).st_size
+
+    checkpoint = None
+    if resume and os.path.exists(checkpoint_file):
+        checkpoint = Checkpoint.load(checkpoint_file)
+        if checkpoint.step_hash != fingerprint:
+            raise DataValidationError("The checkpoint was written by a different cleaning step; run without --resume.")
+        if (checkpoint.input_file != os.path.abspath(input_file) or checkpoint.header != header.decode('utf-8')
+                or input_size < checkpoint.byte_offset):
+            raise DataValidationError("The input no longer matches the checkpoint; run without --resume.")
+        if not os.path.exists(output) or os.path.getsize(output) < checkpoint.output_position:
+            raise DataValidationError("The output is shorter than the checkpoint records; run without --resume.")
+    if checkpoint is None:
+        checkpoint = Checkpoint(os.path.abspath(input_file), fingerprint, header.decode('utf-8'), byte_offset=len(header))
+    if state is not None:
+        state.update(checkpoint.state)
+        checkpoint.state = state
+
+    resumed_from = checkpoint.rows_processed
+    with open(output, 'r+b' if resume and checkpoint.output_position else 'wb') as out:
+        out.truncate(checkpoint.output_position)
+        out.seek(checkpoint.output_position)
+        for chunk, _, end_offset in iter_csv_chunks(input_file, chunksize, offset=checkpoint.byte_offset):
+            # Label rows by their position in the whole file, so row numbers reported by steps are global.
+            chunk.index = pd.RangeIndex(checkpoint.rows_processed, checkpoint.rows_processed + len(chunk))
+            cleaned = step(chunk)
+            out.write(cleaned.to_csv(index=False, header=checkpoint.output_position == 0).encode('utf-8'))
+            out.flush()
+            os.fsync(out.fileno())
+
+            checkpoint.byte_offset = end_offset
+            checkpoint.rows_processed += len(chunk)
+            checkpoint.output_position = out.tell()
+            checkpoint.save(checkpoint_file)
+            if on_chunk is not None:
+                on_chunk(chunk, cleaned)
+        if checkpoint.output_position == 0:
+            # Nothing to process: still leave a valid, header-only output and checkpoint behind.
+            out.write(header)
+            checkpoint.output_position = out.tell()
+            checkpoint.save(checkpoint_file)
+
+    return {'rows_processed': checkpoint.rows_processed,
+            'rows_this_run': checkpoint.rows_processed - resumed_from,
+            'resumed_from': resumed_from}
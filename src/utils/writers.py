@@ -0,0 +1,171 @@
+import gzip
+import io
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+
+import pandas as pd
+from src.utils.exceptions import DataValidationError, UnsupportedFormatError
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; it is only needed for zstd output and the pyarrow CSV engine.
+    pa = None
+
+WRITE_BUFFER_SIZE = 1 << 20
+COMPRESSIONS = {'.gz': 'gzip', '.zst': 'zstd'}
+GZIP_LEVEL = 6
+CSV_ENGINES = ('pandas', 'pyarrow')
+# 'pandas' writes exactly what `DataFrame.to_csv` writes. 'pyarrow' encodes row batches on several
+# threads, but writes booleans as true/false, timestamps with nanoseconds and quotes the header.
+DEFAULT_CSV_ENGINE = os.environ.get('TIDYDATA_CSV_ENGINE', 'pandas')
+CSV_BATCH_ROWS = 100000
+
+# The process umask, read once (os.umask can only be read by setting it).
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def compression_for(path):
+    """
+    The compression an output path asks for, from its extension.
+
+    Args:
+        path (str): The output path, e.g. 'cleaned.csv.gz'.
+
+    Returns:
+        str or None: 'gzip' for '.gz', 'zstd' for '.zst', otherwise None.
+    """
+    return COMPRESSIONS.get(os.path.splitext(path)[1].lower())
+
+
+def _compressed(raw, compression, path):
+    if compression == 'gzip':
+        # The name stored in the gzip header is the final file's, not the temporary one's.
+        return gzip.GzipFile(filename=os.path.basename(path)[:-3], mode='wb', fileobj=raw, compresslevel=GZIP_LEVEL)
+    if pa is None:
+        raise UnsupportedFormatError('zstd', ['gzip'], "Writing '.zst' files requires pyarrow.")
+    return pa.CompressedOutputStream(raw, 'zstd')
+
+
+@contextmanager
+def open_output(path, mode='w', encoding='utf-8'):
+    """
+    Open an output file for large buffered writes, replacing it atomically when the block succeeds.
+
+    Everything is written to a uniquely named temporary file next to `path`, compressed with gzip
+    or zstd when the path ends in '.gz' or '.zst', and renamed over `path` only once the block exits
+    without an error, so readers never see a half-written file and concurrent writers never share a
+    temporary file. On an error the temporary file is removed and `path` is left untouched.
+
+    Args:
+        path (str): The output path.
+        mode (str, optional): 'w' for a text stream (default) or 'wb' for a binary stream.
+        encoding (str, optional): The text encoding (default is 'utf-8').
+
+    Yields:
+        A writable text or binary stream.
+
+    Raises:
+        DataValidationError: If the mode is not 'w' or 'wb'.
+        UnsupportedFormatError: If the path ends in '.zst' and pyarrow is not installed.
+    """
+    if mode not in ('w', 'wb'):
+        raise DataValidationError("Parameter 'mode' must be 'w' or 'wb'.")
+
+    directory, name = os.path.split(os.path.abspath(path))
+    descriptor, temp_file = tempfile.mkstemp(prefix=f".{name}.", suffix='.tmp', dir=directory)
+    raw = os.fdopen(descriptor, 'wb', buffering=WRITE_BUFFER_SIZE)
+    compressor = None
+    stream = raw
+    try:
+        compression = compression_for(path)
+        if compression:
+            compressor = _compressed(raw, compression, path)
+            stream = io.BufferedWriter(compressor, buffer_size=WRITE_BUFFER_SIZE)
+        if mode == 'w':
+            stream = io.TextIOWrapper(stream, encoding=encoding, newline='')
+        yield stream
+        # Closing the outer stream flushes and closes the compressor; the raw file is closed last.
+        stream.close()
+        raw.close()
+        # mkstemp creates private files; give the output the permissions a plain open() would.
+        os.chmod(temp_file, 0o666 & ~_UMASK)
+        os.replace(temp_file, path)
+    finally:
+        for handle in (stream, compressor, raw):
+            if handle is not None and not handle.closed:
+                with suppress(Exception):
+                    handle.close()
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def strip_compression(path):
+    """
+    The path without a compression extension, e.g. 'summary.json.gz' -> 'summary.json'.
+
+    Args:
+        path (str): The output path.
+
+    Returns:
+        str: The path the format is read from.
+    """
+    return os.path.splitext(path)[0] if compression_for(path) else path
+
+
+def write_csv(data: pd.DataFrame, path, engine=None, index=False, max_workers=None):
+    """
+    Write a DataFrame to a CSV file through `open_output` (buffered, compressed by extension, atomic).
+
+    Args:
+        data (pd.DataFrame): The rows to write.
+        path (str): The output path; '.gz' and '.zst' paths are compressed.
+        engine (str, optional): One of CSV_ENGINES. Defaults to DEFAULT_CSV_ENGINE, which is read from
+            the TIDYDATA_CSV_ENGINE environment variable and is 'pandas' unless set.
+        index (bool, optional): Write the index as the first column (default is False).
+        max_workers (int, optional): Threads encoding row batches with the pyarrow engine.
+
+    Raises:
+        UnsupportedFormatError: If the engine is not supported.
+    """
+    engine = engine or DEFAULT_CSV_ENGINE
+    if engine not in CSV_ENGINES:
+        raise UnsupportedFormatError(engine, CSV_ENGINES, f"Unsupported CSV engine '{engine}'.")
+
+    table = None
+    if engine == 'pyarrow' and pa is not None:
+        try:
+            table = pa.Table.from_pandas(data, preserve_index=index)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Columns Arrow cannot type (e.g. mixed objects) are written by pandas instead.
+            table = None
+
+    if table is None:
+        with open_output(path) as out:
+            data.to_csv(out, index=index)
+        return
+    with open_output(path, 'wb') as out:
+        _write_arrow_csv(table, out, max_workers)
+
+
+def _encode_batch(table, header):
+    buffer = io.BytesIO()
+    pa_csv.write_csv(table, buffer, pa_csv.WriteOptions(include_header=header, quoting_style='needed'))
+    return buffer.getvalue()
+
+
+def _write_arrow_csv(table, out, max_workers=None):
+    """Encode the table in row batches on a thread pool and write the batches in order."""
+    offsets = range(0, max(table.num_rows, 1), CSV_BATCH_ROWS)
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    # Batches are encoded a window at a time so only a few encoded batches are held in memory.
+    window = max_workers * 2
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for start in range(0, len(offsets), window):
+            batches = [table.slice(offset, CSV_BATCH_ROWS) for offset in offsets[start:start + window]]
+            headers = [offset == 0 for offset in offsets[start:start + window]]
+            for encoded in executor.map(_encode_batch, batches, headers):
+                out.write(encoded)
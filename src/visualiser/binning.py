@@ -0,0 +1,208 @@
+import numpy as np
+import pandas as pd
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from src.utils.filtering import filter_frame
+from src.utils.sketches import QuantileSketch
+
+BINNINGS = ('width', 'quantile')
+
+
+def numeric_values(values) -> np.ndarray:
+    """
+    Convert values to a float array, dropping missing, non-numeric and infinite values.
+
+    Parameters:
+    - values (pd.Series or array-like): The values to convert.
+
+    Returns:
+    - np.ndarray: The finite values.
+    """
+    values = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    return values[np.isfinite(values)]
+
+
+def width_edges(lower, upper, bins):
+    """
+    Equal-width bin edges between `lower` and `upper`, as `np.histogram` computes them.
+
+    Parameters:
+    - lower (float): The smallest value.
+    - upper (float): The largest value.
+    - bins (int): The number of bins.
+
+    Returns:
+    - np.ndarray: The `bins + 1` edges.
+    """
+    if lower == upper:
+        lower, upper = lower - 0.5, upper + 0.5
+    return np.linspace(lower, upper, bins + 1)
+
+
+def quantile_edges(sketch, lower, upper, bins):
+    """
+    Equal-count bin edges estimated from a quantile sketch, with exact outer edges.
+
+    Repeated quantiles (heavily duplicated values) are merged, so fewer bins may be returned.
+
+    Parameters:
+    - sketch (QuantileSketch): A sketch of the values.
+    - lower (float): The exact smallest value.
+    - upper (float): The exact largest value.
+    - bins (int): The number of bins.
+
+    Returns:
+    - np.ndarray: The strictly increasing edges.
+    """
+    inner = sketch.quantile(np.linspace(0, 1, bins + 1)[1:-1]) if bins > 1 else np.empty(0)
+    edges = np.unique(np.clip(np.concatenate([[lower], inner, [upper]]), lower, upper))
+    return edges if len(edges) > 1 else width_edges(lower, upper, 1)
+
+
+class BinnedHistogram:
+    """Counts of values per bin for fixed edges, updated chunk by chunk and mergeable."""
+
+    def __init__(self, edges, counts=None, outside=0):
+        """
+        Parameters:
+        - edges (array-like): The strictly increasing bin edges. The last bin includes its right edge.
+        - counts (array-like, optional): Starting counts, one per bin.
+        - outside (int, optional): Values seen outside the edges so far.
+        """
+        self.edges = np.asarray(edges, dtype=np.float64)
+        if len(self.edges) < 2 or np.any(np.diff(self.edges) <= 0):
+            raise DataValidationError("Histogram edges must be strictly increasing, with at least two edges.")
+        self.counts = np.asarray(counts, dtype=np.int64) if counts is not None else np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.outside = outside
+
+    def update(self, values):
+        """
+        Count a batch of values. Non-numeric values are ignored; values outside the edges are only tallied.
+
+        Parameters:
+        - values (pd.Series or array-like): The values to count.
+        """
+        values = numeric_values(values)
+        counts, _ = np.histogram(values, bins=self.edges)
+        self.counts += counts
+        self.outside += len(values) - int(counts.sum())
+        return self
+
+    def merge(self, other):
+        """Add the counts of another histogram with the same edges."""
+        if not np.array_equal(self.edges, other.edges):
+            raise DataValidationError("Only histograms with the same edges can be merged.")
+        self.counts += other.counts
+        self.outside += other.outside
+        return self
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        The binned counts as a table, e.g. for export to CSV.
+
+        Returns:
+        - pd.DataFrame: One row per bin with 'bin_start', 'bin_end' and 'count'.
+        """
+        return pd.DataFrame({'bin_start': self.edges[:-1], 'bin_end': self.edges[1:], 'count': self.counts})
+
+
+def _check_bins(bins, binning):
+    if not isinstance(bins, int) or bins <= 0:
+        raise DataValidationError("Parameter 'bins' must be a positive integer.")
+    if binning not in BINNINGS:
+        raise DataValidationError(f"Unsupported binning '{binning}'. Choose from: {', '.join(BINNINGS)}.")
+
+
+def histogram_edges(values, bins=10, binning='width', value_range=None) -> np.ndarray:
+    """
+    Bin edges for values held in memory.
+
+    Parameters:
+    - values (pd.Series or array-like): The values to bin.
+    - bins (int, optional): The number of bins (default is 10).
+    - binning (str, optional): 'width' for equal-width bins or 'quantile' for equal-count bins.
+    - value_range (tuple, optional): Fixed (lower, upper) limits for equal-width bins.
+
+    Returns:
+    - np.ndarray: The strictly increasing edges.
+    """
+    _check_bins(bins, binning)
+    values = numeric_values(values)
+    if value_range is not None:
+        return width_edges(value_range[0], value_range[1], bins)
+    if len(values) == 0:
+        return width_edges(0.0, 0.0, bins)
+    if binning == 'quantile':
+        edges = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)))
+        return edges if len(edges) > 1 else width_edges(edges[0], edges[0], 1)
+    return width_edges(values.min(), values.max(), bins)
+
+
+def compute_histogram(values, bins=10, binning='width', value_range=None) -> BinnedHistogram:
+    """
+    Bin values held in memory.
+
+    Parameters:
+    - values (pd.Series or array-like): The values to bin.
+    - bins (int, optional): The number of bins (default is 10).
+    - binning (str, optional): 'width' for equal-width bins or 'quantile' for equal-count bins.
+    - value_range (tuple, optional): Fixed (lower, upper) limits for equal-width bins; other values are left out.
+
+    Returns:
+    - BinnedHistogram: The binned counts.
+    """
+    values = numeric_values(values)
+    return BinnedHistogram(histogram_edges(values, bins, binning, value_range)).update(values)
+
+
+def _iter_column(input_file, column, chunksize, where):
+    for chunk in pd.read_csv(input_file, chunksize=chunksize, usecols=None if where else [column]):
+        yield (filter_frame(chunk, where) if where else chunk)[column]
+
+
+def histogram_file(input_file, column, bins=10, binning='width', value_range=None, chunksize=100000,
+                   where=None) -> BinnedHistogram:
+    """
+    Bin a column of a CSV file that may not fit in memory, one chunk at a time.
+
+    With `value_range` the edges are fixed and the file is read once. Otherwise a first pass finds
+    the exact minimum and maximum (and, for quantile bins, fills a quantile sketch that the inner
+    edges are taken from) and a second pass counts. Only the binned counts are ever held in memory.
+
+    Parameters:
+    - input_file (str): The CSV file.
+    - column (str): The column to bin.
+    - bins (int, optional): The number of bins (default is 10).
+    - binning (str, optional): 'width' for equal-width bins or 'quantile' for equal-count bins.
+    - value_range (tuple, optional): Fixed (lower, upper) limits for equal-width bins.
+    - chunksize (int, optional): Rows per chunk (default is 100000).
+    - where (str, optional): Only count rows matching this filter expression.
+
+    Returns:
+    - BinnedHistogram: The binned counts.
+
+    Raises:
+    - ColumnNotFoundError: If the column is not in the file.
+    """
+    _check_bins(bins, binning)
+    if column not in pd.read_csv(input_file, nrows=0).columns:
+        raise ColumnNotFoundError(column)
+
+    if value_range is not None:
+        edges = width_edges(value_range[0], value_range[1], bins)
+    else:
+        lower, upper = np.inf, -np.inf
+        sketch = QuantileSketch() if binning == 'quantile' else None
+        for values in _iter_column(input_file, column, chunksize, where):
+            values = numeric_values(values)
+            if len(values):
+                lower, upper = min(lower, values.min()), max(upper, values.max())
+                if sketch is not None:
+                    sketch.update(values)
+        if lower > upper:
+            lower = upper = 0.0
+        edges = quantile_edges(sketch, lower, upper, bins) if sketch is not None else width_edges(lower, upper, bins)
+
+    histogram = BinnedHistogram(edges)
+    for values in _iter_column(input_file, column, chunksize, where):
+        histogram.update(values)
+    return histogram
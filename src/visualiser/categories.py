@@ -0,0 +1,184 @@
+import pandas as pd
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from src.utils.filtering import filter_frame
+from src.utils.sketches import TopK
+from .chart_data import ChartData
+
+OTHER_LABEL = 'Other'
+
+
+def _check_top_k(top_k):
+    if top_k is not None and (not isinstance(top_k, int) or top_k <= 0):
+        raise DataValidationError("Parameter 'top_k' must be a positive integer.")
+
+
+def top_counts(counts: pd.Series, top_k=None, other_label=OTHER_LABEL):
+    """
+    Keep the `top_k` largest counts and fold the rest into one "Other" bucket.
+
+    Parameters:
+    - counts (pd.Series): Count per category, most frequent first.
+    - top_k (int, optional): The number of categories to keep. All are kept if omitted.
+    - other_label (str, optional): The label of the bucket for the remaining categories.
+
+    Returns:
+    - tuple: (counts, folded) with the kept counts plus the bucket, and the number of categories folded into it.
+    """
+    _check_top_k(top_k)
+    if top_k is None or len(counts) <= top_k:
+        return counts, 0
+    top = counts.nlargest(top_k, keep='first')
+    other = pd.Series([counts.sum() - top.sum()], index=[other_label])
+    return pd.concat([top, other]), len(counts) - top_k
+
+
+def top_means(sums: pd.Series, counts: pd.Series, top_k=None, other_label=OTHER_LABEL):
+    """
+    Mean per category for the `top_k` categories with the most values, and one mean for all the others.
+
+    Parameters:
+    - sums (pd.Series): Sum of the values per category.
+    - counts (pd.Series): Number of values per category, aligned with `sums`.
+    - top_k (int, optional): The number of categories to keep. All are kept if omitted.
+    - other_label (str, optional): The label of the bucket for the remaining categories.
+
+    Returns:
+    - tuple: (means, folded) with the kept means plus the bucket, and the number of categories folded into it.
+    """
+    _check_top_k(top_k)
+    if top_k is None or len(counts) <= top_k:
+        return sums / counts, 0
+    keep = counts.index.isin(counts.nlargest(top_k, keep='first').index)
+    means = sums[keep] / counts[keep]
+    other_count = counts[~keep].sum()
+    other = pd.Series([sums[~keep].sum() / other_count if other_count else float('nan')], index=[other_label])
+    return pd.concat([means, other]), len(counts) - top_k
+
+
+def bar_chart_from_values(values: pd.Series, x_column, y_column=None, percentage=False, orientation='vertical',
+                          folded=0, total=None) -> ChartData:
+    """
+    Wrap bar values (counts or means per category) as chart data.
+
+    Parameters:
+    - values (pd.Series): The value per bar, indexed by label.
+    - x_column (str): The category column.
+    - y_column (str, optional): The averaged column, if the bars are means.
+    - percentage (bool, optional): Turn counts into percentages of `total`.
+    - orientation (str, optional): 'vertical' or 'horizontal'.
+    - folded (int, optional): How many categories the "Other" bar holds.
+    - total (int, optional): The number of rows, missing values included, that percentages are of.
+      Defaults to the sum of `values`.
+
+    Returns:
+    - ChartData: A 'bar' aggregate.
+    """
+    if percentage and y_column is None:
+        total = values.sum() if total is None else total
+        values = values * 100 / total if total else values * 0.0
+    return ChartData('bar', pd.DataFrame({'label': values.index, 'value': values.to_numpy()}),
+                     {'x': x_column, 'y': y_column, 'percentage': bool(percentage), 'orientation': orientation,
+                      'other': int(folded)})
+
+
+def _iter_chunks(input_file, columns, chunksize, where):
+    for chunk in pd.read_csv(input_file, chunksize=chunksize, usecols=None if where else columns):
+        yield filter_frame(chunk, where) if where else chunk
+
+
+def count_categories_file(input_file, column, top_k=None, chunksize=100000, where=None, capacity=None):
+    """
+    Count the values of a CSV column chunk by chunk, keeping only the `top_k` most frequent exactly.
+
+    Without `top_k` every distinct value is counted. With it, a first pass finds candidate heavy
+    hitters with a `TopK` sketch of `capacity` entries and a second pass counts just those candidates
+    exactly, so memory stays bounded however many categories there are. The other values are
+    returned as one "Other" count, exact because the total is counted too. Labels are the text of
+    the values.
+
+    Parameters:
+    - input_file (str): The CSV file.
+    - column (str): The category column.
+    - top_k (int, optional): The number of categories to keep.
+    - chunksize (int, optional): Rows per chunk (default is 100000).
+    - where (str, optional): Only count rows matching this filter expression.
+    - capacity (int, optional): Candidates kept by the sketch (default is max(1000, 20 * top_k)).
+
+    Returns:
+    - tuple: (counts, folded, rows) with the counts most frequent first, the number of categories
+      folded into "Other" (a lower bound when sketched) and the number of rows read, missing values
+      included, which percentages are taken of.
+
+    Raises:
+    - ColumnNotFoundError: If the column is not in the file.
+    """
+    _check_top_k(top_k)
+    if column not in pd.read_csv(input_file, nrows=0).columns:
+        raise ColumnNotFoundError(column)
+
+    rows = 0
+    if top_k is None:
+        counts = pd.Series(dtype='int64')
+        for chunk in _iter_chunks(input_file, [column], chunksize, where):
+            counts = counts.add(chunk[column].astype(str).where(chunk[column].notna()).value_counts(), fill_value=0)
+            rows += len(chunk)
+        counts = counts.astype('int64').sort_values(ascending=False, kind='stable')
+        return counts, 0, rows
+
+    sketch = TopK(capacity=capacity or max(1000, 20 * top_k))
+    total = 0
+    distinct = set()
+    for chunk in _iter_chunks(input_file, [column], chunksize, where):
+        values = chunk[column].dropna()
+        sketch.update(values)
+        total += len(values)
+        rows += len(chunk)
+        if len(distinct) <= sketch.capacity:
+            distinct.update(values.astype(str).unique())
+
+    candidates = pd.Index([value for value, _ in sketch.most_common()])
+    counts = pd.Series(0, index=candidates, dtype='int64')
+    for chunk in _iter_chunks(input_file, [column], chunksize, where):
+        values = chunk[column].dropna().astype(str)
+        counts = counts.add(values[values.isin(candidates)].value_counts(), fill_value=0).astype('int64')
+
+    top = counts.sort_values(ascending=False, kind='stable').iloc[:top_k]
+    other = total - int(top.sum())
+    folded = max(len(distinct), len(candidates)) - len(top)
+    if folded > 0 or other:
+        top = pd.concat([top, pd.Series([other], index=[OTHER_LABEL])])
+    return top, max(folded, 0), rows
+
+
+def mean_by_category_file(input_file, column, value_column, top_k=None, chunksize=100000, where=None):
+    """
+    Mean of `value_column` per category of a CSV file, combining per-chunk sums and counts.
+
+    Parameters:
+    - input_file (str): The CSV file.
+    - column (str): The category column.
+    - value_column (str): The column to average.
+    - top_k (int, optional): Keep the categories with the most values and fold the rest into "Other".
+    - chunksize (int, optional): Rows per chunk (default is 100000).
+    - where (str, optional): Only use rows matching this filter expression.
+
+    Returns:
+    - tuple: (means, folded) as for `top_means`.
+
+    Raises:
+    - ColumnNotFoundError: If a column is not in the file.
+    """
+    header = pd.read_csv(input_file, nrows=0).columns
+    for name in (column, value_column):
+        if name not in header:
+            raise ColumnNotFoundError(name)
+
+    sums = counts = None
+    for chunk in _iter_chunks(input_file, [column, value_column], chunksize, where):
+        grouped = chunk.groupby(column, observed=True)[value_column].agg(['sum', 'count'])
+        sums = grouped['sum'] if sums is None else sums.add(grouped['sum'], fill_value=0)
+        counts = grouped['count'] if counts is None else counts.add(grouped['count'], fill_value=0)
+    if sums is None:
+        return pd.Series(dtype='float64'), 0
+    order = sums.index.sort_values()
+    return top_means(sums[order], counts[order], top_k)
@@ -0,0 +1,191 @@
+import gzip
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from src.utils.exceptions import UnsupportedFormatError
+from src.utils.writers import compression_for, open_output, strip_compression, write_csv
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; it is only needed for Arrow and Parquet exports.
+    pa = None
+
+CHART_KINDS = ('bar', 'histogram', 'line', 'scatter', 'wordcloud')
+DATA_FORMATS = ('json', 'csv', 'arrow', 'parquet')
+TEXT_FORMATS = ('json', 'csv')
+ARROW_METADATA_KEY = b'tidydata.chart'
+
+# The columns each kind of chart aggregate holds.
+CHART_COLUMNS = {
+    'bar': ['label', 'value'],
+    'histogram': ['bin_start', 'bin_end', 'count'],
+    'line': ['x', 'y'],
+    'scatter': ['x', 'y'],
+    'wordcloud': ['word', 'frequency'],
+}
+
+
+class ChartData:
+    """
+    The compact aggregate behind a chart, computed once and rendered anywhere.
+
+    A chart aggregate is a small table (e.g. one row per bar or bin) plus metadata such as the
+    source column names. It round-trips through JSON and Arrow, so it can be cached or sent to a
+    client that draws the chart itself.
+    """
+
+    def __init__(self, kind, data, meta=None):
+        """
+        Parameters:
+        - kind (str): One of CHART_KINDS.
+        - data (pd.DataFrame): The aggregate, with the columns listed in CHART_COLUMNS for the kind.
+        - meta (dict, optional): JSON-serialisable details, e.g. {'x': 'Category', 'orientation': 'vertical'}.
+        """
+        if kind not in CHART_KINDS:
+            raise UnsupportedFormatError(kind, CHART_KINDS, f"Unsupported chart kind '{kind}'.")
+        self.kind = kind
+        self.data = data.reset_index(drop=True)
+        self.meta = dict(meta or {})
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return f"ChartData(kind={self.kind!r}, rows={len(self.data)}, meta={self.meta!r})"
+
+    @classmethod
+    def from_histogram(cls, binned, **meta):
+        """
+        Wrap the counts of a `binning.BinnedHistogram`.
+
+        Parameters:
+        - binned (BinnedHistogram): The bin edges and counts.
+        - **meta: Extra metadata, e.g. the column name as `x`.
+
+        Returns:
+        - ChartData: A 'histogram' aggregate.
+        """
+        return cls('histogram', binned.to_frame(), dict(meta, outside=int(binned.outside)))
+
+    def edges(self) -> np.ndarray:
+        """The bin edges of a 'histogram' aggregate."""
+        return np.append(self.data['bin_start'].to_numpy(dtype=np.float64),
+                         self.data['bin_end'].to_numpy(dtype=np.float64)[-1:])
+
+    def to_dict(self) -> dict:
+        """
+        Convert to plain JSON-compatible types.
+
+        Returns:
+        - dict: 'kind', 'meta', 'columns' and 'rows' (a list of row lists).
+        """
+        split = json.loads(self.data.to_json(orient='split', index=False, date_format='iso'))
+        return {'kind': self.kind, 'meta': self.meta, 'columns': split['columns'], 'rows': split['data']}
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuild an aggregate written by `to_dict`."""
+        return cls(state['kind'], pd.DataFrame(state['rows'], columns=state['columns']), state.get('meta'))
+
+    def to_json(self) -> str:
+        """Serialise to a JSON string."""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text):
+        """Rebuild an aggregate from `to_json` output."""
+        return cls.from_dict(json.loads(text))
+
+    def to_arrow(self):
+        """
+        Convert to an Arrow table, with the kind and metadata in the schema metadata.
+
+        Returns:
+        - pyarrow.Table: The aggregate.
+
+        Raises:
+        - UnsupportedFormatError: If pyarrow is not installed.
+        """
+        if pa is None:
+            raise UnsupportedFormatError('arrow', ('json', 'csv'), "Arrow output requires pyarrow.")
+        table = pa.Table.from_pandas(self.data, preserve_index=False)
+        header = json.dumps({'kind': self.kind, 'meta': self.meta}).encode('utf-8')
+        return table.replace_schema_metadata({**(table.schema.metadata or {}), ARROW_METADATA_KEY: header})
+
+    @classmethod
+    def from_arrow(cls, table):
+        """Rebuild an aggregate from `to_arrow` output."""
+        header = json.loads(table.schema.metadata[ARROW_METADATA_KEY])
+        return cls(header['kind'], table.to_pandas(), header['meta'])
+
+    def write(self, path, data_format=None):
+        """
+        Save the aggregate to a file.
+
+        Parameters:
+        - path (str or file-like): Where to write. Paths are replaced atomically, and JSON and CSV paths
+          ending in '.gz' or '.zst' are compressed.
+        - data_format (str, optional): One of DATA_FORMATS. Defaults to the file extension, else 'json'.
+          CSV keeps only the table, not the metadata.
+        """
+        data_format = data_format or _format_from_path(path)
+        if data_format not in DATA_FORMATS:
+            raise UnsupportedFormatError(data_format, DATA_FORMATS)
+        if isinstance(path, (str, os.PathLike)) and compression_for(str(path)) and data_format not in TEXT_FORMATS:
+            raise UnsupportedFormatError(data_format, TEXT_FORMATS, "Only JSON and CSV chart data can be compressed.")
+        if data_format == 'json':
+            text = self.to_json()
+            if hasattr(path, 'write'):
+                path.write(text if isinstance(path, io.TextIOBase) else text.encode('utf-8'))
+            else:
+                with open_output(str(path)) as file:
+                    file.write(text)
+        elif data_format == 'csv':
+            if hasattr(path, 'write'):
+                self.data.to_csv(path, index=False)
+            else:
+                write_csv(self.data, str(path))
+        elif data_format == 'arrow':
+            feather.write_feather(self.to_arrow(), path, compression='uncompressed')
+        else:
+            pq.write_table(self.to_arrow(), path)
+
+    @classmethod
+    def read(cls, path):
+        """
+        Load an aggregate saved with `write` in JSON (plain, '.gz' or '.zst'), Arrow or Parquet format.
+
+        Parameters:
+        - path (str): The file to read.
+
+        Returns:
+        - ChartData: The aggregate.
+        """
+        data_format = _format_from_path(path)
+        if data_format == 'arrow':
+            return cls.from_arrow(feather.read_table(path))
+        if data_format == 'parquet':
+            return cls.from_arrow(pq.read_table(path))
+        if data_format == 'csv':
+            raise UnsupportedFormatError('csv', ('json', 'arrow', 'parquet'), "CSV chart data has no metadata to read back.")
+        compression = compression_for(str(path))
+        if compression == 'gzip':
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                return cls.from_json(file.read())
+        if compression == 'zstd':
+            with pa.input_stream(str(path), compression='zstd') as file:
+                return cls.from_json(file.read().decode('utf-8'))
+        with open(path) as file:
+            return cls.from_json(file.read())
+
+
+def _format_from_path(path):
+    if not isinstance(path, (str, os.PathLike)):
+        return 'json'
+    extension = os.path.splitext(strip_compression(str(path)))[1].lower().lstrip('.')
+    return {'feather': 'arrow', 'ipc': 'arrow'}.get(extension, extension if extension in DATA_FORMATS else 'json')
@@ -0,0 +1,145 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from src.transformer.aggregation import aggregate
+from src.utils.exceptions import ColumnNotFoundError, UnsupportedFormatError
+from .binning import BinnedHistogram, histogram_edges
+from .categories import bar_chart_from_values, top_counts, top_means
+from .chart_data import ChartData
+
+FACET_KINDS = ('bar', 'histogram', 'line', 'scatter')
+FACET_LAYOUTS = ('grid', 'files')
+
+
+def _plain(value):
+    """A facet value as a JSON-serialisable Python scalar."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def facet_chart_data(data: pd.DataFrame, kind, facet_by, x_column, y_column=None, percentage=False,
+                     orientation='vertical', top_k=None, bins=10, binning='width', value_range=None) -> dict:
+    """
+    Compute one chart aggregate per value of `facet_by`, in a single groupby pass over the data.
+
+    Histograms share their bin edges across facets so the panels are comparable.
+
+    Parameters:
+    - data (pd.DataFrame): The data.
+    - kind (str): One of FACET_KINDS.
+    - facet_by (str): The column whose values split the data into facets. Rows where it is missing are left out.
+    - x_column (str): The category (bar), value (histogram) or x-axis (line, scatter) column.
+    - y_column (str, optional): The averaged column for bars, or the y-axis for line and scatter charts.
+    - percentage (bool, optional): Bar counts as percentages of each facet's rows.
+    - orientation (str, optional): 'vertical' or 'horizontal' bars.
+    - top_k (int, optional): Keep each facet's `top_k` most frequent bar categories, plus "Other".
+    - bins (int, optional): Number of histogram bins (default is 10).
+    - binning (str, optional): 'width' or 'quantile' histogram bins.
+    - value_range (tuple, optional): Fixed (lower, upper) limits for the histogram bins.
+
+    Returns:
+    - dict: Facet value to ChartData, in sorted facet order.
+
+    Raises:
+    - ColumnNotFoundError: If a column is not found in the data.
+    - UnsupportedFormatError: If the chart kind cannot be faceted.
+    """
+    if kind not in FACET_KINDS:
+        raise UnsupportedFormatError(kind, FACET_KINDS, f"Chart kind '{kind}' cannot be faceted.")
+    for column in (facet_by, x_column, y_column):
+        if column is not None and column not in data.columns:
+            raise ColumnNotFoundError(column)
+
+    facets = {}
+    if kind == 'bar' and y_column is None:
+        counts = data.groupby([facet_by, x_column], observed=True).size()
+        rows = data.groupby(facet_by, observed=True).size()
+        for facet, group in counts.groupby(level=0, sort=True):
+            group = group.droplevel(0).sort_values(ascending=False, kind='stable')
+            values, folded = top_counts(group, top_k)
+            facets[facet] = bar_chart_from_values(values, x_column, percentage=percentage, orientation=orientation,
+                                                  folded=folded, total=rows[facet])
+    elif kind == 'bar':
+        grouped = aggregate(data, [facet_by, x_column], [(y_column, 'sum'), (y_column, 'count')])
+        for facet, group in grouped.groupby(level=0, sort=True):
+            group = group.droplevel(0)
+            values, folded = top_means(group.iloc[:, 0], group.iloc[:, 1], top_k)
+            facets[facet] = bar_chart_from_values(values, x_column, y_column=y_column, orientation=orientation, folded=folded)
+    elif kind == 'histogram':
+        values = pd.to_numeric(data[x_column], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        edges = histogram_edges(values, bins, binning, value_range)
+        finite = np.isfinite(values) & data[facet_by].notna().to_numpy()
+        bin_ids = np.searchsorted(edges, values, side='right') - 1
+        bin_ids[values == edges[-1]] = len(edges) - 2
+        inside = finite & (bin_ids >= 0) & (bin_ids < len(edges) - 1)
+        facet_values = data[facet_by].to_numpy()
+        totals = pd.Series(finite[finite]).groupby(facet_values[finite]).size()
+        counts = pd.Series(bin_ids[inside]).groupby([facet_values[inside], bin_ids[inside]]).size()
+        for facet in totals.index:
+            binned = np.zeros(len(edges) - 1, dtype=np.int64)
+            if facet in counts.index.get_level_values(0):
+                group = counts.xs(facet, level=0)
+                binned[group.index.to_numpy()] = group.to_numpy()
+            histogram = BinnedHistogram(edges, binned, outside=int(totals[facet] - binned.sum()))
+            facets[facet] = ChartData.from_histogram(histogram, x=x_column)
+    elif kind == 'line':
+        means = aggregate(data, [facet_by, x_column], [(y_column, 'mean')]).iloc[:, 0]
+        for facet, group in means.groupby(level=0, sort=True):
+            group = group.droplevel(0)
+            facets[facet] = ChartData('line', pd.DataFrame({'x': group.index, 'y': group.to_numpy()}),
+                                      {'x': x_column, 'y': y_column})
+    else:
+        points = data[[facet_by, x_column, y_column]].dropna()
+        for facet, group in points.groupby(facet_by, sort=True, observed=True):
+            facets[facet] = ChartData('scatter', pd.DataFrame({'x': group[x_column].to_numpy(), 'y': group[y_column].to_numpy()}),
+                                      {'x': x_column, 'y': y_column})
+
+    for facet, chart in facets.items():
+        chart.meta['facet'] = {'column': facet_by, 'value': _plain(facet)}
+    return facets
+
+
+def facet_path(output_path, facet) -> str:
+    """
+    The file a facet is written to: the output path with the facet value appended to its name.
+
+    Parameters:
+    - output_path (str): The output path, e.g. 'charts/sales.png'.
+    - facet: The facet value.
+
+    Returns:
+    - str: e.g. 'charts/sales_North-East.png'.
+    """
+    base, extension = os.path.splitext(output_path)
+    slug = re.sub(r'[^\w.-]+', '-', str(facet)).strip('-') or 'blank'
+    return f"{base}_{slug}{extension}"
+
+
+def render_facet_files(render, facets, output_path, title=None, max_workers=None, **kwargs) -> list:
+    """
+    Render each facet to its own file, several at a time.
+
+    Parameters:
+    - render (callable): A `DataVisualizer.render`-style function.
+    - facets (dict): Facet value to ChartData.
+    - output_path (str): The output path that facet values are appended to (see `facet_path`).
+    - title (str, optional): The title; the facet is added to it.
+    - max_workers (int, optional): Renders running at once. Defaults to the executor's default.
+    - **kwargs: Further arguments for `render`.
+
+    Returns:
+    - list: The written paths, in facet order.
+    """
+    paths = [facet_path(output_path, facet) for facet in facets]
+
+    def render_one(item):
+        (facet, chart), path = item
+        facet_title = f"{title} - {chart.meta['facet']['column']} = {facet}" if title else f"{chart.meta['facet']['column']} = {facet}"
+        render(chart, title=facet_title, output_path=path, **kwargs)
+
+    # Each worker thread draws on its own reusable figure, so renders do not share matplotlib state.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(render_one, zip(facets.items(), paths)))
+    return paths
@@ -0,0 +1,150 @@
+import base64
+import io
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+from src.utils.exceptions import UnsupportedFormatError
+
+ENGINES = ('matplotlib', 'plotly')
+INTERACTIVE_KINDS = ('bar', 'histogram', 'line', 'scatter')
+DEFAULT_MAX_POINTS = 200000
+
+# Element types plotly.js can decode from a typed array; 64-bit integers are not among them.
+_TYPED_ARRAY_DTYPES = {'int8': 'i1', 'uint8': 'u1', 'int16': 'i2', 'uint16': 'u2', 'int32': 'i4', 'uint32': 'u4',
+                       'float32': 'f4', 'float64': 'f8'}
+
+
+def typed_array(values):
+    """
+    Encode numeric values as a plotly.js typed array spec (base64 binary) instead of a JSON list.
+
+    Non-numeric values (labels, dates) are returned as a plain list.
+
+    Parameters:
+    - values (array-like): The values to encode.
+
+    Returns:
+    - dict or list: {'dtype': ..., 'bdata': ...} for numeric values, otherwise a list.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == 'b':
+        values = values.astype(np.uint8)
+    elif values.dtype.kind in 'iu' and values.dtype.name not in _TYPED_ARRAY_DTYPES:
+        fits = len(values) == 0 or (values.min() >= np.iinfo(np.int32).min and values.max() <= np.iinfo(np.int32).max)
+        values = values.astype(np.int32 if fits else np.float64)
+    elif values.dtype.kind == 'f' and values.dtype.name not in _TYPED_ARRAY_DTYPES:
+        values = values.astype(np.float64)
+    if values.dtype.name not in _TYPED_ARRAY_DTYPES:
+        return pd.Series(values).astype(str).tolist() if values.dtype.kind == 'M' else values.tolist()
+    values = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder('<'))
+    return {'dtype': _TYPED_ARRAY_DTYPES[values.dtype.name], 'bdata': base64.b64encode(values.tobytes()).decode('ascii')}
+
+
+def sample_points(length, max_points, seed=0) -> np.ndarray:
+    """
+    Positions of a uniform random sample of at most `max_points` points, in their original order.
+
+    Parameters:
+    - length (int): The number of points.
+    - max_points (int): The most points to keep.
+    - seed (int, optional): Seed, so the same data always gives the same sample.
+
+    Returns:
+    - np.ndarray: The sorted positions to keep.
+    """
+    if length <= max_points:
+        return np.arange(length)
+    return np.sort(np.random.default_rng(seed).choice(length, size=max_points, replace=False))
+
+
+def min_max_points(y, max_points) -> np.ndarray:
+    """
+    Positions to keep when thinning a line: the lowest and highest point of each of `max_points / 2` buckets.
+
+    Keeping both extremes of every bucket preserves spikes and dips that plain striding would drop.
+
+    Parameters:
+    - y (array-like): The line's values, in x order.
+    - max_points (int): The most points to keep.
+
+    Returns:
+    - np.ndarray: The sorted positions to keep.
+    """
+    length = len(y)
+    if length <= max_points:
+        return np.arange(length)
+    buckets = pd.Series(np.asarray(y, dtype=np.float64)).groupby(np.arange(length) * max(max_points // 2, 1) // length)
+    keep = np.concatenate([buckets.idxmin().dropna().to_numpy(), buckets.idxmax().dropna().to_numpy()])
+    return np.unique(keep.astype(np.int64))
+
+
+def interactive_figure(chart, title=None, x_label=None, y_label=None, max_points=DEFAULT_MAX_POINTS) -> dict:
+    """
+    Build a plotly figure for chart data, with WebGL traces and typed-array payloads.
+
+    Scatter and line charts use `scattergl` and are thinned to at most `max_points` points on the
+    server: scatter points are sampled uniformly, lines keep each bucket's minimum and maximum.
+
+    Parameters:
+    - chart (ChartData): A 'bar', 'histogram', 'line' or 'scatter' aggregate.
+    - title (str, optional): Title of the chart.
+    - x_label (str, optional): Label for the x-axis.
+    - y_label (str, optional): Label for the y-axis.
+    - max_points (int, optional): The most points drawn by scatter and line charts.
+
+    Returns:
+    - dict: The figure, ready for `plotly.io.to_html(..., validate=False)`.
+
+    Raises:
+    - UnsupportedFormatError: If the chart kind has no interactive version.
+    """
+    if chart.kind not in INTERACTIVE_KINDS:
+        raise UnsupportedFormatError(chart.kind, INTERACTIVE_KINDS, f"Chart kind '{chart.kind}' has no interactive version.")
+    data, meta = chart.data, chart.meta
+    shown = len(data)
+    if chart.kind == 'bar':
+        labels = data['label'].astype(str).tolist()
+        values = typed_array(data['value'].to_numpy())
+        horizontal = meta.get('orientation') == 'horizontal'
+        trace = {'type': 'bar', 'x': values if horizontal else labels, 'y': labels if horizontal else values,
+                 'orientation': 'h' if horizontal else 'v'}
+    elif chart.kind == 'histogram':
+        edges = chart.edges()
+        trace = {'type': 'bar', 'x': typed_array((edges[:-1] + edges[1:]) / 2), 'y': typed_array(data['count'].to_numpy()),
+                 'width': typed_array(np.diff(edges))}
+    else:
+        keep = (sample_points(len(data), max_points) if chart.kind == 'scatter'
+                else min_max_points(data['y'].to_numpy(), max_points))
+        shown = len(keep)
+        trace = {'type': 'scattergl', 'mode': 'markers' if chart.kind == 'scatter' else 'lines',
+                 'x': typed_array(data['x'].to_numpy()[keep]), 'y': typed_array(data['y'].to_numpy()[keep])}
+        if chart.kind == 'scatter':
+            trace['marker'] = {'size': 3}
+
+    subtitle = f" ({shown:,} of {len(data):,} points)" if shown < len(data) else ''
+    layout = {'title': {'text': (title or '') + subtitle}, 'xaxis': {'title': {'text': x_label or ''}},
+              'yaxis': {'title': {'text': y_label or ''}}, 'bargap': 0.05,
+              'template': pio.templates['plotly_white'].to_plotly_json()}
+    return {'data': [trace], 'layout': layout}
+
+
+def write_html(figure, output_path=None) -> str:
+    """
+    Save a figure as one self-contained HTML page, with plotly.js embedded.
+
+    Parameters:
+    - figure (dict): The figure from `interactive_figure`.
+    - output_path (str or file-like, optional): Where to write the page.
+
+    Returns:
+    - str: The HTML.
+    """
+    html = pio.to_html(figure, include_plotlyjs=True, full_html=True, validate=False)
+    if output_path is not None:
+        if hasattr(output_path, 'write'):
+            output_path.write(html if isinstance(output_path, io.TextIOBase) else html.encode('utf-8'))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as file:
+                file.write(html)
+    return html
@@ -1,12 +1,63 @@
+import os
+import sys
+import threading
 from io import BytesIO
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+def _headless():
+    """True when there is no display to show figures on and no backend was chosen explicitly."""
+    if os.environ.get('MPLBACKEND'):
+        return False
+    return sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+
+# Pick the non-interactive Agg backend up front on servers, so pyplot never probes for a GUI toolkit.
+if _headless():
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
+import numpy as np
 import seaborn as sns
 import pandas as pd
 import plotly.figure_factory as ff
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from wordcloud import WordCloud
-from src.utils.exceptions import ColumnNotFoundError, DataMismatchError, UnsupportedFormatError, render_error_message
+from src.transformer.aggregation import aggregate
+from src.transformer.resample import resample_frame
+from .binning import compute_histogram
+from .categories import bar_chart_from_values, top_counts, top_means
+from .chart_data import ChartData
+from .facets import FACET_LAYOUTS, facet_chart_data, render_facet_files
+from .interactive import DEFAULT_MAX_POINTS, ENGINES, interactive_figure, write_html
+from src.utils.exceptions import (ColumnNotFoundError, DataMismatchError, DataValidationError, UnsupportedFormatError,
+                                  render_error_message)
+
+FIGURE_SIZE = (10, 6)
+FACET_PANEL_SIZE = (5, 4)
+
+_figures = threading.local()
+
+
+def _shared_figure():
+    """
+    Return this thread's reusable Agg figure, cleared for the next chart.
+
+    Figures created this way are not registered with pyplot, so they never leak into its figure
+    manager, and a batch of renders reuses one Figure and canvas instead of building new ones.
+    """
+    figure = getattr(_figures, 'figure', None)
+    if figure is None:
+        figure = Figure(figsize=FIGURE_SIZE)
+        FigureCanvasAgg(figure)
+        _figures.figure = figure
+    figure.clear()
+    return figure
+
 
 class DataVisualizer:
     """Class to handle various data visualizations."""
@@ -21,7 +72,7 @@ class DataVisualizer:
         self.data = data
 
     def basic_bar_chart(self, x_column, y_column=None, percentage=False, title="Basic Bar Chart",
-                        x_label=None, y_label='Count', output_path=None):
+                        x_label=None, y_label='Count', output_path=None, top_k=None, engine='matplotlib'):
         """
         Generate a basic bar chart. Supports optional percentage values and grouped mean values.
 
@@ -33,29 +84,13 @@ class DataVisualizer:
         - x_label (str, optional): Label for the x-axis.
         - y_label (str, optional): Label for the y-axis (default is 'Count').
         - output_path (str, optional): Path to save the chart image (if None, will display).
+        - top_k (int, optional): Only show the `top_k` most frequent categories, plus an "Other" bar.
+        - engine (str, optional): 'matplotlib' (default) for an image or 'plotly' for interactive WebGL HTML.
         """
         try:
-            plt.figure(figsize=(10, 6))
-            if x_column not in self.data.columns:
-                raise ColumnNotFoundError(f"Column '{x_column}' not found in the data.")
-            if y_column is not None and y_column not in self.data.columns:
-                raise ColumnNotFoundError(f"Column '{y_column}' not found in the data.")
-
-            if y_column is None:
-                value_counts = (self.data[x_column].value_counts(normalize=percentage) * (100 if percentage else 1))
-                sns.barplot(x=value_counts.index, y=value_counts.values)
-            else:
-                grouped_data = self.data.groupby(x_column)[y_column].mean()
-                sns.barplot(x=grouped_data.index, y=grouped_data.values)
-
-            plt.title(title)
-            plt.xlabel(x_label if x_label else x_column)
-            plt.ylabel(y_label)
-            if output_path:
-                plt.savefig(output_path)
-                plt.close()
-            else:
-                plt.show()
+            chart = self.bar_chart_data(x_column, y_column=y_column, percentage=percentage, top_k=top_k)
+            self.render(chart, title=title, x_label=x_label if x_label else x_column, y_label=y_label, output_path=output_path,
+                        engine=engine)
 
         except ColumnNotFoundError as e:
             render_error_message(e)
@@ -63,7 +98,7 @@ class DataVisualizer:
             render_error_message(e)
 
     def horizontal_bar_chart(self, x_column, y_column=None, percentage=False, title="Horizontal Bar Chart",
-                             x_label='Count', y_label=None, output_path=None):
+                             x_label='Count', y_label=None, output_path=None, top_k=None, engine='matplotlib'):
         """
         Generate a horizontal bar chart. Supports optional percentage values and grouped mean values.
 
@@ -75,29 +110,14 @@ class DataVisualizer:
         - x_label (str, optional): Label for the x-axis (default is 'Count').
         - y_label (str, optional): Label for the y-axis.
         - output_path (str, optional): Path to save the chart image (if None, will display).
+        - top_k (int, optional): Only show the `top_k` most frequent categories, plus an "Other" bar.
+        - engine (str, optional): 'matplotlib' (default) for an image or 'plotly' for interactive WebGL HTML.
             """
         try:
-            plt.figure(figsize=(10, 6))
-            if x_column not in self.data.columns:
-                raise ColumnNotFoundError(f"Column '{x_column}' not found in the data.")
-            if y_column is not None and y_column not in self.data.columns:
-                raise ColumnNotFoundError(f"Column '{y_column}' not found in the data.")
-
-            if y_column is None:
-                value_counts = (self.data[x_column].value_counts(normalize=percentage) * (100 if percentage else 1))
-                sns.barplot(x=value_counts.values, y=value_counts.index)
-            else:
-                grouped_data = self.data.groupby(x_column)[y_column].mean()
-                sns.barplot(x=grouped_data.values, y=grouped_data.index)
-
-            plt.title(title)
-            plt.xlabel(x_label)
-            plt.ylabel(y_label if y_label else x_column)
-            if output_path:
-                plt.savefig(output_path)
-                plt.close()
-            else:
-                plt.show()
+            chart = self.bar_chart_data(x_column, y_column=y_column, percentage=percentage, orientation='horizontal',
+                                        top_k=top_k)
+            self.render(chart, title=title, x_label=x_label, y_label=y_label if y_label else x_column, output_path=output_path,
+                        engine=engine)
 
         except ColumnNotFoundError as e:
             render_error_message(e)
@@ -114,20 +134,7 @@ class DataVisualizer:
         - output_path (str, optional): Path to save the word cloud image (if None, will display).
         """
         try:
-            if text_column not in self.data.columns:
-                raise ColumnNotFoundError(f"Column '{text_column}' not found in the data.")
-
-            text = " ".join(self.data[text_column].dropna().values)
-            wordcloud = WordCloud(width=800, height=400).generate(text)
-            plt.figure(figsize=(10, 6))
-            plt.imshow(wordcloud, interpolation="bilinear")
-            plt.axis("off")
-            plt.title(title)
-            if output_path:
-                plt.savefig(output_path)
-                plt.close()
-            else:
-                plt.show()
+            self.render(self.wordcloud_data(text_column), title=title, output_path=output_path)
 
         except ColumnNotFoundError as e:
             render_error_message(e)
@@ -169,7 +176,8 @@ class DataVisualizer:
             render_error_message(e)
 
 
-    def line_chart(self, x_column, y_column, title="Line Chart", x_label=None, y_label=None, output_path=None):
+    def line_chart(self, x_column, y_column, title="Line Chart", x_label=None, y_label=None, output_path=None,
+                   engine='matplotlib', resample=None, agg='mean'):
         """
 	    Generate a line chart. Supports optional percentage values and grouped mean values.
 
@@ -181,63 +189,55 @@ class DataVisualizer:
 	    - x_label (str, optional): Label for the x-axis.
 	    - y_label (str, optional): Label for the y-axis.
 	    - output_path (str, optional): Path to save the chart image (if None, will display).
+	    - engine (str, optional): 'matplotlib' (default) for an image or 'plotly' for interactive WebGL HTML.
+	    - resample (str, optional): Plot one point per time bucket of this size (e.g. '1H') instead of one per x value.
+	    - agg (str, optional): How each bucket is aggregated: 'mean' (default), 'sum', 'count', 'min' or 'max'.
 	    """
         try:
-            if x_column not in self.data.columns:
-                raise ColumnNotFoundError(f"Column '{x_column}' not found in the data.")
-            if y_column not in self.data.columns:
-                raise ColumnNotFoundError(f"Column '{y_column}' not found in the data.")
-
-            plt.figure(figsize=(10, 6))
-            sns.lineplot(data=self.data, x=x_column, y=y_column)
-            plt.title(title)
-            plt.xlabel(x_label if x_label else x_column)
-            plt.ylabel(y_label if y_label else y_column)
-            if output_path:
-                plt.savefig(output_path)
-                plt.close()
-            else:
-                plt.show()
+            chart = self.line_chart_data(x_column, y_column, resample=resample, agg=agg)
+            self.render(chart, title=title, x_label=x_label if x_label else x_column,
+                        y_label=y_label if y_label else y_column, output_path=output_path, engine=engine)
 
         except ColumnNotFoundError as e:
             render_error_message(e)
         except Exception as e:
             render_error_message(e)
 
-    def histogram(self, column, bins=10, title="Histogram", x_label=None, y_label='Frequency', output_path=None):
+    def histogram(self, column, bins=10, title="Histogram", x_label=None, y_label='Frequency', output_path=None,
+                  binning='width', value_range=None, counts_output=None, engine='matplotlib'):
         """
         Generate a histogram for a specific column.
 
+        The bins are counted with NumPy and only the precomputed bars are drawn, so the raw column
+        is never handed to the plotting library.
+
         Parameters:
         - column (str): The column for which the histogram is generated.
         - bins (int, optional): Number of bins in the histogram (default is 10).
         - title (str, optional): Title of the histogram (default is "Histogram").
         - output_path (str, optional): Path to save the histogram image (if None, will display).
+        - binning (str, optional): 'width' for equal-width bins (default) or 'quantile' for equal-count bins.
+        - value_range (tuple, optional): Fixed (lower, upper) limits for the bins.
+        - counts_output (str, optional): Path to save the binned counts as CSV.
+        - engine (str, optional): 'matplotlib' (default) for an image or 'plotly' for interactive WebGL HTML.
 
         Raises:
         - ColumnNotFoundError: If the specified column is not found in the data.
         """
         try:
-            if column not in self.data.columns:
-                raise ColumnNotFoundError(f"Column '{column}' not found in the data.")
-
-            plt.figure(figsize=(10, 6))
-            sns.histplot(self.data[column], bins=bins)
-            plt.title(title)
-            plt.xlabel(x_label if x_label else column)
-            plt.ylabel(y_label)
-            if output_path:
-                plt.savefig(output_path)
-                plt.close()
-            else:
-                plt.show()
+            chart = self.histogram_data(column, bins=bins, binning=binning, value_range=value_range)
+            if counts_output:
+                chart.write(counts_output, data_format='csv')
+            self.render(chart, title=title, x_label=x_label if x_label else column, y_label=y_label, output_path=output_path,
+                        engine=engine)
 
         except ColumnNotFoundError as e:
             render_error_message(e)
         except Exception as e:
             render_error_message(e)
 
-    def scatter_plot(self, x_column, y_column, title="Scatter Plot", x_label=None, y_label=None, output_path=None):
+    def scatter_plot(self, x_column, y_column, title="Scatter Plot", x_label=None, y_label=None, output_path=None,
+                     engine='matplotlib'):
         """
         Generate a scatter plot to visualize the relationship between two variables.
 
@@ -248,29 +248,329 @@ class DataVisualizer:
         - x_label (str, optional): Label for the x-axis (default is the name of the x_column).
         - y_label (str, optional): Label for the y-axis (default is the name of the y_column).
         - output_path (str, optional): Path to save the scatter plot image (if None, will display).
+        - engine (str, optional): 'matplotlib' (default) for an image or 'plotly' for interactive WebGL HTML.
 
         Raises:
         - ColumnNotFoundError: If either the x_column or y_column is not found in the data.
         """
         try:
-            if x_column not in self.data.columns:
-                raise ColumnNotFoundError(f"Column '{x_column}' not found in the data.")
-            if y_column not in self.data.columns:
-                raise ColumnNotFoundError(f"Column '{y_column}' not found in the data.")
-
-            plt.figure(figsize=(10, 6))
-            sns.scatterplot(x=self.data[x_column], y=self.data[y_column])
-            plt.title(title)
-            plt.xlabel(x_label if x_label else x_column)
-            plt.ylabel(y_label if y_label else y_column)
+            chart = self.scatter_data(x_column, y_column)
+            self.render(chart, title=title, x_label=x_label if x_label else x_column,
+                        y_label=y_label if y_label else y_column, output_path=output_path, engine=engine)
+
+        except ColumnNotFoundError as e:
+            render_error_message(e)
+        except Exception as e:
+            render_error_message(e)
+
+    def _check_columns(self, *columns):
+        for column in columns:
+            if column not in self.data.columns:
+                raise ColumnNotFoundError(f"Column '{column}' not found in the data.")
+
+    def bar_chart_data(self, x_column, y_column=None, percentage=False, orientation='vertical', top_k=None):
+        """
+        Compute the bars of a bar chart: value counts of a column, or the mean of another column per value.
+
+        Parameters:
+        - x_column (str): The column whose values become the bars.
+        - y_column (str, optional): Average this column per bar instead of counting rows.
+        - percentage (bool, optional): Give counts as percentages of all rows, so with missing values the bars add up to less than 100.
+        - orientation (str, optional): 'vertical' or 'horizontal', recorded for rendering.
+        - top_k (int, optional): Only keep the `top_k` most frequent categories and add an "Other" bar
+          for the rest, so high-cardinality columns stay fast and readable.
+
+        Returns:
+        - ChartData: A 'bar' aggregate with one row per bar.
+
+        Raises:
+        - ColumnNotFoundError: If a column is not found in the data.
+        """
+        self._check_columns(x_column, *([y_column] if y_column is not None else []))
+        if y_column is None:
+            counts = self.data[x_column].value_counts()
+            values, folded = top_counts(counts, top_k)
+            total = len(self.data)
+        else:
+            grouped = aggregate(self.data, [x_column], [(y_column, 'sum'), (y_column, 'count')])
+            values, folded = top_means(grouped.iloc[:, 0], grouped.iloc[:, 1], top_k)
+            total = None
+        return bar_chart_from_values(values, x_column, y_column=y_column, percentage=percentage,
+                                     orientation=orientation, folded=folded, total=total)
+
+    def line_chart_data(self, x_column, y_column, resample=None, agg='mean'):
+        """
+        Compute the points of a line chart: the mean of `y_column` for each value of `x_column`, in order.
+
+        With `resample`, `x_column` is parsed as timestamps once and the rows are aggregated into
+        fixed time buckets, so a long, dense series becomes one point per bucket.
+
+        Parameters:
+        - x_column (str): The column for the x-axis.
+        - y_column (str): The column for the y-axis.
+        - resample (str, optional): The bucket size, e.g. '1H', '15min' or 'D'.
+        - agg (str, optional): How each bucket is aggregated: 'mean' (default), 'sum', 'count', 'min' or 'max'.
+
+        Returns:
+        - ChartData: A 'line' aggregate with one row per x value or time bucket.
+
+        Raises:
+        - ColumnNotFoundError: If a column is not found in the data.
+        """
+        self._check_columns(x_column, y_column)
+        if resample:
+            points = resample_frame(self.data, x_column, [y_column], resample, [agg]).iloc[:, 0]
+            meta = {'x': x_column, 'y': y_column, 'resample': resample, 'agg': agg}
+        else:
+            points = aggregate(self.data, [x_column], [(y_column, 'mean')]).iloc[:, 0]
+            meta = {'x': x_column, 'y': y_column}
+        return ChartData('line', pd.DataFrame({'x': points.index, 'y': points.to_numpy()}), meta)
+
+    def scatter_data(self, x_column, y_column):
+        """
+        Collect the points of a scatter plot, leaving out rows with a missing coordinate.
+
+        Parameters:
+        - x_column (str): The column for x-axis values.
+        - y_column (str): The column for y-axis values.
+
+        Returns:
+        - ChartData: A 'scatter' aggregate with one row per point.
+
+        Raises:
+        - ColumnNotFoundError: If a column is not found in the data.
+        """
+        self._check_columns(x_column, y_column)
+        x, y = self.data[x_column], self.data[y_column]
+        present = (x.notna() & y.notna()).to_numpy()
+        return ChartData('scatter', pd.DataFrame({'x': x.to_numpy()[present], 'y': y.to_numpy()[present]}),
+                         {'x': x_column, 'y': y_column})
+
+    def histogram_data(self, column, bins=10, binning='width', value_range=None):
+        """
+        Compute the bins of a histogram with NumPy.
+
+        Parameters:
+        - column (str): The column to bin.
+        - bins (int, optional): Number of bins (default is 10).
+        - binning (str, optional): 'width' for equal-width bins (default) or 'quantile' for equal-count bins.
+        - value_range (tuple, optional): Fixed (lower, upper) limits for the bins.
+
+        Returns:
+        - ChartData: A 'histogram' aggregate with one row per bin.
+
+        Raises:
+        - ColumnNotFoundError: If the column is not found in the data.
+        """
+        self._check_columns(column)
+        binned = compute_histogram(self.data[column], bins=bins, binning=binning, value_range=value_range)
+        return ChartData.from_histogram(binned, x=column)
+
+    def wordcloud_data(self, text_column):
+        """
+        Count the words of a text column as a word cloud would, with stopwords removed.
+
+        Parameters:
+        - text_column (str): The column containing text data.
+
+        Returns:
+        - ChartData: A 'wordcloud' aggregate with one row per word, most frequent first.
+
+        Raises:
+        - ColumnNotFoundError: If the column is not found in the data.
+        """
+        self._check_columns(text_column)
+        text = " ".join(self.data[text_column].dropna().astype(str).values)
+        frequencies = pd.Series(WordCloud().process_text(text), dtype='int64').sort_values(ascending=False, kind='stable')
+        return ChartData('wordcloud', pd.DataFrame({'word': frequencies.index, 'frequency': frequencies.to_numpy()}),
+                         {'x': text_column})
+
+    def render(self, chart, title=None, x_label=None, y_label=None, output_path=None, image_format=None,
+               engine='matplotlib', max_points=DEFAULT_MAX_POINTS):
+        """
+        Draw a precomputed chart aggregate. The DataVisualizer's own data is not used.
+
+        With the matplotlib engine, charts saved to `output_path` are drawn on a per-thread Agg figure
+        that is cleared and reused between renders; only showing a chart interactively goes through
+        pyplot. The plotly engine writes one self-contained interactive HTML page instead, using WebGL
+        traces and binary typed arrays, with scatter and line charts thinned to `max_points` points.
+
+        Parameters:
+        - chart (ChartData): The aggregate, from one of the `*_data` methods or `ChartData.read`.
+        - title (str, optional): Title of the chart.
+        - x_label (str, optional): Label for the x-axis (default is the source column).
+        - y_label (str, optional): Label for the y-axis (default is the source column or 'Count').
+        - output_path (str or BytesIO, optional): Where to save the image or page (if None, will display).
+        - image_format (str, optional): Image format such as 'png' or 'svg' (default is the file extension, else PNG).
+        - engine (str, optional): 'matplotlib' (default) for images or 'plotly' for interactive HTML.
+        - max_points (int, optional): The most points an interactive scatter or line chart ships to the browser.
+        """
+        if engine not in ENGINES:
+            raise UnsupportedFormatError(engine, ENGINES, f"Unsupported engine '{engine}'.")
+        x_label, y_label = self._default_labels(chart, x_label, y_label)
+        if engine == 'plotly':
+            figure = interactive_figure(chart, title=title, x_label=x_label, y_label=y_label, max_points=max_points)
             if output_path:
-                plt.savefig(output_path)
-                plt.close()
+                write_html(figure, output_path)
+            else:
+                pio.show(figure, validate=False)
+            return
+
+        figure = _shared_figure() if output_path else plt.figure(figsize=FIGURE_SIZE)
+        try:
+            ax = figure.add_subplot()
+            self._draw(ax, chart, title, x_label, y_label)
+            if output_path:
+                figure.savefig(output_path, format=image_format)
             else:
                 plt.show()
+        finally:
+            if output_path:
+                figure.clear()
+            else:
+                plt.close(figure)
+
+    def render_image(self, chart, image_format='png', **kwargs) -> bytes:
+        """
+        Render a chart aggregate straight to in-memory image bytes, without touching disk.
+
+        Parameters:
+        - chart (ChartData): The aggregate to draw.
+        - image_format (str, optional): Image format such as 'png' (default) or 'svg'.
+        - **kwargs: `title`, `x_label` and `y_label`, as for `render`.
+
+        Returns:
+        - bytes: The encoded image.
+        """
+        buffer = BytesIO()
+        self.render(chart, output_path=buffer, image_format=image_format, **kwargs)
+        return buffer.getvalue()
+
+    def facet_data(self, kind, facet_by, x_column, y_column=None, **options) -> dict:
+        """
+        Compute one chart aggregate per value of `facet_by`, in a single groupby pass.
+
+        Parameters:
+        - kind (str): 'bar', 'histogram', 'line' or 'scatter'.
+        - facet_by (str): The column to split the data by.
+        - x_column (str): The category, binned or x-axis column.
+        - y_column (str, optional): The averaged or y-axis column.
+        - **options: `percentage`, `orientation`, `top_k`, `bins`, `binning` and `value_range`, as for the single charts.
+
+        Returns:
+        - dict: Facet value to ChartData, in sorted facet order.
+
+        Raises:
+        - ColumnNotFoundError: If a column is not found in the data.
+        """
+        return facet_chart_data(self.data, kind, facet_by, x_column, y_column=y_column, **options)
+
+    def facet_chart(self, kind, facet_by, x_column, y_column=None, title=None, x_label=None, y_label=None,
+                    output_path=None, layout='grid', columns=3, max_workers=None, engine='matplotlib', **options):
+        """
+        Draw small multiples: the same chart once per value of `facet_by`.
+
+        All the per-facet aggregates are computed in one groupby pass. The 'grid' layout draws them
+        as panels of one image; the 'files' layout writes one chart per facet, rendering several at
+        once, named after `output_path` with the facet value appended (e.g. 'sales_North.png').
+
+        Parameters:
+        - kind (str): 'bar', 'histogram', 'line' or 'scatter'.
+        - facet_by (str): The column to split the data by.
+        - x_column (str): The category, binned or x-axis column.
+        - y_column (str, optional): The averaged or y-axis column.
+        - title (str, optional): Title of the chart.
+        - x_label (str, optional): Label for the x-axis.
+        - y_label (str, optional): Label for the y-axis.
+        - output_path (str, optional): Path to save the grid image, or the base path of the facet files
+          (if None, the grid will display).
+        - layout (str, optional): 'grid' (default) or 'files'.
+        - columns (int, optional): Panels per row of the grid (default is 3).
+        - max_workers (int, optional): Facet files rendered at once.
+        - engine (str, optional): 'matplotlib' (default), or 'plotly' for interactive HTML facet files.
+        - **options: Further options for `facet_data`.
+
+        Returns:
+        - list: The paths written, or None if nothing was saved.
+        """
+        try:
+            if layout not in FACET_LAYOUTS:
+                raise UnsupportedFormatError(layout, FACET_LAYOUTS, f"Unsupported facet layout '{layout}'.")
+            facets = self.facet_data(kind, facet_by, x_column, y_column=y_column, **options)
+            if layout == 'files':
+                if not output_path:
+                    raise DataValidationError("The 'files' facet layout needs an output path.")
+                return render_facet_files(self.render, facets, output_path, title=title, max_workers=max_workers,
+                                          x_label=x_label, y_label=y_label, engine=engine)
+            if engine != 'matplotlib':
+                raise UnsupportedFormatError(engine, ('matplotlib',), "Facet grids are drawn with matplotlib only.")
+            self._render_grid(facets, title, x_label, y_label, output_path, columns)
+            return [output_path] if output_path else None
 
         except ColumnNotFoundError as e:
             render_error_message(e)
         except Exception as e:
             render_error_message(e)
 
+    def _render_grid(self, facets, title, x_label, y_label, output_path, columns):
+        columns = max(1, min(columns, len(facets)))
+        rows = max(1, -(-len(facets) // columns))
+        size = (FACET_PANEL_SIZE[0] * columns, FACET_PANEL_SIZE[1] * rows)
+        if output_path:
+            figure = Figure(figsize=size)
+            FigureCanvasAgg(figure)
+        else:
+            figure = plt.figure(figsize=size)
+        try:
+            axes = figure.subplots(rows, columns, squeeze=False).ravel()
+            for ax, (facet, chart) in zip(axes, facets.items()):
+                panel_x, panel_y = self._default_labels(chart, x_label, y_label)
+                self._draw(ax, chart, f"{chart.meta['facet']['column']} = {facet}", panel_x, panel_y)
+            for ax in axes[len(facets):]:
+                ax.set_visible(False)
+            if title:
+                figure.suptitle(title)
+            figure.tight_layout()
+            if output_path:
+                figure.savefig(output_path)
+            else:
+                plt.show()
+        finally:
+            if not output_path:
+                plt.close(figure)
+
+    @staticmethod
+    def _default_labels(chart, x_label, y_label):
+        meta = chart.meta
+        if chart.kind == 'bar' and meta.get('orientation') == 'horizontal':
+            return x_label or 'Count', y_label or meta.get('x')
+        if chart.kind == 'bar':
+            return x_label or meta.get('x'), y_label or 'Count'
+        if chart.kind == 'histogram':
+            return x_label or meta.get('x'), y_label or 'Frequency'
+        return x_label or meta.get('x'), y_label or meta.get('y')
+
+    @staticmethod
+    def _draw(ax, chart, title, x_label, y_label):
+        data, meta = chart.data, chart.meta
+        if chart.kind == 'bar':
+            if meta.get('orientation') == 'horizontal':
+                sns.barplot(x=data['value'].to_numpy(), y=data['label'].to_numpy(), orient='h', ax=ax)
+            else:
+                sns.barplot(x=data['label'].to_numpy(), y=data['value'].to_numpy(), ax=ax)
+        elif chart.kind == 'histogram':
+            edges = chart.edges()
+            ax.bar(edges[:-1], data['count'], width=np.diff(edges), align='edge', edgecolor='white')
+        elif chart.kind == 'line':
+            ax.plot(data['x'], data['y'])
+        elif chart.kind == 'scatter':
+            ax.scatter(data['x'], data['y'], s=20)
+        else:
+            frequencies = dict(zip(data['word'], data['frequency']))
+            ax.imshow(WordCloud(width=800, height=400).generate_from_frequencies(frequencies), interpolation="bilinear")
+            ax.axis("off")
+        if title:
+            ax.set_title(title)
+        if chart.kind != 'wordcloud':
+            ax.set_xlabel(x_label or '')
+            ax.set_ylabel(y_label or '')
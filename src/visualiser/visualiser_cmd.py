@@ -1,5 +1,16 @@
+import json
+
 import click
 import pandas as pd
+from src.utils.filtering import WHERE_HELP
+from src.utils.loader import load_data
+from src.utils.writers import open_output
+from src.transformer.resample import RESAMPLE_AGGREGATIONS, resample_file
+from .binning import BINNINGS, histogram_file
+from .categories import bar_chart_from_values, count_categories_file, mean_by_category_file
+from .chart_data import ChartData
+from .facets import FACET_LAYOUTS
+from .interactive import ENGINES
 from .visualiser import DataVisualizer
 
 @click.group(
@@ -10,11 +21,19 @@ from .visualiser import DataVisualizer
 
     ### Available Visualizations:
 
-    - **basic-bar-chart**: Create a standard bar chart.\n
+    - **basic-bar-chart**: Create a standard bar chart; `--top_k` keeps the most frequent categories plus an "Other" bar.\n
     - **horizontal-bar-chart**: Create a horizontal bar chart.\n
-    - **line-chart**: Generate a line chart for time series data.\n
+    - **line-chart**: Generate a line chart for time series data; `--resample 1H --agg mean` plots one point per time bucket.\n
     - **wordcloud**: Generate a word cloud from a text column.\n
+    - **histogram**: Bin a numeric column with NumPy, optionally streaming a large CSV file and exporting the binned counts.\n
     - **scatter-plot**: Create a scatter plot to visualize relationships between variables.\n
+    - **render**: Draw chart data saved with `--data-only`.\n
+
+    The bar, line, histogram and scatter commands accept `--facet_by COLUMN` to draw small multiples,
+    one chart per value of the column, computed in a single groupby pass.
+
+    Every chart command accepts `--data-only` to write the small aggregate behind the chart
+    (bar values, histogram bins, line points...) instead of an image, so it can be cached or drawn client-side.
 
     ### Examples:
 
@@ -25,94 +44,321 @@ from .visualiser import DataVisualizer
     2. **Generate a Word Cloud**:
     \b
     python cmd.py visualize wordcloud input.csv --text_column 'Text' --output 'wordcloud.png'
+
+    3. **Chart a Slice of the Data** (Parquet row groups are skipped, CSV is filtered chunk by chunk):
+    \b
+    python cmd.py visualize histogram sales.parquet --column 'amount' --where "country == 'KE'" --output 'ke_amounts.png'
+
+    4. **Histogram of a Large File with Exported Counts**:
+    \b
+    python cmd.py visualize histogram events.csv --column 'latency' --bins 50 --chunksize 500000 --counts_output 'latency_bins.csv' --output 'latency.png'
+
+    5. **Export Chart Data and Render It Later**:
+    \b
+    python cmd.py visualize basic-bar-chart input.csv --x_column 'Category' --data-only --output 'categories.json'
+    python cmd.py visualize render 'categories.json' --output 'categories.png'
+
+    6. **Interactive WebGL Scatter Plot of a Large Dataset**:
+    \b
+    python cmd.py visualize scatter-plot events.parquet --x_column 'x' --y_column 'y' --engine plotly --output 'events.html'
+
+    7. **Hourly Line Chart of a Year of Per-Second Readings**:
+    \b
+    python cmd.py visualize line-chart sensors.csv --x_column 'timestamp' --y_column 'temperature' --resample 1H --agg max --chunksize 1000000 --output 'temperature.png'
+
+    8. **One Histogram per Region, as a Grid or as Separate Files**:
+    \b
+    python cmd.py visualize histogram sales.csv --column 'amount' --facet_by 'region' --output 'amounts.png'
+    python cmd.py visualize histogram sales.csv --column 'amount' --facet_by 'region' --facet_layout files --output 'amounts.png'
     """
 )
 def cli():
     """A command-line interface for data visualization using DataVisualizer."""
     pass
 
+def data_only_option(command):
+    """Add the --data-only option shared by the chart commands."""
+    return click.option('--data-only', 'data_only', is_flag=True, default=False,
+                        help='Write the computed chart data (JSON, or .arrow/.parquet/.csv by --output extension) instead of rendering.')(command)
+
+def engine_option(command):
+    """Add the --engine option shared by the chart commands with an interactive version."""
+    return click.option('--engine', default='matplotlib', type=click.Choice(ENGINES),
+                        help="'plotly' writes a self-contained interactive HTML page (WebGL, downsampled) instead of an image.")(command)
+
+def emit_chart_data(chart, output):
+    """Save chart data to `output`, or print it as JSON."""
+    if output:
+        chart.write(output)
+        print(f"Chart data ({len(chart)} rows) saved to {output}")
+    else:
+        print(chart.to_json())
+
+def facet_options(command):
+    """Add the --facet_by, --facet_layout and --facet_columns options shared by the faceted chart commands."""
+    command = click.option('--facet_columns', default=3, type=click.IntRange(min=1),
+                           help='Panels per row of a facet grid.')(command)
+    command = click.option('--facet_layout', default='grid', type=click.Choice(FACET_LAYOUTS),
+                           help="'grid' draws all facets in one image; 'files' writes one chart per facet next to --output.")(command)
+    command = click.option('--facet_by', default=None, help='Draw one chart per value of this column (small multiples).')(command)
+    return command
+
+def facet_chart(visualizer, kind, facet_by, facet_layout, facet_columns, data_only, output, title, engine,
+                x_column, y_column=None, **options):
+    """Compute and draw, or save the data of, one chart per value of `facet_by`."""
+    if data_only:
+        facets = visualizer.facet_data(kind, facet_by, x_column, y_column=y_column, **options)
+        text = json.dumps([{'facet': chart.meta['facet']['value'], **chart.to_dict()} for chart in facets.values()])
+        if not output:
+            print(text)
+            return
+        with open_output(output) as file:
+            file.write(text)
+        print(f"Chart data for {len(facets)} facets saved to {output}")
+        return
+    paths = visualizer.facet_chart(kind, facet_by, x_column, y_column=y_column, title=title, output_path=output,
+                                   layout=facet_layout, columns=facet_columns, engine=engine, **options)
+    if paths and facet_layout == 'files':
+        print(f"{len(paths)} facet charts saved: {', '.join(paths)}")
+
+def check_streaming_facets(chunksize, facet_by):
+    """Faceted charts are computed in memory, so they cannot be combined with --chunksize."""
+    if chunksize and facet_by:
+        raise click.UsageError('--facet_by cannot be combined with --chunksize.')
+
+def bar_options(command):
+    """Add the --top_k and --chunksize options shared by the bar chart commands."""
+    command = click.option('--chunksize', default=None, type=int,
+                           help='Stream a CSV file in chunks of this many rows instead of loading it.')(command)
+    command = click.option('--top_k', default=None, type=click.IntRange(min=1),
+                           help='Only show the most frequent categories, plus an "Other" bar for the rest.')(command)
+    return command
+
+def stream_bar_chart(input_file, where, x_column, y_column, percentage, orientation, top_k, chunksize):
+    """Compute bar chart data from a CSV file chunk by chunk."""
+    total = None
+    if y_column is None:
+        values, folded, total = count_categories_file(input_file, x_column, top_k=top_k, chunksize=chunksize, where=where)
+    else:
+        values, folded = mean_by_category_file(input_file, x_column, y_column, top_k=top_k, chunksize=chunksize, where=where)
+    return bar_chart_from_values(values, x_column, y_column=y_column, percentage=percentage, orientation=orientation,
+                                 folded=folded, total=total)
+
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
+@click.option('--where', default=None, help=WHERE_HELP)
 @click.option('--x_column', help='The column for the x-axis.')
 @click.option('--y_column', default=None, help='The column for the y-axis (optional).')
 @click.option('--output', default=None, type=click.Path(), help='Path to save the chart image (optional).')
 @click.option('--title', default='Basic Bar Chart', help='Title of the bar chart.')
-@click.option('--percentage', is_flag=True, default=False, help='Display percentages instead of counts.')
-def basic_bar_chart(input_file, x_column, y_column, output, title, percentage):
+@click.option('--percentage', is_flag=True, default=False, help='Display percentages of all rows (missing values included) instead of counts.')
+@bar_options
+@facet_options
+@data_only_option
+@engine_option
+def basic_bar_chart(input_file, where, x_column, y_column, output, title, percentage, data_only, top_k, chunksize, engine,
+                    facet_by, facet_layout, facet_columns):
     """Generate a basic bar chart."""
-    data = pd.read_csv(input_file)
+    check_streaming_facets(chunksize, facet_by)
+    if chunksize and input_file.lower().endswith('.csv'):
+        chart = stream_bar_chart(input_file, where, x_column, y_column, percentage, 'vertical', top_k, chunksize)
+        if data_only:
+            return emit_chart_data(chart, output)
+        DataVisualizer(None).render(chart, title=title, output_path=output, engine=engine)
+        return
+
+    data = load_data(input_file, where=where)
     visualizer = DataVisualizer(data)
-    visualizer.basic_bar_chart(x_column=x_column, y_column=y_column, percentage=percentage, title=title, output_path=output)
+    if facet_by:
+        return facet_chart(visualizer, 'bar', facet_by, facet_layout, facet_columns, data_only, output, title, engine,
+                           x_column, y_column=y_column, percentage=percentage, orientation='vertical', top_k=top_k)
+    if data_only:
+        return emit_chart_data(visualizer.bar_chart_data(x_column, y_column=y_column, percentage=percentage,
+                                                         orientation='vertical', top_k=top_k), output)
+    visualizer.basic_bar_chart(x_column=x_column, y_column=y_column, percentage=percentage, title=title,
+                               output_path=output, top_k=top_k, engine=engine)
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
+@click.option('--where', default=None, help=WHERE_HELP)
 @click.option('--x_column', help='The column for the x-axis.')
 @click.option('--y_column', default=None, help='The column for the y-axis (optional).')
 @click.option('--output', default=None, type=click.Path(), help='Path to save the chart image (optional).')
 @click.option('--title', default='Horizontal Bar Chart', help='Title of the horizontal bar chart.')
-@click.option('--percentage', is_flag=True, default=False, help='Display percentages instead of counts.')
-def horizontal_bar_chart(input_file, x_column, y_column, output, title, percentage):
+@click.option('--percentage', is_flag=True, default=False, help='Display percentages of all rows (missing values included) instead of counts.')
+@bar_options
+@facet_options
+@data_only_option
+@engine_option
+def horizontal_bar_chart(input_file, where, x_column, y_column, output, title, percentage, data_only, top_k, chunksize, engine,
+                         facet_by, facet_layout, facet_columns):
     """Generate a horizontal bar chart."""
-    data = pd.read_csv(input_file)
+    check_streaming_facets(chunksize, facet_by)
+    if chunksize and input_file.lower().endswith('.csv'):
+        chart = stream_bar_chart(input_file, where, x_column, y_column, percentage, 'horizontal', top_k, chunksize)
+        if data_only:
+            return emit_chart_data(chart, output)
+        DataVisualizer(None).render(chart, title=title, output_path=output, engine=engine)
+        return
+
+    data = load_data(input_file, where=where)
     visualizer = DataVisualizer(data)
-    visualizer.horizontal_bar_chart(x_column=x_column, y_column=y_column, percentage=percentage, title=title, output_path=output)
+    if facet_by:
+        return facet_chart(visualizer, 'bar', facet_by, facet_layout, facet_columns, data_only, output, title, engine,
+                           x_column, y_column=y_column, percentage=percentage, orientation='horizontal', top_k=top_k)
+    if data_only:
+        return emit_chart_data(visualizer.bar_chart_data(x_column, y_column=y_column, percentage=percentage,
+                                                         orientation='horizontal', top_k=top_k), output)
+    visualizer.horizontal_bar_chart(x_column=x_column, y_column=y_column, percentage=percentage, title=title,
+                                    output_path=output, top_k=top_k, engine=engine)
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
+@click.option('--where', default=None, help=WHERE_HELP)
 @click.option('--text_column', help='The column containing text data.')
 @click.option('--output', default=None, type=click.Path(), help='Path to save the word cloud image (optional).')
 @click.option('--title', default='Word Cloud', help='Title of the word cloud.')
-def wordcloud(input_file, text_column, output, title):
+@data_only_option
+def wordcloud(input_file, where, text_column, output, title, data_only):
     """Generate a word cloud from text data."""
-    data = pd.read_csv(input_file)
+    data = load_data(input_file, where=where)
     visualizer = DataVisualizer(data)
+    if data_only:
+        return emit_chart_data(visualizer.wordcloud_data(text_column), output)
     visualizer.wordcloud(text_column=text_column, title=title, output_path=output)
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
+@click.option('--where', default=None, help=WHERE_HELP)
 @click.option('--output', default=None, type=click.Path(), help='Path to save the table (optional).')
 @click.option('--format', default='html', help='Output format for the table (html, png, etc.).')
-def table(input_file, output, format):
+def table(input_file, where, output, format):
     """Generate a table from the dataset."""
-    data = pd.read_csv(input_file)
+    data = load_data(input_file, where=where)
     visualizer = DataVisualizer(data)
     visualizer.table(output_path=output, output_format=format)
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
+@click.option('--where', default=None, help=WHERE_HELP)
 @click.option('--x_column', help='The column for the x-axis.')
 @click.option('--y_column', help='The column for the y-axis.')
 @click.option('--output', default=None, type=click.Path(), help='Path to save the line chart (optional).')
 @click.option('--title', default='Line Chart', help='Title of the line chart.')
-def line_chart(input_file, x_column, y_column, output, title):
+@click.option('--resample', default=None, help="Plot one point per time bucket of this size, e.g. '1H', '15min' or 'D'; --x_column holds the timestamps.")
+@click.option('--agg', default='mean', type=click.Choice(RESAMPLE_AGGREGATIONS), help='How each time bucket is aggregated (default mean).')
+@click.option('--chunksize', default=None, type=int, help='With --resample, stream a CSV file in chunks of this many rows instead of loading it.')
+@facet_options
+@data_only_option
+@engine_option
+def line_chart(input_file, where, x_column, y_column, output, title, resample, agg, chunksize, data_only, engine, facet_by,
+               facet_layout, facet_columns):
     """Generate a line chart from the dataset."""
-    data = pd.read_csv(input_file)
+    if chunksize and not resample:
+        raise click.UsageError('--chunksize requires --resample.')
+    if resample and facet_by:
+        raise click.UsageError('--resample cannot be combined with --facet_by.')
+    if chunksize and input_file.lower().endswith('.csv'):
+        points = resample_file(input_file, x_column, [y_column], resample, [agg], chunksize=chunksize, where=where).iloc[:, 0]
+        chart = ChartData('line', pd.DataFrame({'x': points.index, 'y': points.to_numpy()}),
+                          {'x': x_column, 'y': y_column, 'resample': resample, 'agg': agg})
+        if data_only:
+            return emit_chart_data(chart, output)
+        DataVisualizer(None).render(chart, title=title, output_path=output, engine=engine)
+        return
+
+    data = load_data(input_file, where=where)
     visualizer = DataVisualizer(data)
-    visualizer.line_chart(x_column=x_column, y_column=y_column, title=title, output_path=output)
+    if facet_by:
+        return facet_chart(visualizer, 'line', facet_by, facet_layout, facet_columns, data_only, output, title, engine,
+                           x_column, y_column=y_column)
+    if data_only:
+        return emit_chart_data(visualizer.line_chart_data(x_column, y_column, resample=resample, agg=agg), output)
+    visualizer.line_chart(x_column=x_column, y_column=y_column, title=title, output_path=output, engine=engine,
+                          resample=resample, agg=agg)
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
+@click.option('--where', default=None, help=WHERE_HELP)
 @click.option('--column', help='The column for which the histogram is generated.')
 @click.option('--bins', default=10, type=int, help='Number of bins in the histogram.')
+@click.option('--binning', default='width', type=click.Choice(BINNINGS), help='Equal-width bins, or equal-count bins from quantiles.')
+@click.option('--range', 'value_range', default=None, help="Fixed 'lower,upper' limits for the bins; a streamed file is then read only once.")
+@click.option('--chunksize', default=None, type=int, help='Stream a CSV file in chunks of this many rows instead of loading it.')
+@click.option('--counts_output', default=None, type=click.Path(), help='Path to save the binned counts as CSV (optional).')
 @click.option('--output', default=None, type=click.Path(), help='Path to save the histogram image (optional).')
 @click.option('--title', default='Histogram', help='Title of the histogram.')
-def histogram(input_file, column, bins, output, title):
+@facet_options
+@data_only_option
+@engine_option
+def histogram(input_file, where, column, bins, binning, value_range, chunksize, counts_output, output, title, data_only, engine,
+              facet_by, facet_layout, facet_columns):
     """Generate a histogram for a specific column."""
-    data = pd.read_csv(input_file)
+    check_streaming_facets(chunksize, facet_by)
+    if value_range:
+        try:
+            value_range = tuple(float(limit) for limit in value_range.split(','))
+        except ValueError:
+            value_range = ()
+        if len(value_range) != 2 or value_range[0] > value_range[1]:
+            raise click.BadParameter("Expected 'lower,upper' with lower <= upper.", param_hint='--range')
+    else:
+        value_range = None
+
+    if chunksize and input_file.lower().endswith('.csv'):
+        binned = histogram_file(input_file, column, bins=bins, binning=binning, value_range=value_range,
+                                chunksize=chunksize, where=where)
+        chart = ChartData.from_histogram(binned, x=column)
+        if counts_output:
+            chart.write(counts_output, data_format='csv')
+        if data_only:
+            return emit_chart_data(chart, output)
+        DataVisualizer(None).render(chart, title=title, output_path=output, engine=engine)
+        return
+
+    data = load_data(input_file, where=where, columns=[column] + ([facet_by] if facet_by else []) if column else None)
     visualizer = DataVisualizer(data)
-    visualizer.histogram(column=column, bins=bins, title=title, output_path=output)
+    if facet_by:
+        return facet_chart(visualizer, 'histogram', facet_by, facet_layout, facet_columns, data_only, output, title, engine,
+                           column, bins=bins, binning=binning, value_range=value_range)
+    if data_only:
+        return emit_chart_data(visualizer.histogram_data(column, bins=bins, binning=binning, value_range=value_range), output)
+    visualizer.histogram(column=column, bins=bins, title=title, output_path=output, binning=binning,
+                         value_range=value_range, counts_output=counts_output, engine=engine)
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
+@click.option('--where', default=None, help=WHERE_HELP)
 @click.option('--x_column', help='The column for x-axis values.')
 @click.option('--y_column', help='The column for y-axis values.')
 @click.option('--output', default=None, type=click.Path(), help='Path to save the scatter plot image (optional).')
 @click.option('--title', default='Scatter Plot', help='Title of the scatter plot.')
-def scatter_plot(input_file, x_column, y_column, output, title):
+@facet_options
+@data_only_option
+@engine_option
+def scatter_plot(input_file, where, x_column, y_column, output, title, data_only, engine, facet_by, facet_layout,
+                 facet_columns):
     """Generate a scatter plot to visualize the relationship between two variables."""
-    data = pd.read_csv(input_file)
+    data = load_data(input_file, where=where)
     visualizer = DataVisualizer(data)
-    visualizer.scatter_plot(x_column=x_column, y_column=y_column, title=title, output_path=output)
+    if facet_by:
+        return facet_chart(visualizer, 'scatter', facet_by, facet_layout, facet_columns, data_only, output, title, engine,
+                           x_column, y_column=y_column)
+    if data_only:
+        return emit_chart_data(visualizer.scatter_data(x_column, y_column), output)
+    visualizer.scatter_plot(x_column=x_column, y_column=y_column, title=title, output_path=output, engine=engine)
+
+@click.command()
+@click.argument('chart_file', type=click.Path(exists=True))
+@click.option('--output', default=None, type=click.Path(), help='Path to save the chart image (optional).')
+@click.option('--title', default=None, help='Title of the chart.')
+@click.option('--x_label', default=None, help='Label for the x-axis (defaults to the source column).')
+@click.option('--y_label', default=None, help='Label for the y-axis.')
+@engine_option
+def render(chart_file, output, title, x_label, y_label, engine):
+    """Render chart data saved with --data-only (JSON, Arrow or Parquet)."""
+    DataVisualizer(None).render(ChartData.read(chart_file), title=title, x_label=x_label, y_label=y_label,
+                                output_path=output, engine=engine)
 
 # Adding commands to the main CLI group
 cli.add_command(basic_bar_chart)
@@ -122,6 +368,7 @@ cli.add_command(table)
 cli.add_command(line_chart)
 cli.add_command(histogram)
 cli.add_command(scatter_plot)
+cli.add_command(render)
 
 if __name__ == '__main__':
     cli()
@@ -3,7 +3,20 @@ import os
 import shutil
 import pandas as pd
 import subprocess
+from unittest import mock
+from click.testing import CliRunner
 from src.cleaner.cleaner import Basic_Cleaner, TextOperations, Standardizer
+from src.cleaner.cleaner_cmd import cli as cleaner_cli
+from src.cleaner.dedup import dedupe_file, hash_rows
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from src.utils.loader import load_data
+from src.utils.streaming import run_chunked, checkpoint_path
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
 
 class TestDataCleaner(unittest.TestCase):
     @classmethod
@@ -69,6 +82,44 @@ class TestDataCleaner(unittest.TestCase):
         self.assertTrue((fill_data.isna().sum() == 0).all())
         
 
+    def test_missing_value_strategies(self):
+        """Test per-column typed fills, group-wise fills and subset/threshold drops."""
+        data = pd.DataFrame({
+            'Team': ['a', 'a', 'a', 'b', 'b', 'b'],
+            'Score': [1.0, None, 3.0, 10.0, None, 30.0],
+            'City': ['X', None, 'X', 'Y', 'Y', None],
+            'Level': [1, None, None, 5, None, 6],
+        })
+
+        filled = Basic_Cleaner(data).handle_missing_values(
+            method='fill', strategies={'Score': 'mean', 'City': 'mode', 'Level': 'ffill'}, group_by=['Team']).data
+        self.assertEqual(filled['Score'].tolist(), [1.0, 2.0, 3.0, 10.0, 20.0, 30.0])
+        self.assertEqual(filled['City'].tolist(), ['X', 'X', 'X', 'Y', 'Y', 'Y'])
+        self.assertEqual(filled['Level'].tolist(), [1, 1, 1, 5, 5, 6])
+
+        typed = Basic_Cleaner(data).handle_missing_values(method='fill', fill_value='0', subset=['Score']).data
+        self.assertTrue(pd.api.types.is_float_dtype(typed['Score']))
+        self.assertEqual(typed['City'].isna().sum(), 2)
+
+        self.assertEqual(len(Basic_Cleaner(data).handle_missing_values(method='drop', subset=['Score']).data), 4)
+        self.assertEqual(len(Basic_Cleaner(data).handle_missing_values(method='drop', thresh=3).data), 4)
+        with self.assertRaises(DataValidationError):
+            Basic_Cleaner(data).handle_missing_values(method='fill', strategies={'City': 'median'})
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_arrow_string_columns(self):
+        """Arrow-backed string columns from Feather inputs are cleaned like object columns."""
+        path = os.path.join(self.test_dir, 'strings.arrow')
+        feather.write_feather(pd.DataFrame({'s': [' x ', 'y ', None], 'n': [1, 2, 3]}), path)
+        output = os.path.join(self.test_dir, 'strings.csv')
+
+        result = CliRunner().invoke(cleaner_cli, ['trim-spaces', path, '--output', output])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(pd.read_csv(output)['s'].tolist()[:2], ['x', 'y'])
+
+        data = load_data(path)
+        self.assertEqual(TextOperations(data).change_case('upper').data['s'].tolist(), [' X ', 'Y ', pd.NA])
+
     def test_change_case(self):
         """Test text case transformations."""
         cleaner = TextOperations(self.data)
@@ -76,6 +127,41 @@ class TestDataCleaner(unittest.TestCase):
 
         self.assertTrue(cleaned_data['Notes'].str.isupper().all())
 
+    def test_coerce_types(self):
+        """Test vectorized coercion with invalid value reporting."""
+        cleaner = Standardizer(self.data).coerce_types({'Age': 'numeric', 'Join Date': 'datetime'}, sample_size=1)
+        cleaned_data = cleaner.data
+
+        self.assertTrue(pd.api.types.is_numeric_dtype(cleaned_data['Age']))
+        self.assertEqual(cleaned_data['Age'].sum(), 220)
+        self.assertEqual(cleaner.coercion_summary['Age'], 1)
+        self.assertEqual(cleaner.coercion_errors.loc[0, ['column', 'row', 'value']].tolist(), ['Age', 1, 'Thirty '])
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(cleaned_data['Join Date']))
+        self.assertEqual(len(cleaner.coercion_errors), 2)
+
+        with self.assertRaises(DataValidationError):
+            Standardizer(self.data).coerce_types({'Age': 'decimal'})
+
+    def test_split_column(self):
+        """Test splitting mixed-delimiter addresses into typed columns."""
+        names = ['Number', 'Street', 'City', 'State']
+        cleaned_data = TextOperations(self.data).split_column('Address', names=names, types={'Number': 'int'}).data
+
+        self.assertEqual(cleaned_data.columns.tolist()[5:9], names)
+        self.assertEqual(cleaned_data.loc[1, names].tolist(), [456, 'Elm St', 'Los Angeles', 'CA'])
+        self.assertEqual(cleaned_data.loc[6, 'City'], 'New York')
+        self.assertEqual(str(cleaned_data['Number'].dtype), 'Int64')
+        self.assertTrue(cleaned_data.loc[7, names].isna().all())
+
+        dropped = TextOperations(self.data).split_column('Address', into=2, drop=True).data
+        self.assertNotIn('Address', dropped.columns)
+        self.assertEqual(dropped.loc[1, 'Address_2'], 'Elm St,Los Angeles,CA')
+
+        with self.assertRaises(ColumnNotFoundError):
+            TextOperations(self.data).split_column('Address', into=2, types={'zzz': 'int'})
+        with self.assertRaises(DataValidationError):
+            TextOperations(self.data).split_column('Address', pattern=r'(?P<number>\d+)', names=['Number', 'Street'])
+
     def test_standardize_date(self):
         """Test date format standardization."""
         cleaner = Standardizer(self.data)
@@ -98,5 +184,131 @@ class TestDataCleaner(unittest.TestCase):
         self.assertTrue(cleaned_data['Salary'].dtype == float)
         self.assertAlmostEqual(cleaned_data['Salary'].iloc[0], 5000.0)
 
+    def test_remove_duplicates(self):
+        """Test exact deduplication, before and after trimming."""
+        self.assertEqual(len(Basic_Cleaner(self.data).remove_duplicates().data), 8)
+        self.assertEqual(len(Basic_Cleaner(self.data).trim_spaces().remove_duplicates().data), 7)
+        self.assertEqual(len(Basic_Cleaner(self.data).remove_duplicates(keep=False).data), 7)
+
+        deduped = Basic_Cleaner(self.data).remove_duplicates(subset=['Age'], keep='last').data
+        self.assertEqual(deduped['Age'].tolist().count('25'), 1)
+        self.assertEqual(deduped.index[0], 1)
+
+        # The two row hashes must differ for numeric and datetime columns too, not only for text.
+        numbers = pd.DataFrame({'Id': range(100), 'Amount': [i / 4 for i in range(100)],
+                                'When': pd.date_range('2024-01-01', periods=100, freq='h')})
+        hashes = hash_rows(numbers)
+        self.assertFalse((hashes['h1'] == hashes['h2']).any())
+        self.assertFalse(hashes.duplicated().any())
+
+    def test_remove_duplicates_out_of_core(self):
+        """Test that file-based deduplication matches the in-memory result."""
+        output = os.path.join(self.test_dir, 'deduped.csv')
+        stats = dedupe_file(self.input_csv, output, chunksize=3, partitions=4)
+
+        self.assertEqual(stats, {'rows': 10, 'duplicates': 2})
+        expected = Basic_Cleaner(self.data).remove_duplicates().data.reset_index(drop=True)
+        pd.testing.assert_frame_equal(pd.read_csv(output), expected)
+
+    def test_remove_fuzzy_duplicates(self):
+        """Test that near-identical names and addresses are merged."""
+        cleaned_data = Basic_Cleaner(self.data).remove_fuzzy_duplicates(columns=[' Name ', 'Address']).data
+
+        self.assertEqual(len(cleaned_data), 9)
+        self.assertNotIn(6, cleaned_data.index)
+
+class TestChunkedCleaning(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = 'test_chunked'
+        os.makedirs(self.test_dir, exist_ok=True)
+        self.input_csv = os.path.join(self.test_dir, 'input.csv')
+        self.output_csv = os.path.join(self.test_dir, 'output.csv')
+        self.data = pd.DataFrame({
+            'Name': [f' name {i} ' for i in range(10)],
+            'Join Date': ['2021/01/05', '2021/02/05', '', '2021/06/06', '2021/01/07'] * 2,
+        })
+        self.data.to_csv(self.input_csv, index=False)
+        self.step_spec = {'step': 'standardize_date', 'column': 'Join Date'}
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    @staticmethod
+    def clean(data):
+        return Standardizer(data).standardize_date(column='Join Date').data
+
+    def test_resume_after_crash(self):
+        calls = []
+
+        def crashing_clean(data):
+            calls.append(len(data))
+            if len(calls) == 3:
+                raise RuntimeError("simulated crash")
+            return self.clean(data)
+
+        with self.assertRaises(RuntimeError):
+            run_chunked(self.input_csv, self.output_csv, crashing_clean, self.step_spec, chunksize=3)
+
+        stats = run_chunked(self.input_csv, self.output_csv, self.clean, self.step_spec, chunksize=3, resume=True)
+        self.assertEqual(stats['resumed_from'], 6)
+        self.assertEqual(stats['rows_this_run'], 4)
+
+        expected = self.clean(pd.read_csv(self.input_csv))
+        pd.testing.assert_frame_equal(pd.read_csv(self.output_csv), expected)
+
+    def test_resume_restores_step_state(self):
+        """Forward-fill carries and coercion counts survive a crash and --resume."""
+        data = pd.DataFrame({'Score': ['1', '', '', '', 'x', '7', '', '', 'y', '']})
+        data.to_csv(self.input_csv, index=False)
+        handle_missing = Basic_Cleaner.handle_missing_values
+        coerce = Standardizer.coerce_types
+        commands = [
+            (['handle-missing-values', self.input_csv, '--method', 'fill', '--strategies', 'Score:ffill'],
+             'handle_missing_values', handle_missing),
+            (['coerce-types', self.input_csv, '--types', 'Score:numeric', '--errors_output', os.path.join(self.test_dir, 'errors.csv')],
+             'coerce_types', coerce),
+        ]
+        for args, method, original in commands:
+            args = args + ['--output', self.output_csv, '--chunksize', '3']
+            expected = CliRunner().invoke(cleaner_cli, args)
+            self.assertEqual(expected.exit_code, 0, expected.output)
+            with open(self.output_csv) as file:
+                expected_output = file.read()
+            expected_errors = pd.read_csv(os.path.join(self.test_dir, 'errors.csv')) if method == 'coerce_types' else None
+
+            calls = []
+
+            def crash_on_third_chunk(cleaner, *call_args, **call_kwargs):
+                calls.append(1)
+                if len(calls) == 3:
+                    raise RuntimeError("simulated crash")
+                return original(cleaner, *call_args, **call_kwargs)
+
+            target = Basic_Cleaner if method == 'handle_missing_values' else Standardizer
+            with mock.patch.object(target, method, crash_on_third_chunk):
+                self.assertIsInstance(CliRunner().invoke(cleaner_cli, args).exception, RuntimeError)
+            resumed = CliRunner().invoke(cleaner_cli, args + ['--resume'])
+            self.assertEqual(resumed.exit_code, 0, resumed.output)
+            with open(self.output_csv) as file:
+                self.assertEqual(file.read(), expected_output)
+            if expected_errors is not None:
+                self.assertIn('Score: 2 invalid numeric values', resumed.output)
+                pd.testing.assert_frame_equal(pd.read_csv(os.path.join(self.test_dir, 'errors.csv')), expected_errors)
+
+    def test_resume_processes_appended_rows_only(self):
+        run_chunked(self.input_csv, self.output_csv, self.clean, self.step_spec, chunksize=4)
+        self.data.iloc[:2].to_csv(self.input_csv, mode='a', header=False, index=False)
+
+        stats = run_chunked(self.input_csv, self.output_csv, self.clean, self.step_spec, chunksize=4, resume=True)
+        self.assertEqual(stats['rows_this_run'], 2)
+        self.assertEqual(stats['rows_processed'], 12)
+        self.assertEqual(len(pd.read_csv(self.output_csv)), 12)
+
+    def test_resume_rejects_different_step(self):
+        run_chunked(self.input_csv, self.output_csv, self.clean, self.step_spec, chunksize=4)
+        self.assertTrue(os.path.exists(checkpoint_path(self.output_csv)))
+        with self.assertRaises(DataValidationError):
+            run_chunked(self.input_csv, self.output_csv, self.clean, {'step': 'trim_spaces'}, chunksize=4, resume=True)
+
 if __name__ == '__main__':
     unittest.main()
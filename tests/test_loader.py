@@ -0,0 +1,78 @@
+import unittest
+import os
+import shutil
+import tempfile
+import pandas as pd
+from src.utils.exceptions import DataValidationError
+from src.utils.filtering import to_arrow_filter
+from src.utils.loader import DatasetRegistry, enable_registry, disable_registry, load_data
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+
+class TestLoader(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.df = pd.DataFrame({
+            'Category': ['A', 'B', 'C', 'A'],
+            'Values': [10, 25, 40, 17],
+        })
+
+    def tearDown(self):
+        disable_registry()
+        shutil.rmtree(self.test_dir)
+
+    def test_registry_reloads_changed_file(self):
+        path = os.path.join(self.test_dir, 'data.csv')
+        self.df.to_csv(path, index=False)
+        registry = enable_registry(DatasetRegistry())
+
+        first = load_data(path)
+        first.loc[0, 'Values'] = -1
+        self.assertEqual(load_data(path).loc[0, 'Values'], 10, "Callers must receive a private copy.")
+
+        self.df.iloc[:2].to_csv(path, index=False)
+        self.assertEqual(len(load_data(path)), 2)
+        self.assertEqual(len(registry), 1)
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_arrow_ipc_is_memory_mapped(self):
+        path = os.path.join(self.test_dir, 'data.feather')
+        feather.write_feather(self.df, path, compression='uncompressed')
+
+        allocated_before = pa.total_allocated_bytes()
+        data = load_data(path)
+
+        self.assertEqual(pa.total_allocated_bytes(), allocated_before, "Loading should not copy column buffers.")
+        self.assertIsInstance(data['Values'].dtype, pd.ArrowDtype)
+        self.assertEqual(data['Values'].sum(), self.df['Values'].sum())
+        self.assertEqual(data['Category'].tolist(), self.df['Category'].tolist())
+
+    def test_where_filters_csv_in_chunks(self):
+        path = os.path.join(self.test_dir, 'data.csv')
+        self.df.to_csv(path, index=False)
+
+        data = load_data(path, where="Values > 15 and Category != 'C'", chunksize=1)
+        self.assertEqual(data['Values'].tolist(), [25, 17])
+        with self.assertRaises(DataValidationError):
+            load_data(path, where="Missing > 1")
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_where_is_pushed_down_to_parquet(self):
+        path = os.path.join(self.test_dir, 'data.parquet')
+        self.df.to_parquet(path, row_group_size=1)
+
+        self.assertIsNotNone(to_arrow_filter("Values >= 17 and Category in ['A', 'B']"))
+        self.assertIsNone(to_arrow_filter("Category != 'A'"), "Negations must not be pushed down.")
+        data = load_data(path, where="Values >= 17 and Category in ['A', 'B']")
+        self.assertEqual(data['Values'].tolist(), [25, 17])
+
+        # Filters Arrow cannot apply to the column's type fall back to filtering after the read.
+        self.assertTrue(load_data(path, where="Category == 5").empty)
+        self.assertTrue(load_data(path, where="Values == 'x'").empty)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,15 @@
 import unittest
 import pandas as pd
 import os
-from src.reporter.reporter import create_combined_summary_report, generate_pdf_report, generate_txt_report
+import shutil
+import tempfile
+import json
+from src.reporter.reporter import (create_combined_summary_report, generate_pdf_report, generate_txt_report,
+                                   summary_tables, write_report)
+from src.reporter.incremental import ReportState, update_report_state
+from src.reporter.drift import comparison_sections, ks_statistic, population_stability_index
+from src.reporter.rollup import rollup_states
+from src.utils.exceptions import DataValidationError
 
 class TestReporter(unittest.TestCase):
 
@@ -32,5 +40,158 @@ class TestReporter(unittest.TestCase):
             lines = f.readlines()
             self.assertGreater(len(lines), 0, "The TXT report should contain content.")
 
+    def test_typed_tables_and_writers(self):
+        """Test that sections stay typed until rendered, and the JSON, HTML and Parquet writers."""
+        tables = summary_tables(self.df)
+        missing = tables['Missing Values Summary'].set_index('Field')
+        self.assertEqual(missing.loc['Missing', 'Missing Values'], 2)
+        self.assertEqual(missing.loc['Missing', 'Missing Percentage'], 50.0)
+        self.assertEqual(tables['Descriptive Statistics'].set_index('Field').loc['Values', 'Std'], self.df['Values'].std())
+        self.assertIn(['Column: Missing', 'Missing Values: 2', 'Percentage: 50.00%'],
+                      create_combined_summary_report(self.df)['Missing Values Summary'])
+
+        output_dir = tempfile.mkdtemp()
+        try:
+            write_report(tables, os.path.join(output_dir, 'summary.json'))
+            with open(os.path.join(output_dir, 'summary.json')) as f:
+                exported = json.load(f)
+            self.assertEqual(exported['Value Counts Summary'][0], {'Field': 'Category', 'Value': 'A', 'Count': 2})
+            self.assertIsNone(exported['Descriptive Statistics'][0]['Mean'])
+
+            write_report(tables, os.path.join(output_dir, 'summary.parquet'))
+            outliers = pd.read_parquet(os.path.join(output_dir, 'summary.parquet', 'outliers_summary.parquet'))
+            pd.testing.assert_frame_equal(outliers, tables['Outliers Summary'])
+
+            write_report(tables, os.path.join(output_dir, 'summary.html'))
+            with open(os.path.join(output_dir, 'summary.html')) as f:
+                self.assertIn('<h2>Correlation Matrix</h2>', f.read())
+            write_report({'<b>Values</b> & more': tables['Outliers Summary']}, os.path.join(output_dir, 'escaped.html'))
+            with open(os.path.join(output_dir, 'escaped.html')) as f:
+                self.assertIn('<h2>&lt;b&gt;Values&lt;/b&gt; &amp; more</h2>', f.read())
+            generate_pdf_report(tables, pdf_file=os.path.join(output_dir, 'summary.pdf'))
+        finally:
+            shutil.rmtree(output_dir)
+
+class TestIncrementalReport(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.csv_file = os.path.join(self.test_dir, 'data.csv')
+        self.state_file = os.path.join(self.test_dir, 'state.json')
+        self.df = pd.DataFrame({
+            'Category': ['A', 'B', 'C', 'A', 'B', 'A'],
+            'Values': [10, 25, 40, 17, 3, 90],
+            'Missing': [None, 25, None, 17, 1, 2],
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def assertStatsMatch(self, state, data):
+        stats = {row[0]: row for row in state.sections()['Descriptive Statistics']}
+        for column in ['Values', 'Missing']:
+            expected = data[column].describe()
+            self.assertEqual(stats[column][1], expected['count'])
+            for position, name in enumerate(['mean', 'std', 'min', '25%', '50%', '75%', 'max'], start=2):
+                self.assertAlmostEqual(stats[column][position], round(expected[name], 2), places=2)
+        self.assertEqual(stats['Category'][-1], data['Category'].nunique())
+
+    def test_appended_rows_are_merged(self):
+        self.df.iloc[:4].to_csv(self.csv_file, index=False)
+        first = update_report_state(self.csv_file, self.state_file)
+        self.assertEqual(first.rows, 4)
+
+        self.df.iloc[4:].to_csv(self.csv_file, mode='a', header=False, index=False)
+        state = ReportState.load(self.state_file)
+        self.assertEqual(state.ingest(self.csv_file), 2)
+        self.assertEqual(state.ingest(self.csv_file), 0)
+        self.assertStatsMatch(state, self.df)
+
+        sections = state.sections()
+        self.assertIn(['A', 3], sections['Value Counts Summary'])
+        self.assertIn(['Column: Missing', 'Missing Values: 2', 'Percentage: 33.33%'], sections['Missing Values Summary'])
+        generate_pdf_report(sections, pdf_file=os.path.join(self.test_dir, 'report.pdf'))
+
+    def test_appended_block_with_missing_keeps_distinct_count(self):
+        pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'b', 'c']}).to_csv(self.csv_file, index=False)
+        update_report_state(self.csv_file, self.state_file)
+        with open(self.csv_file, 'a') as file:
+            file.write('1,a\n2,b\n,c\n')
+        state = update_report_state(self.csv_file, self.state_file)
+
+        stats = {row[0]: row for row in state.sections()['Descriptive Statistics']}
+        self.assertEqual(stats['id'][-1], 3)
+
+    def test_partition_states_merge(self):
+        partitions = os.path.join(self.test_dir, 'partitions')
+        os.makedirs(partitions)
+        self.df.iloc[:3].to_csv(os.path.join(partitions, 'day1.csv'), index=False)
+        self.df.iloc[3:].to_csv(os.path.join(partitions, 'day2.csv'), index=False)
+
+        merged = ReportState()
+        merged.ingest(os.path.join(partitions, 'day1.csv'))
+        other = ReportState()
+        other.ingest(os.path.join(partitions, 'day2.csv'))
+        merged.merge(other)
+        self.assertStatsMatch(merged, self.df)
+
+        whole = ReportState()
+        self.assertEqual(whole.ingest(partitions), 6)
+        self.assertStatsMatch(whole, self.df)
+
+    def test_rewritten_file_is_rejected(self):
+        self.df.to_csv(self.csv_file, index=False)
+        update_report_state(self.csv_file, self.state_file)
+        self.df.iloc[::-1].to_csv(self.csv_file, index=False)
+        with self.assertRaises(DataValidationError):
+            update_report_state(self.csv_file, self.state_file)
+
+class TestReportRollup(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def write_partitions(self, name, frames):
+        directory = os.path.join(self.test_dir, name)
+        os.makedirs(directory)
+        for number, frame in enumerate(frames):
+            frame.to_csv(os.path.join(directory, f'day{number}.csv'), index=False)
+        return directory
+
+    def test_parallel_rollup_matches_single_pass(self):
+        frames = [pd.DataFrame({'Category': list('ABCA'), 'Values': [1.0, 5.0, 9.0, 2.0 + day]}) for day in range(4)]
+        partitions = self.write_partitions('current', frames)
+
+        merged = rollup_states([partitions], max_workers=2)
+        whole = ReportState()
+        whole.update(pd.concat(frames, ignore_index=True))
+        self.assertEqual(merged.rows, 16)
+        values = merged.sections()['Descriptive Statistics'][1]
+        self.assertEqual(values, whole.sections()['Descriptive Statistics'][1])
+        self.assertEqual(rollup_states([partitions], executor='thread').sections()['Descriptive Statistics'][1], values)
+        self.assertIn(['A', 8], merged.sections()['Value Counts Summary'])
+
+    def test_distribution_shift(self):
+        self.assertEqual(population_stability_index([10, 20, 30], [1, 2, 3]), 0.0)
+        self.assertAlmostEqual(ks_statistic([1, 1, 0, 0], [0, 0, 1, 1]), 1.0)
+
+        baseline = self.write_partitions('baseline', [pd.DataFrame({'Values': range(0, 500), 'Category': ['A', 'B'] * 250})])
+        current = self.write_partitions('current', [pd.DataFrame({'Values': range(250, 750), 'Category': ['A'] * 500})])
+        sections = comparison_sections(rollup_states([baseline]), rollup_states([current]))
+
+        shift = sections['Distribution Shift'].set_index('Field')
+        self.assertEqual(shift.loc['Values', 'Shift'], 'major')
+        self.assertAlmostEqual(shift.loc['Values', 'KS'], 0.5, places=2)
+        self.assertEqual(shift.loc['Category', 'Shift'], 'major')
+        self.assertEqual(sections['Summary Comparison'].set_index('Field').loc['Values', 'Mean Change'], 250.0)
+
+        text_file = os.path.join(self.test_dir, 'comparison.txt')
+        generate_txt_report(sections, text_file)
+        with open(text_file) as file:
+            self.assertIn('Values | 500 | 500 | 249.5 | 499.5 | 250.0 |', file.read())
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest import mock
+import pandas as pd
+from src.runner.runner import Job, JobRunner, clean_step, derive_step, report_step, write_result
+from src.utils.exceptions import DataValidationError
+
+class TestJobRunner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.test_dir = tempfile.mkdtemp()
+        cls.inputs = []
+        for i in range(4):
+            path = os.path.join(cls.test_dir, f'input_{i}.csv')
+            pd.DataFrame({
+                'Name': [f' name{i} ', 'Bob ', None],
+                'Value': [i, i + 1, i + 2],
+            }).to_csv(path, index=False)
+            cls.inputs.append(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.test_dir)
+
+    def output_path(self, name):
+        return os.path.join(self.test_dir, name)
+
+    def test_cleaning_pipeline_with_threads(self):
+        steps = [clean_step('Basic_Cleaner.trim_spaces'), clean_step('Basic_Cleaner.handle_missing_values', method='drop'),
+                 derive_step('Double = Value * 2')]
+        jobs = [Job(path, steps, output=self.output_path(f'clean_{i}.csv')) for i, path in enumerate(self.inputs)]
+        results = JobRunner(process_concurrency=2, queue_size=1, executor='thread').run(jobs)
+
+        self.assertTrue(all(result.ok for result in results), results)
+        for i in range(len(self.inputs)):
+            cleaned = pd.read_csv(self.output_path(f'clean_{i}.csv'))
+            self.assertEqual(cleaned['Name'].tolist(), [f'name{i}', 'Bob'])
+            self.assertEqual(cleaned['Double'].tolist(), [2 * i, 2 * i + 2])
+
+    def test_report_pipeline_with_processes(self):
+        jobs = [Job(path, report_step('txt'), output=self.output_path(f'report_{i}.txt')) for i, path in enumerate(self.inputs)]
+        results = JobRunner(process_concurrency=2, executor='process').run(jobs)
+
+        self.assertTrue(all(result.ok for result in results), results)
+        self.assertEqual(set(results[0].timings), {'read', 'process', 'write'})
+        with open(self.output_path('report_0.txt')) as f:
+            self.assertIn("Section: Descriptive Statistics", f.read())
+
+    def test_failed_job_does_not_stop_the_batch(self):
+        jobs = [Job(os.path.join(self.test_dir, 'missing.csv'), clean_step('Basic_Cleaner.trim_spaces')),
+                Job(self.inputs[0], clean_step('Basic_Cleaner.trim_spaces'))]
+        results = JobRunner(executor='thread').run(jobs)
+
+        self.assertFalse(results[0].ok)
+        self.assertNotIn('process', results[0].timings)
+        self.assertTrue(results[1].ok)
+        self.assertEqual(len(results[1].result), 3)
+
+    def test_bytes_results_are_written_atomically(self):
+        output = self.output_path('chart.png')
+        write_result(b'\x89PNG first', output)
+        with mock.patch('src.runner.runner.open_output', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                write_result(b'\x89PNG second', output)
+        write_result(b'\x89PNG second', output)
+        with open(output, 'rb') as file:
+            self.assertEqual(file.read(), b'\x89PNG second')
+        self.assertFalse([name for name in os.listdir(self.test_dir) if name.endswith('.tmp')])
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(DataValidationError):
+            JobRunner(queue_size=0)
+        with self.assertRaises(DataValidationError):
+            clean_step('Basic_Cleaner.no_such_method')
+
+if __name__ == '__main__':
+    unittest.main()
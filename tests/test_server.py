@@ -0,0 +1,80 @@
+import unittest
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import pandas as pd
+from src.server.server import DataServer, send_request
+from src.utils.exceptions import DataValidationError
+from src.utils.loader import disable_registry
+
+class TestDataServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.test_dir = tempfile.mkdtemp()
+        cls.input_csv = os.path.join(cls.test_dir, 'input.csv')
+        pd.DataFrame({
+            'Name': ['Alice ', ' Bob', 'Charlie'],
+            'Age': [25, 30, 35],
+        }).to_csv(cls.input_csv, index=False)
+
+        cls.socket_path = os.path.join(cls.test_dir, 'tidydata.sock')
+        cls.server = DataServer(socket_path=cls.socket_path)
+        cls.server.start()
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.thread.join(timeout=5)
+        disable_registry()
+        shutil.rmtree(cls.test_dir)
+
+    def request(self, request):
+        return send_request(request, socket_path=self.socket_path, timeout=30)
+
+    def test_ping(self):
+        response = self.request({'action': 'ping'})
+        self.assertEqual(response['exit_code'], 0)
+        self.assertEqual(response['output'], "pong\n")
+
+    def test_run_command_with_relative_paths(self):
+        response = self.request({
+            'action': 'run',
+            'args': ['clean', 'trim-spaces', 'input.csv', '--output', 'trimmed.csv'],
+            'cwd': self.test_dir,
+        })
+        self.assertEqual(response['exit_code'], 0, response['output'])
+
+        trimmed = pd.read_csv(os.path.join(self.test_dir, 'trimmed.csv'))
+        self.assertEqual(trimmed['Name'].tolist(), ['Alice', 'Bob', 'Charlie'])
+        self.assertIn(os.path.abspath(self.input_csv), self.server.registry.datasets())
+
+    def test_usage_error_is_reported(self):
+        response = self.request({'action': 'run', 'args': ['clean', 'no-such-command'], 'cwd': self.test_dir})
+        self.assertNotEqual(response['exit_code'], 0)
+        self.assertIn('no-such-command', response['output'])
+
+    def test_start_keeps_existing_files_and_live_sockets(self):
+        with self.assertRaises(FileExistsError):
+            DataServer(socket_path=self.socket_path).start()
+        with self.assertRaises(FileExistsError):
+            DataServer(socket_path=self.input_csv).start()
+        self.assertEqual(len(pd.read_csv(self.input_csv)), 3)
+        self.assertEqual(self.request({'action': 'ping'})['output'], "pong\n")
+
+        with self.assertRaises(DataValidationError):
+            DataServer(host='0.0.0.0', port=0)
+
+        # A socket nobody listens on is left over from a crashed server and is replaced.
+        stale_path = os.path.join(self.test_dir, 'stale.sock')
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(stale_path)
+        server = DataServer(socket_path=stale_path)
+        server.start()
+        server._server.server_close()
+
+if __name__ == '__main__':
+    unittest.main()
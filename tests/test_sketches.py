@@ -0,0 +1,38 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.utils.sketches import HyperLogLog, QuantileSketch, TopK, hash_values
+
+class TestSketches(unittest.TestCase):
+
+    def test_hyperloglog_estimate_and_merge(self):
+        left, right = HyperLogLog(), HyperLogLog()
+        left.update(hash_values(pd.Series(np.arange(0, 60000))))
+        right.update(hash_values(pd.Series(np.arange(40000, 100000))))
+        self.assertAlmostEqual(left.merge(right).estimate(), 100000, delta=5000)
+
+        small = HyperLogLog()
+        small.update(hash_values(pd.Series(['a', 'b', 'c', 'a'])))
+        self.assertEqual(small.estimate(), 3)
+
+    def test_quantile_sketch_is_exact_below_capacity_and_mergeable(self):
+        values = np.random.default_rng(0).normal(size=20000)
+        left, right = QuantileSketch(seed=1), QuantileSketch(seed=2)
+        left.update(values[:10000])
+        right.update(values[10000:])
+        left.merge(right)
+        self.assertEqual(left.count, 20000)
+        self.assertAlmostEqual(left.quantile(0.5), np.median(values), delta=0.1)
+
+        exact = QuantileSketch()
+        exact.update([1, 2, 3, np.nan, 4])
+        self.assertEqual(exact.quantile(0.5), 2.5)
+
+    def test_round_trip(self):
+        top = TopK(capacity=2)
+        top.update(pd.Series(['x', 'y', 'x', 'z', 'x', 'y']))
+        restored = TopK.from_dict(top.to_dict())
+        self.assertEqual(restored.most_common(), [('x', 3), ('y', 2)])
+
+if __name__ == '__main__':
+    unittest.main()
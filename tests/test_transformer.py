@@ -3,7 +3,14 @@ import os
 import shutil
 import pandas as pd
 import subprocess
+from click.testing import CliRunner
 from src.transformer.transformer import DataTransformer
+from src.transformer.aggregation import aggregate_file
+from src.utils.exceptions import ColumnNotFoundError, DataValidationError
+from src.transformer.join import join_files
+from src.transformer.resample import resample_file
+from src.transformer.sort import sort_file
+from src.transformer.transformer_cmd import cli as transform_cli
 
 class TestDataCleaner(unittest.TestCase):
     @classmethod
@@ -59,7 +66,189 @@ class TestDataCleaner(unittest.TestCase):
         renamed_column = DataTransformer(self.data)
         transformed_data = renamed_column.rename_column(data=self.data,old_name='Age', new_name='Ages')
         self.assertTrue(len(transformed_data['Ages']), 10)
-        
+
+    def test_bulk_column_operations(self):
+        transformer = DataTransformer(self.data)
+
+        added = transformer.add_columns(data=self.data, values={'Source': 'import', 'Weight': 2},
+                                        expressions=['Row = Weight * 3', 'Next = Row + 1', "Label = concat(Source, '-', upper(Notes))"])
+        self.assertEqual(added['Source'].unique().tolist(), ['import'])
+        self.assertEqual(added['Next'].tolist()[:3], [7, 7, 7])
+        self.assertEqual(added['Label'].tolist()[1], 'import-ADDRESS CONFIRMED ')
+        with self.assertRaises(ColumnNotFoundError):
+            transformer.add_columns(data=self.data, expressions=['Age = Weight * 2'])
+        with self.assertRaises(DataValidationError):
+            transformer.add_columns(data=self.data, values={'Row': 1}, expressions=['Row = 2'])
+
+        dropped = transformer.drop_columns(data=self.data, names=['Notes'], pattern='^(Age|Sal)')
+        self.assertEqual(list(dropped.columns), [' Name ', 'Join Date', 'Address'])
+
+        renamed = transformer.rename_columns(data=self.data, mapping={'Age': 'Years', 'Notes': 'Comment'})
+        self.assertIn('Years', renamed.columns)
+        self.assertIn('Comment', renamed.columns)
+
+    def test_derive_columns(self):
+        data = pd.DataFrame({
+            'price': [2.5, 10.0, None, 4.0],
+            'qty': [2, 12, 1, 30],
+            'ordered': ['2023-01-15', '2024-03-02', 'unknown', '2024-12-31'],
+            'first name': ['ann', 'bob', 'cy', 'dee'],
+        })
+        derived = DataTransformer(data).derive_columns(data, [
+            'total = price * qty',
+            'year = year(ordered)',
+            "label = upper(`first name`) + '-' + str(qty)",
+            "size = case when total >= 100 then 'large' when total > 0 then 'small' else 'none' end",
+            'bulk = qty > 10 and not price > 5',
+        ])
+        self.assertEqual(derived['total'].tolist()[:2], [5.0, 120.0])
+        self.assertEqual(derived['year'].tolist()[:2], [2023, 2024])
+        self.assertTrue(pd.isna(derived['year'][2]))
+        self.assertEqual(derived['label'].tolist(), ['ANN-2', 'BOB-12', 'CY-1', 'DEE-30'])
+        self.assertEqual(derived['size'].tolist(), ['small', 'large', 'none', 'large'])
+        self.assertEqual(derived['bulk'].tolist(), [False, False, False, True])
+
+        with self.assertRaises(ColumnNotFoundError):
+            DataTransformer(data).derive_columns(data, ['x = missing * 2'])
+        with self.assertRaises(DataValidationError):
+            DataTransformer(data).derive_columns(data, ['x = __import__("os")'])
+        with self.assertRaises(DataValidationError):
+            DataTransformer(data).derive_columns(data, ["x = qty + 'a'"])
+
+        # Without `else`, unmatched rows are missing, also for string results.
+        derived = DataTransformer(data).derive_columns(data, ["bulk = case when qty > 10 then 'yes' end"])
+        self.assertEqual(derived['bulk'].tolist(), [None, 'yes', None, 'yes'])
+
+        input_csv = os.path.join(self.test_dir, 'orders.csv')
+        chunked_csv = os.path.join(self.test_dir, 'orders_derived.csv')
+        data.to_csv(input_csv, index=False)
+        result = CliRunner().invoke(transform_cli, ['derive', input_csv, '--expr', 'total = price * qty',
+                                                    '--expr', "size = if_else(total >= 100, 'large', 'small')",
+                                                    '--chunksize', '1', '--output', chunked_csv])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(pd.read_csv(chunked_csv)['size'].tolist(), ['small', 'large', 'small', 'large'])
+
+    def test_drop_columns_cli_skips_columns_at_load(self):
+        output = os.path.join(self.test_dir, 'dropped.csv')
+        result = CliRunner().invoke(transform_cli, ['drop-columns', self.input_csv, '--pattern', '^(Age|Notes)$', '--output', output])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(list(pd.read_csv(output).columns), [' Name ', 'Salary', 'Join Date', 'Address'])
+
+    def test_group_aggregate(self):
+        data = pd.DataFrame({
+            'Team': ['a', 'b', 'a', 'b', 'a', 'c'],
+            'Score': [1.0, 10.0, 3.0, None, 5.0, 7.0],
+            'Player': ['x', 'y', 'x', 'z', 'w', 'v'],
+        })
+        aggregations = [('Score', 'sum'), ('Score', 'mean'), ('Score', 'count'), ('Player', 'nunique'), ('Score', 'median')]
+        transformed_data = DataTransformer(data).group_aggregate(data=data, keys=['Team'], aggregations=aggregations)
+
+        self.assertEqual(transformed_data['Team'].tolist(), ['a', 'b', 'c'])
+        self.assertEqual(transformed_data['Score_sum'].tolist(), [9.0, 10.0, 7.0])
+        self.assertEqual(transformed_data['Score_count'].tolist(), [3, 1, 1])
+        self.assertEqual(transformed_data['Player_nunique'].tolist(), [2, 2, 1])
+        self.assertEqual(transformed_data['Score_median'].tolist(), [3.0, 10.0, 7.0])
+
+        # Chunked partial aggregation must merge to the same result.
+        path = os.path.join(self.test_dir, 'scores.csv')
+        data.to_csv(path, index=False)
+        chunked = aggregate_file(path, ['Team'], aggregations, chunksize=2).reset_index()
+        pd.testing.assert_frame_equal(chunked, transformed_data, check_dtype=False)
+
+        # --chunksize on a non-CSV input aggregates it in memory instead of parsing it as CSV.
+        parquet, output = os.path.join(self.test_dir, 'scores.parquet'), os.path.join(self.test_dir, 'scores_by_team.csv')
+        data.to_parquet(parquet, index=False)
+        result = CliRunner().invoke(transform_cli, ['group-aggregate', parquet, '--by', 'Team', '--agg', 'Score:sum',
+                                                    '--chunksize', '2', '--output', output])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(pd.read_csv(output)['Score_sum'].tolist(), [9.0, 10.0, 7.0])
+
+    def test_resample(self):
+        data = pd.DataFrame({
+            'Time': ['2024-01-01 00:10', '2024-01-01 00:50', '2024-01-01 01:30', 'not a time', '2024-01-01 03:05',
+                     '2024-01-01 00:20'],
+            'Reading': [1.0, 3.0, 5.0, 100.0, 7.0, 2.0],
+        })
+        transformed_data = DataTransformer(data).resample(data, 'Time', ['Reading'], '1H', ['mean', 'sum', 'count', 'max'])
+
+        self.assertEqual(transformed_data['Time'].dt.hour.tolist(), [0, 1, 2, 3])
+        self.assertEqual(transformed_data['Reading_mean'].tolist()[:2], [2.0, 5.0])
+        self.assertTrue(pd.isna(transformed_data['Reading_mean'].iloc[2]))
+        self.assertEqual(transformed_data['Reading_sum'].tolist(), [6.0, 5.0, 0.0, 7.0])
+        self.assertEqual(transformed_data['Reading_count'].tolist(), [3, 1, 0, 1])
+
+        # Buckets split across chunks, and gaps between chunks, must merge to the same result.
+        path = os.path.join(self.test_dir, 'readings.csv')
+        data.to_csv(path, index=False)
+        chunked = resample_file(path, 'Time', ['Reading'], '1H', ['mean', 'sum', 'count', 'max'], chunksize=2).reset_index()
+        pd.testing.assert_frame_equal(chunked, transformed_data, check_dtype=False, check_freq=False)
+
+        with self.assertRaises(DataValidationError):
+            DataTransformer(data).resample(data, 'Time', ['Reading'], 'fortnightly')
+
+    def test_join(self):
+        events = pd.DataFrame({'User': ['u1', 'u2', 'u3', 'u1'], 'Amount': [10, 20, 30, 40]})
+        users = pd.DataFrame({'User': ['u1', 'u2', 'u2'], 'Country': ['KE', 'UG', 'TZ']})
+        transformer = DataTransformer(events)
+
+        self.assertEqual(len(transformer.join(data=events, other=users, on=['User'], how='inner')), 4)
+        self.assertEqual(len(transformer.join(data=events, other=users, on=['User'], how='left')), 5)
+        self.assertEqual(transformer.join(data=events, other=users, on=['User'], how='anti')['User'].tolist(), ['u3'])
+
+        # Broadcast and on-disk partitioned joins must agree.
+        events_csv, users_csv = os.path.join(self.test_dir, 'events.csv'), os.path.join(self.test_dir, 'users.csv')
+        events.to_csv(events_csv, index=False)
+        users.to_csv(users_csv, index=False)
+        for memory_limit, strategy in ((1024 * 1024, 'broadcast'), (0, 'partitioned')):
+            output = os.path.join(self.test_dir, f'joined_{strategy}.csv')
+            stats = join_files(events_csv, users_csv, output, ['User'], how='left', memory_limit=memory_limit, partitions=4)
+            self.assertEqual(stats['strategy'], strategy)
+            self.assertEqual((stats['output_rows'], stats['matched_left_rows']), (5, 3))
+            self.assertAlmostEqual(stats['fan_out'], 4 / 3)
+            self.assertEqual(len(pd.read_csv(output)), 5)
+
+        events_parquet, users_parquet = os.path.join(self.test_dir, 'events.parquet'), os.path.join(self.test_dir, 'users.parquet')
+        events.to_parquet(events_parquet, index=False)
+        users.to_parquet(users_parquet, index=False)
+        output = os.path.join(self.test_dir, 'joined_parquet.csv')
+        result = CliRunner().invoke(transform_cli, ['join', events_parquet, users_parquet, '--on', 'User', '--how', 'left', '--output', output])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(len(pd.read_csv(output)), 5)
+
+    def test_sort(self):
+        data = pd.DataFrame({'Country': ['KE', 'UG', 'KE', None, 'UG'], 'Amount': [5, 3, 9, 1, 3], 'Id': [0, 1, 2, 3, 4]})
+        transformer = DataTransformer(data)
+
+        sorted_data = transformer.sort(data=data, by=['Country', 'Amount'], ascending=[True, False])
+        self.assertEqual(sorted_data['Id'].tolist(), [2, 0, 1, 4, 3])
+        self.assertEqual(transformer.sort(data=data, by=['Amount'], ascending=[False], n=2)['Id'].tolist(), [2, 0])
+
+        # The external merge sort and the bounded top-N must match the in-memory order.
+        path, output = os.path.join(self.test_dir, 'unsorted.csv'), os.path.join(self.test_dir, 'sorted.csv')
+        data.to_csv(path, index=False)
+        stats = sort_file(path, output, ['Country', 'Amount'], [True, False], chunksize=2, memory_limit=0)
+        self.assertEqual((stats['strategy'], stats['runs']), ('external', 3))
+        self.assertEqual(pd.read_csv(output)['Id'].tolist(), [2, 0, 1, 4, 3])
+        sort_file(path, output, ['Amount'], [True], n=3, chunksize=2, memory_limit=0)
+        self.assertEqual(pd.read_csv(output)['Id'].tolist(), [3, 1, 4])
+
+        # Values are written back as text on every path, with the same bytes whichever strategy runs.
+        codes = pd.DataFrame({'Code': ['007', '010', '', '002', '001'], 'Amount': ['5', '', '3', '9', '1']})
+        codes.to_csv(path, index=False)
+        outputs = []
+        for memory_limit in (1024 * 1024, 0):
+            sort_file(path, output, ['Amount'], [False], chunksize=2, memory_limit=memory_limit)
+            with open(output, 'rb') as file:
+                outputs.append(file.read())
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(outputs[0], b'Code,Amount\n002,9\n007,5\n,3\n001,1\n010,\n')
+
+        parquet = os.path.join(self.test_dir, 'unsorted.parquet')
+        data.to_parquet(parquet, index=False)
+        result = CliRunner().invoke(transform_cli, ['sort', parquet, '--by', 'Amount:desc', '--output', output])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(pd.read_csv(output)['Id'].tolist(), [2, 0, 1, 4, 3])
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,18 @@
 import unittest
+import base64
+import os
+import tempfile
+import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
 from io import BytesIO
+from src.visualiser import visualiser
 from src.visualiser.visualiser import DataVisualizer
+from src.visualiser.binning import compute_histogram, histogram_file
+from src.visualiser.categories import count_categories_file, mean_by_category_file
+from src.visualiser.chart_data import ChartData
+from src.visualiser.facets import facet_chart_data
+from src.visualiser.interactive import interactive_figure, min_max_points, typed_array
 
 class TestDataVisualizer(unittest.TestCase):
     
@@ -61,6 +71,12 @@ class TestDataVisualizer(unittest.TestCase):
         result = buffer.read()
         self.assertGreater(len(result), 0, "The line chart output should not be empty.")
 
+        times = pd.date_range('2024-01-01', periods=7200, freq='s')
+        series = DataVisualizer(pd.DataFrame({'Time': times.astype(str), 'Value': range(7200)}))
+        chart = series.line_chart_data('Time', 'Value', resample='1H', agg='max')
+        self.assertEqual(chart.data['y'].tolist(), [3599, 7199])
+        self.assertEqual(chart.meta['resample'], '1H')
+
     def test_histogram(self):
         """Test histogram generation."""
         buffer = BytesIO()
@@ -69,6 +85,189 @@ class TestDataVisualizer(unittest.TestCase):
         result = buffer.read()
         self.assertGreater(len(result), 0, "The histogram output should not be empty.")
 
+    def test_binned_histogram(self):
+        """Test NumPy binning in memory and streamed over a CSV file, and the counts export."""
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame({'Amount': rng.normal(100, 15, 5000), 'Region': rng.choice(['N', 'S'], 5000)})
+        data.loc[::100, 'Amount'] = np.nan
+
+        binned = compute_histogram(data['Amount'], bins=20)
+        expected_counts, expected_edges = np.histogram(data['Amount'].dropna(), bins=20)
+        np.testing.assert_array_equal(binned.counts, expected_counts)
+        np.testing.assert_allclose(binned.edges, expected_edges)
+
+        with tempfile.TemporaryDirectory() as test_dir:
+            path = os.path.join(test_dir, 'amounts.csv')
+            data.to_csv(path, index=False)
+            streamed = histogram_file(path, 'Amount', bins=20, chunksize=700)
+            np.testing.assert_array_equal(streamed.counts, expected_counts)
+
+            north = histogram_file(path, 'Amount', bins=5, value_range=(50, 150), chunksize=700, where="Region == 'N'")
+            in_memory = compute_histogram(data.loc[data['Region'] == 'N', 'Amount'], bins=5, value_range=(50, 150))
+            np.testing.assert_array_equal(north.counts, in_memory.counts)
+            self.assertEqual(north.outside, in_memory.outside)
+
+            quantiles = histogram_file(path, 'Amount', bins=4, binning='quantile', chunksize=700)
+            self.assertEqual(quantiles.counts.sum(), data['Amount'].notna().sum())
+            self.assertLess(quantiles.counts.max() - quantiles.counts.min(), 200)
+
+            counts_path = os.path.join(test_dir, 'counts.csv')
+            buffer = BytesIO()
+            DataVisualizer(data).histogram(column='Amount', bins=20, output_path=buffer, counts_output=counts_path)
+            self.assertGreater(len(buffer.getvalue()), 0)
+            exported = pd.read_csv(counts_path)
+            self.assertEqual(list(exported.columns), ['bin_start', 'bin_end', 'count'])
+            self.assertEqual(exported['count'].tolist(), expected_counts.tolist())
+
+    def test_chart_data_round_trip(self):
+        """Test computing chart data once, saving it and rendering it separately."""
+        data = pd.DataFrame({'Category': ['A', 'B', 'A', 'C', 'A', 'B'], 'Value': [1, 2, 3, 4, 5, 6]})
+        visualizer = DataVisualizer(data)
+
+        bars = visualizer.bar_chart_data('Category')
+        self.assertEqual(bars.data['label'].tolist(), ['A', 'B', 'C'])
+        self.assertEqual(bars.data['value'].tolist(), [3, 2, 1])
+        means = visualizer.bar_chart_data('Category', y_column='Value', orientation='horizontal')
+        self.assertEqual(means.data['value'].tolist(), [3.0, 4.0, 4.0])
+        self.assertEqual(visualizer.line_chart_data('Category', 'Value').data['y'].tolist(), [3.0, 4.0, 4.0])
+
+        restored = ChartData.from_json(means.to_json())
+        self.assertEqual(restored.meta, means.meta)
+        pd.testing.assert_frame_equal(restored.data, means.data)
+
+        with tempfile.TemporaryDirectory() as test_dir:
+            histogram = visualizer.histogram_data('Value', bins=3)
+            for name in ('bins.arrow', 'bins.parquet', 'bins.json'):
+                path = os.path.join(test_dir, name)
+                histogram.write(path)
+                restored = ChartData.read(path)
+                self.assertEqual(restored.kind, 'histogram')
+                np.testing.assert_allclose(restored.edges(), histogram.edges())
+                self.assertEqual(restored.data['count'].tolist(), [2, 2, 2])
+
+        for chart in (bars, restored, visualizer.scatter_data('Value', 'Value'), visualizer.wordcloud_data('Category')):
+            buffer = BytesIO()
+            DataVisualizer(None).render(chart, title='Rendered', output_path=buffer)
+            self.assertGreater(len(buffer.getvalue()), 0)
+
+    def test_in_memory_rendering_reuses_one_figure(self):
+        """Test rendering to PNG/SVG bytes on a shared figure without leaking pyplot figures."""
+        open_figures = plt.get_fignums()
+        chart = self.visualizer.bar_chart_data('Category', y_column='Value')
+
+        png = self.visualizer.render_image(chart, title='Means')
+        figure = visualiser._shared_figure()
+        svg = self.visualizer.render_image(self.visualizer.histogram_data('Value', bins=3), image_format='svg')
+        self.assertTrue(png.startswith(b'\x89PNG'))
+        self.assertIn(b'<svg', svg)
+        self.assertIs(visualiser._shared_figure(), figure)
+
+        with self.assertRaises(KeyError):
+            self.visualizer.render(ChartData('bar', pd.DataFrame({'wrong': [1]})), output_path=BytesIO())
+        self.assertEqual(len(figure.axes), 0)
+        self.assertEqual(plt.get_fignums(), open_figures)
+
+    def test_top_k_bar_chart(self):
+        """Test top-k bars with an "Other" bucket, in memory and streamed with the heavy-hitter sketch."""
+        rng = np.random.default_rng(1)
+        users = np.concatenate([np.repeat(['u1', 'u2', 'u3'], [500, 300, 200]), [f'rare{i}' for i in range(3000)]])
+        data = pd.DataFrame({'User': rng.permutation(users)})
+        data['Spend'] = np.where(data['User'] == 'u1', 10.0, 1.0)
+
+        bars = DataVisualizer(data).bar_chart_data('User', percentage=True, top_k=2)
+        self.assertEqual(bars.data['label'].tolist(), ['u1', 'u2', 'Other'])
+        self.assertAlmostEqual(bars.data['value'].sum(), 100.0)
+        self.assertAlmostEqual(bars.data['value'][0], 500 * 100 / 4000)
+        self.assertEqual(bars.meta['other'], 3001)
+
+        means = DataVisualizer(data).bar_chart_data('User', y_column='Spend', top_k=1)
+        self.assertEqual(means.data['label'].tolist(), ['u1', 'Other'])
+        self.assertEqual(means.data['value'].tolist(), [10.0, 1.0])
+
+        with tempfile.TemporaryDirectory() as test_dir:
+            path = os.path.join(test_dir, 'users.csv')
+            data.to_csv(path, index=False)
+            counts, folded, total = count_categories_file(path, 'User', top_k=2, chunksize=500, capacity=50)
+            self.assertEqual(counts.to_dict(), {'u1': 500, 'u2': 300, 'Other': 3200})
+            self.assertEqual(total, 4000)
+            streamed_means, _ = mean_by_category_file(path, 'User', 'Spend', top_k=1, chunksize=500)
+            self.assertEqual(streamed_means.tolist(), [10.0, 1.0])
+
+        # Percentages are of all rows, so rows with a missing category count in the denominator.
+        sparse = pd.DataFrame({'User': ['u1', 'u1', 'u2', None], 'Team': ['a', 'a', 'a', 'a']})
+        self.assertEqual(DataVisualizer(sparse).bar_chart_data('User', percentage=True).data['value'].tolist(), [50.0, 25.0])
+        facet = DataVisualizer(sparse).facet_data('bar', 'Team', 'User', percentage=True)['a']
+        self.assertEqual(facet.data['value'].tolist(), [50.0, 25.0])
+        with tempfile.TemporaryDirectory() as test_dir:
+            path = os.path.join(test_dir, 'sparse.csv')
+            sparse.to_csv(path, index=False)
+            for top_k in (None, 1):
+                counts, _, rows = count_categories_file(path, 'User', top_k=top_k, chunksize=2)
+                self.assertEqual(rows, 4)
+                self.assertEqual(int(counts.sum()), 3)
+
+    def test_interactive_webgl_charts(self):
+        """Test plotly output: typed arrays, WebGL traces and server-side downsampling."""
+        encoded = typed_array(np.array([1.5, 2.5]))
+        self.assertEqual(encoded['dtype'], 'f8')
+        np.testing.assert_array_equal(np.frombuffer(base64.b64decode(encoded['bdata']), dtype='<f8'), [1.5, 2.5])
+        self.assertEqual(typed_array(np.array([1, 2], dtype=np.int64))['dtype'], 'i4')
+        self.assertEqual(typed_array(np.array(['a', 'b'])), ['a', 'b'])
+
+        y = np.zeros(10000)
+        y[1234], y[8765] = 50, -50
+        kept = min_max_points(y, 100)
+        self.assertLessEqual(len(kept), 100)
+        self.assertIn(1234, kept)
+        self.assertIn(8765, kept)
+
+        rng = np.random.default_rng(2)
+        points = DataVisualizer(pd.DataFrame({'x': rng.random(5000), 'y': rng.random(5000)}))
+        figure = interactive_figure(points.scatter_data('x', 'y'), max_points=1000)
+        trace = figure['data'][0]
+        self.assertEqual(trace['type'], 'scattergl')
+        self.assertEqual(len(base64.b64decode(trace['x']['bdata'])), 1000 * 8)
+
+        buffer = BytesIO()
+        points.scatter_plot('x', 'y', output_path=buffer, engine='plotly')
+        html = buffer.getvalue()
+        self.assertIn(b'scattergl', html)
+        self.assertIn(b'bdata', html)
+        self.assertIn(b'<html>', html)
+
+    def test_faceted_charts(self):
+        """Test that each facet matches the chart of its own slice, and the grid and file layouts."""
+        rng = np.random.default_rng(3)
+        data = pd.DataFrame({'Region': rng.choice(['North', 'South', 'East'], 600),
+                             'Category': rng.choice(list('ABCDEFG'), 600),
+                             'Value': rng.normal(size=600).round(2),
+                             'Day': rng.integers(0, 10, 600)})
+        visualizer = DataVisualizer(data)
+
+        histograms = facet_chart_data(data, 'histogram', 'Region', 'Value', bins=8)
+        self.assertEqual(list(histograms), ['East', 'North', 'South'])
+        edges = visualizer.histogram_data('Value', bins=8).edges()
+        for region, chart in histograms.items():
+            expected, _ = np.histogram(data.loc[data['Region'] == region, 'Value'], bins=edges)
+            np.testing.assert_array_equal(chart.data['count'], expected)
+            self.assertEqual(chart.meta['facet'], {'column': 'Region', 'value': region})
+
+        bars = facet_chart_data(data, 'bar', 'Region', 'Category', top_k=3)
+        lines = facet_chart_data(data, 'line', 'Region', 'Day', y_column='Value')
+        for region in bars:
+            single = DataVisualizer(data[data['Region'] == region])
+            pd.testing.assert_frame_equal(bars[region].data, single.bar_chart_data('Category', top_k=3).data)
+            pd.testing.assert_frame_equal(lines[region].data, single.line_chart_data('Day', 'Value').data)
+
+        with tempfile.TemporaryDirectory() as directory:
+            grid = os.path.join(directory, 'grid.png')
+            self.assertEqual(visualizer.facet_chart('scatter', 'Region', 'Day', 'Value', output_path=grid), [grid])
+            self.assertGreater(os.path.getsize(grid), 0)
+            paths = visualizer.facet_chart('histogram', 'Region', 'Value', output_path=os.path.join(directory, 'value.png'),
+                                           layout='files', max_workers=2)
+            self.assertEqual([os.path.basename(path) for path in paths], ['value_East.png', 'value_North.png', 'value_South.png'])
+            self.assertTrue(all(os.path.getsize(path) > 0 for path in paths))
+
     def test_scatter_plot(self):
         """Test scatter plot generation."""
         buffer = BytesIO()
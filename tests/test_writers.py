@@ -0,0 +1,106 @@
+import unittest
+import gzip
+import os
+import shutil
+import tempfile
+import pandas as pd
+from src.reporter.reporter import generate_txt_report, report_format, summary_tables, write_report
+from src.utils.exceptions import UnsupportedFormatError
+from src.utils.writers import compression_for, open_output, write_csv
+from src.visualiser.chart_data import ChartData
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+class TestWriters(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.df = pd.DataFrame({
+            'Category': ['A', 'B, C', 'say "hi"', 'D'],
+            'Values': [10.5, 25.0, None, 17.25],
+            'Count': [1, 2, 3, 4],
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def path(self, name):
+        return os.path.join(self.test_dir, name)
+
+    def test_pandas_engine_matches_to_csv(self):
+        write_csv(self.df, self.path('out.csv'), engine='pandas')
+        with open(self.path('out.csv')) as file:
+            self.assertEqual(file.read(), self.df.to_csv(index=False))
+        self.assertFalse(os.path.exists(self.path('out.csv.tmp')))
+
+    def test_gzip_by_extension(self):
+        self.assertEqual(compression_for('data.csv.gz'), 'gzip')
+        self.assertIsNone(compression_for('data.csv'))
+        write_csv(self.df, self.path('out.csv.gz'))
+        with gzip.open(self.path('out.csv.gz'), 'rt', newline='') as file:
+            self.assertEqual(file.read(), self.df.to_csv(index=False))
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_pyarrow_engine_and_zstd(self):
+        write_csv(self.df, self.path('out.csv.zst'), engine='pyarrow')
+        with pa.input_stream(self.path('out.csv.zst'), compression='zstd') as stream:
+            pd.testing.assert_frame_equal(pd.read_csv(stream), self.df)
+
+        # Columns Arrow cannot type fall back to the pandas engine.
+        mixed = pd.DataFrame({'Mixed': [1, 'a', 2.5]})
+        write_csv(mixed, self.path('mixed.csv'), engine='pyarrow')
+        with open(self.path('mixed.csv')) as file:
+            self.assertEqual(file.read(), mixed.to_csv(index=False))
+
+    def test_unsupported_engine(self):
+        with self.assertRaises(UnsupportedFormatError):
+            write_csv(self.df, self.path('out.csv'), engine='polars')
+
+    def test_failed_write_keeps_previous_file(self):
+        write_csv(self.df, self.path('out.csv'))
+        with self.assertRaises(ValueError):
+            with open_output(self.path('out.csv')) as file:
+                file.write('partial,')
+                raise ValueError('interrupted')
+        pd.testing.assert_frame_equal(pd.read_csv(self.path('out.csv')), self.df)
+        self.assertEqual(os.listdir(self.test_dir), ['out.csv'])
+
+    def test_failed_compressed_write_cleans_up(self):
+        for name in ('out.csv.gz', 'out.csv.zst') if pa is not None else ('out.csv.gz',):
+            with self.assertRaises(ValueError):
+                with open_output(self.path(name)) as file:
+                    file.write('partial,' * 1000)
+                    raise ValueError('interrupted')
+        self.assertEqual(os.listdir(self.test_dir), [])
+
+    def test_output_permissions_follow_umask(self):
+        write_csv(self.df, self.path('out.csv'))
+        with open(self.path('plain.csv'), 'w'):
+            pass
+        self.assertEqual(os.stat(self.path('out.csv')).st_mode & 0o777, os.stat(self.path('plain.csv')).st_mode & 0o777)
+
+    def test_compressed_json_outputs(self):
+        write_report(summary_tables(self.df), self.path('summary.json.gz'))
+        with gzip.open(self.path('summary.json.gz'), 'rt') as file:
+            self.assertIn('"Outliers Summary"', file.read())
+        with self.assertRaises(UnsupportedFormatError):
+            report_format('summary.pdf.gz')
+
+        chart = ChartData('bar', pd.DataFrame({'label': ['A', 'B'], 'value': [2, 1]}), {'x': 'Category'})
+        chart.write(self.path('chart.json.gz'))
+        pd.testing.assert_frame_equal(ChartData.read(self.path('chart.json.gz')).data, chart.data)
+        with self.assertRaises(UnsupportedFormatError):
+            chart.write(self.path('chart.parquet.gz'))
+
+    def test_compressed_txt_report(self):
+        generate_txt_report(summary_tables(self.df), txt_file=self.path('summary.txt.gz'))
+        with gzip.open(self.path('summary.txt.gz'), 'rt') as file:
+            content = file.read()
+        self.assertTrue(content.startswith('Section: Descriptive Statistics\n'))
+        self.assertIn('Section: Outliers Summary\n', content)
+        self.assertTrue(content.endswith('\n\n'))
+
+if __name__ == '__main__':
+    unittest.main()